@@ -0,0 +1,138 @@
+"""Measure how much the docargs plugin adds to a flake8 run.
+
+This times flake8 on a generated code base (see `generate.py`), checking
+files serially and in parallel, and linting a single file through stdin as
+editors do, both with the docargs plugin and with it filtered out of
+flake8's plugins.
+
+Run with ``python benchmarks/bench_flake8.py``.
+"""
+
+import argparse
+import subprocess
+import sys
+import tempfile
+from typing import List, Optional
+
+from generate import generate_codebase
+from run_benchmarks import MODULE_OPTIONS, best_time
+
+# runs flake8 without the plugins of the docargs package:
+_WITHOUT_DOCARGS = """
+import sys
+from flake8.main.cli import main
+from flake8.plugins import finder
+
+find_plugins = finder.find_plugins
+finder.find_plugins = lambda *args: [
+    plugin for plugin in find_plugins(*args) if plugin.package != "docargs"
+]
+sys.exit(main(sys.argv[1:]))
+"""
+
+
+def flake8_command(arguments: List[str], plugin: bool) -> List[str]:
+    """Build the command to run flake8 with.
+
+    Parameters
+    ----------
+    arguments : List[str]
+        The arguments to flake8.
+    plugin : bool
+        Whether to run the docargs plugin.
+
+    Returns
+    -------
+    List[str]
+    """
+
+    if plugin:
+        return [sys.executable, "-m", "flake8"] + arguments
+    return [sys.executable, "-c", _WITHOUT_DOCARGS] + arguments
+
+
+def time_flake8(
+    arguments: List[str],
+    plugin: bool,
+    repeat: int,
+    stdin: Optional[str] = None,
+) -> float:
+    """Time the fastest of several flake8 runs.
+
+    Parameters
+    ----------
+    arguments : List[str]
+        The arguments to flake8.
+    plugin : bool
+        Whether to run the docargs plugin.
+    repeat : int
+        How many times to run flake8.
+    stdin : str, optional
+        Source code to lint through stdin (the default is None, which lints
+        the files in ``arguments``).
+
+    Returns
+    -------
+    float
+        The fastest run, in seconds.
+    """
+
+    command = flake8_command(arguments, plugin)
+    return best_time(
+        lambda: subprocess.run(
+            command,
+            input=stdin,
+            stdout=subprocess.DEVNULL,
+            universal_newlines=True,
+        ),
+        repeat,
+    )
+
+
+def main(n_files: int = 100, repeat: int = 3):
+    """Print the time of flake8 runs with and without the plugin.
+
+    Parameters
+    ----------
+    n_files : int, optional
+        The number of modules in the code base (the default is 100).
+    repeat : int, optional
+        How many times to run each measurement (the default is 3).
+    """
+
+    with tempfile.TemporaryDirectory() as root:
+        paths = generate_codebase(root, n_files, **MODULE_OPTIONS)
+        with open(paths[0]) as f:
+            source = f.read()
+
+        runs = [
+            ("files, --jobs 1", ["--jobs", "1", root], None),
+            ("files, --jobs auto", ["--jobs", "auto", root], None),
+            ("one file, stdin", ["-"], source),
+        ]
+        print(
+            "{:<24} {:>12} {:>12} {:>10}".format(
+                "run", "without", "with", "overhead"
+            )
+        )
+        for name, arguments, stdin in runs:
+            without, with_plugin = (
+                time_flake8(arguments, plugin, repeat, stdin)
+                for plugin in (False, True)
+            )
+            print(
+                "{:<24} {:>10.3f} s {:>10.3f} s {:>9.0f}%".format(
+                    name,
+                    without,
+                    with_plugin,
+                    100 * (with_plugin - without) / without,
+                )
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    arguments = parser.parse_args()
+    main(arguments.files, arguments.repeat)
@@ -0,0 +1,108 @@
+"""Compare the cost per docstring of scanning and fully parsing it.
+
+Run with ``python benchmarks/bench_get_doc_params.py``.
+"""
+
+import ast
+import timeit
+
+from docargs.check import docstring_params, get_doc_params
+
+DOCSTRINGS = {
+    "numpy": """Summary line.
+
+    Extended summary, which can go on
+    for a few lines.
+
+    Parameters
+    ----------
+    a : int
+        The first parameter.
+    b : str, optional
+        The second parameter, with a description that is long enough to
+        need two lines.
+    c : List[int]
+        The third parameter.
+
+    Returns
+    -------
+    bool
+        Whether it worked.
+
+    Examples
+    --------
+    >>> f(1, "b", [2])
+    True
+    """,
+    "google": """Summary line.
+
+    Extended summary, which can go on
+    for a few lines.
+
+    Args:
+        a (int): The first parameter.
+        b (str, optional): The second parameter, with a description that is
+            long enough to need two lines.
+        c (List[int]): The third parameter.
+
+    Returns:
+        bool: Whether it worked.
+    """,
+    "rest": """Summary line.
+
+    Extended summary, which can go on
+    for a few lines.
+
+    :param int a: The first parameter.
+    :param b: The second parameter, with a description that is long enough
+        to need two lines.
+    :type b: str, optional
+    :param c: The third parameter.
+    :type c: List[int]
+    :returns: Whether it worked.
+    :rtype: bool
+    """,
+}
+
+
+def main(number: int = 2000):
+    """Print the time per docstring of both ways to get parameters.
+
+    The cache of parsed docstrings is cleared before each call, so that this
+    measures parsing rather than cache lookups.
+
+    Parameters
+    ----------
+    number : int, optional
+        How many times to get the parameters per measurement (the default is
+        2000).
+    """
+    print("{:<8} {:>14} {:>14} {:>8}".format("style", "scan", "strict", ""))
+    for style, docstring in DOCSTRINGS.items():
+        node = ast.parse(
+            'def f(a, b, c):\n    """{}"""\n'.format(docstring)
+        ).body[0]
+        assert get_doc_params(node) == get_doc_params(node, strict_parser=True)
+        fast, strict = (
+            min(
+                timeit.repeat(
+                    lambda: (
+                        docstring_params.cache_clear(),
+                        get_doc_params(node, strict_parser=strict_parser),
+                    ),
+                    number=number,
+                    repeat=5,
+                )
+            )
+            / number
+            for strict_parser in (False, True)
+        )
+        print(
+            "{:<8} {:>11.1f} us {:>11.1f} us {:>7.1f}x".format(
+                style, fast * 1e6, strict * 1e6, strict / fast
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Measure how long it takes to import docargs' entry points.
+
+This runs ``python -X importtime -c "import <module>"`` in fresh processes,
+and reports the best cumulative import time of each entry point, and the
+slowest modules it imports directly.
+
+Run with ``python benchmarks/bench_import_time.py``.
+"""
+
+import subprocess
+import sys
+from typing import Dict, Tuple
+
+ENTRY_POINTS = ("docargs.flake8", "docargs.check", "docargs.cli")
+
+
+def import_times(module: str) -> Tuple[int, Dict[str, int]]:
+    """Import a module in a fresh interpreter and time its imports.
+
+    Parameters
+    ----------
+    module : str
+        The module to import.
+
+    Returns
+    -------
+    int
+        The cumulative import time of the module, in microseconds.
+    Dict[str, int]
+        The cumulative import time of each module it imports directly.
+    """
+
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import " + module],
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    ).stderr
+    lines = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split(":", 1)[1].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        lines.append((depth, name.strip(), int(cumulative)))
+
+    # imports are reported after the modules they import:
+    end = max(i for i, (_, name, _) in enumerate(lines) if name == module)
+    children = {}
+    for depth, name, cumulative in reversed(lines[:end]):
+        if depth == 0:
+            break
+        if depth == 1:
+            children[name] = cumulative
+    return lines[end][2], children
+
+
+def main(repeat: int = 5, n_slowest: int = 5):
+    """Print the import time of each entry point.
+
+    Parameters
+    ----------
+    repeat : int, optional
+        How many times to import each entry point (the default is 5).
+    n_slowest : int, optional
+        How many of the slowest direct imports to list (the default is 5).
+    """
+    for module in ENTRY_POINTS:
+        runs = [import_times(module) for _ in range(repeat)]
+        best, children = min(runs, key=lambda run: run[0])
+        print("{:<16} {:>8.1f} ms".format(module, best / 1000))
+
+        slowest = sorted(children.items(), key=lambda item: -item[1])
+        for name, time in slowest[:n_slowest]:
+            print("    {:<24} {:>8.1f} ms".format(name, time / 1000))
+
+
+if __name__ == "__main__":
+    main()
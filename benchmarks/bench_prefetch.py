@@ -0,0 +1,98 @@
+"""Measure how reading files ahead overlaps slow reads with checking.
+
+Network file systems such as NFS add latency to every read. This stands in
+for one by wrapping docargs' file reads in a sleep, which like real I/O
+releases the GIL, and times checking a generated code base (see
+`generate.py`) in one process with several prefetch depths.
+
+Run with ``python benchmarks/bench_prefetch.py``.
+"""
+
+import argparse
+import tempfile
+import time
+from typing import Sequence
+
+import docargs.run
+from docargs.check import docstring_params
+from docargs.run import check_files
+from generate import generate_codebase
+from run_benchmarks import best_time
+
+
+def slow_reads(latency: float):
+    """Make every file read by docargs wait first.
+
+    Parameters
+    ----------
+    latency : float
+        How many seconds each read waits.
+    """
+
+    read_source = docargs.run.read_source
+
+    def slow_read_source(path: str) -> str:
+        time.sleep(latency)
+        return read_source(path)
+
+    docargs.run.read_source = slow_read_source
+
+
+def main(
+    n_files: int = 200,
+    latency: float = 0.005,
+    depths: Sequence[int] = (0, 1, 2, 4, 8, 16),
+    repeat: int = 3,
+):
+    """Print the time to check a code base with each prefetch depth.
+
+    Parameters
+    ----------
+    n_files : int, optional
+        The number of modules in the code base (the default is 200).
+    latency : float, optional
+        How many seconds each read waits (the default is 0.005).
+    depths : Sequence[int], optional
+        The prefetch depths to time.
+    repeat : int, optional
+        How many times to run each measurement (the default is 3).
+    """
+
+    with tempfile.TemporaryDirectory() as root:
+        paths = generate_codebase(
+            root, n_files, n_functions=20, n_classes=2, n_methods=5
+        )
+        slow_reads(latency)
+
+        def run(depth: int):
+            docstring_params.cache_clear()
+            for _ in check_files(paths, prefetch=depth):
+                pass
+
+        print(
+            "{} files, {:.1f} ms per read, {:.2f} s of reads in total".format(
+                n_files, latency * 1000, n_files * latency
+            )
+        )
+        baseline = None
+        for depth in depths:
+            seconds = best_time(lambda: run(depth), repeat)
+            baseline = baseline or seconds
+            print(
+                "prefetch {:>3} {:>9.3f} s {:>7.2f}x".format(
+                    depth, seconds, baseline / seconds
+                )
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=5.0,
+        help="The latency of each read, in milliseconds.",
+    )
+    arguments = parser.parse_args()
+    main(arguments.files, arguments.latency / 1000)
@@ -0,0 +1,96 @@
+"""Measure how much parsing only the public definitions saves.
+
+Real code bases mix modules full of documented functions with modules that
+docargs has little to check in: generated data tables, and modules of
+private helpers. This times checking each kind of module, with and without
+``--prescan``.
+
+Run with ``python benchmarks/bench_prescan.py``.
+"""
+
+import argparse
+from typing import Callable, Dict
+
+from docargs.check import docstring_params
+from docargs.run import check_source
+from generate import generate_module
+from run_benchmarks import best_time
+
+
+def data_module(n_rows: int = 20000) -> str:
+    """Generate a module with one large data table and no definitions.
+
+    Parameters
+    ----------
+    n_rows : int, optional
+        The number of rows in the table (the default is 20000).
+
+    Returns
+    -------
+    str
+    """
+
+    rows = "".join(
+        '    ({0}, "row {0}", {1!r}),\n'.format(i, i / 7)
+        for i in range(n_rows)
+    )
+    return '"""Generated data."""\n\nTABLE = [\n{}]\n'.format(rows)
+
+
+def private_module(n_functions: int = 500) -> str:
+    """Generate a module of undocumented private helpers.
+
+    Parameters
+    ----------
+    n_functions : int, optional
+        The number of functions (the default is 500).
+
+    Returns
+    -------
+    str
+    """
+
+    function = (
+        "def _helper_{0}(a, b):\n    c = a * {0}\n    return [c, b]\n\n\n"
+    )
+    return "".join(function.format(i) for i in range(n_functions))
+
+
+def main(repeat: int = 5):
+    """Print the time to check each kind of module with and without prescan.
+
+    Parameters
+    ----------
+    repeat : int, optional
+        How many times to run each measurement (the default is 5).
+    """
+
+    modules: Dict[str, str] = {
+        "documented": generate_module(style="mixed"),
+        "data": data_module(),
+        "private": private_module(),
+    }
+    print("{:<12} {:>10} {:>10} {:>8}".format("module", "full", "prescan", ""))
+    for name, source in modules.items():
+
+        def run(prescan: bool) -> Callable[[], None]:
+            def check():
+                docstring_params.cache_clear()
+                check_source(name, source, prescan=prescan)
+
+            return check
+
+        full = best_time(run(False), repeat)
+        prescanned = best_time(run(True), repeat)
+        print(
+            "{:<12} {:>8.2f}ms {:>8.2f}ms {:>7.2f}x".format(
+                name, full * 1000, prescanned * 1000, full / prescanned
+            )
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    arguments = parser.parse_args()
+    main(arguments.repeat)
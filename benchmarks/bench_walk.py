@@ -0,0 +1,190 @@
+"""Compare docargs' iterative traversal with the recursive one it replaced.
+
+`check` used to call itself through `functools.singledispatch` for every
+node in a module or class, including nodes that are not definitions. It now
+walks definitions with an explicit stack and a table of checks by node type.
+This times both on a wide module, with many functions and classes, and on a
+deep one, with classes nested as far as python allows: once checking each
+definition, and once with checks that do nothing, to time the traversal
+alone.
+
+Run with ``python benchmarks/bench_walk.py``.
+"""
+
+import argparse
+import ast
+from functools import singledispatch
+from typing import Callable, Dict, List
+
+from docargs.check import (
+    VISITORS,
+    check_function,
+    check_init,
+    find_init,
+    walk,
+)
+from docargs.identify import is_private
+from generate import generate_module
+from run_benchmarks import best_time
+
+
+def recursive_checker(check_function: Callable, check_init: Callable):
+    """Make a `check` like the one before the iterative traversal.
+
+    Parameters
+    ----------
+    check_function : Callable
+        Checks a function.
+    check_init : Callable
+        Checks the ``__init__`` method of a class.
+
+    Returns
+    -------
+    Callable
+        A function that checks a module, class or function and its contents
+        recursively, through `functools.singledispatch`.
+    """
+
+    @singledispatch
+    def check(node, *options):
+        return
+        yield
+
+    check.register(ast.FunctionDef)(check_function)
+
+    @check.register(ast.ClassDef)
+    @check.register(ast.Module)
+    def check_body(node, *options):
+        if isinstance(node, ast.ClassDef) and find_init(node) is not None:
+            yield from check_init(node, *options)
+        for child in ast.iter_child_nodes(node):
+            if not is_private(child):
+                yield from check(child, *options)
+
+    return check
+
+
+def visit_nothing(node: ast.AST, *options):
+    """Stand in for the checks of a node, to only time the traversal.
+
+    Parameters
+    ----------
+    node : ast.AST
+        A function or class.
+    *options
+        The options of `check`.
+
+    Yields
+    ------
+    ast.AST
+        The node, if it is a function.
+    List[str]
+        No parameters.
+    List[str]
+        No parameters.
+    """
+
+    if not isinstance(node, ast.ClassDef):
+        yield node, [], []
+
+
+def deep_module(depth: int = 90, n_methods: int = 5) -> str:
+    """Generate a module of classes nested in each other.
+
+    Parameters
+    ----------
+    depth : int, optional
+        How many classes deep to nest (the default is 90, close to the
+        parser's limit of 100 levels of indentation).
+    n_methods : int, optional
+        The number of methods in each class (the default is 5).
+
+    Returns
+    -------
+    str
+    """
+
+    lines = []
+    for level in range(depth):
+        indent = "    " * level
+        lines.append("{}class Level{}:\n".format(indent, level))
+        lines.append('{}    """Level {}."""\n'.format(indent, level))
+        for i in range(n_methods):
+            lines.append(
+                "{0}    def method_{1}(self, a):\n"
+                '{0}        """Do {1}."""\n'.format(indent, i)
+            )
+    return "".join(lines)
+
+
+def main(repeat: int = 5):
+    """Print the time to traverse a wide and a deep module both ways.
+
+    Parameters
+    ----------
+    repeat : int, optional
+        How many times to run each measurement (the default is 5).
+    """
+
+    modules = {
+        "wide": ast.parse(
+            generate_module(n_functions=2000, n_classes=100, n_methods=20)
+        ),
+        "deep": ast.parse(deep_module()),
+    }
+    options = (True, None, False)
+    recursive_check = recursive_checker(check_function, check_init)
+    recursive_traverse = recursive_checker(visit_nothing, visit_nothing)
+    visitors = dict(VISITORS)
+    traverse_visitors = {
+        node_type: (visit_nothing, look_inside)
+        for node_type, (_, look_inside) in VISITORS.items()
+    }
+
+    def walk_with(table: Dict) -> Callable[[ast.Module], List]:
+        def run(module: ast.Module) -> List:
+            VISITORS.update(table)
+            try:
+                return list(walk(module, *options))
+            finally:
+                VISITORS.update(visitors)
+
+        return run
+
+    runs = [
+        ("check", lambda module: list(recursive_check(module, *options))),
+        ("check", walk_with(visitors)),
+        (
+            "traverse",
+            lambda module: list(recursive_traverse(module, *options)),
+        ),
+        ("traverse", walk_with(traverse_visitors)),
+    ]
+    print(
+        "{:<6} {:<9} {:>11} {:>11} {:>8}".format(
+            "module", "work", "recursive", "iterative", ""
+        )
+    )
+    for name, module in modules.items():
+        for (work, recursive), (_, iterative) in zip(runs[::2], runs[1::2]):
+            assert [result[0] for result in recursive(module)] == [
+                result[0] for result in iterative(module)
+            ]
+            recursive_time = best_time(lambda: recursive(module), repeat)
+            iterative_time = best_time(lambda: iterative(module), repeat)
+            print(
+                "{:<6} {:<9} {:>9.2f}ms {:>9.2f}ms {:>7.2f}x".format(
+                    name,
+                    work,
+                    recursive_time * 1000,
+                    iterative_time * 1000,
+                    recursive_time / iterative_time,
+                )
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    arguments = parser.parse_args()
+    main(arguments.repeat)
@@ -0,0 +1,181 @@
+"""Generate synthetic code bases to benchmark docargs on.
+
+Run with ``python benchmarks/generate.py OUTPUT_DIRECTORY`` to write one to
+disk, or import `generate_module` / `generate_codebase`.
+"""
+
+import argparse
+import os
+import random
+from typing import List
+
+STYLES = ("numpy", "google", "rest")
+
+
+def _docstring(params: List[str], style: str, indent: str) -> str:
+    lines = ["Do something useful.", ""]
+    lines += [
+        "This is an extended summary, which explains in a bit more detail",
+        "what the function does, and why you might want to use it.",
+        "",
+    ]
+    if style == "numpy":
+        lines += ["Parameters", "----------"]
+        for param in params:
+            lines += ["{} : int".format(param), "    The {}.".format(param)]
+        lines += ["", "Returns", "-------", "int", "    The result."]
+    elif style == "google":
+        lines += ["Args:"]
+        lines += ["    {} (int): The {}.".format(p, p) for p in params]
+        lines += ["", "Returns:", "    int: The result."]
+    else:
+        for param in params:
+            lines += [":param {}: The {}.".format(param, param)]
+            lines += [":type {}: int".format(param)]
+        lines += [":returns: The result.", ":rtype: int"]
+    body = "\n".join((indent + line).rstrip() for line in lines)
+    return '{0}"""{1}\n\n{0}"""\n'.format(indent, body.lstrip())
+
+
+def _function(
+    name: str, style: str, rng: random.Random, indent: str = ""
+) -> str:
+    params = ["param_{}".format(i) for i in range(rng.randint(0, 6))]
+    documented = list(params)
+    # leave some parameters undocumented, and document some extra ones:
+    if params and rng.random() < 0.1:
+        documented.pop()
+    if rng.random() < 0.05:
+        documented.append("extra")
+    signature = ", ".join((["self"] if indent else []) + params)
+    return "{}def {}({}):\n{}{}    return None\n\n{}".format(
+        indent,
+        name,
+        signature,
+        _docstring(documented, style, indent + "    "),
+        indent,
+        "" if indent else "\n",
+    )
+
+
+def generate_module(
+    n_functions: int = 100,
+    n_classes: int = 10,
+    n_methods: int = 10,
+    style: str = "numpy",
+    seed: int = 0,
+) -> str:
+    """Generate the source code of a module.
+
+    Parameters
+    ----------
+    n_functions : int, optional
+        The number of module-level functions (the default is 100).
+    n_classes : int, optional
+        The number of classes (the default is 10).
+    n_methods : int, optional
+        The number of methods per class, besides ``__init__`` (the default
+        is 10).
+    style : str, optional
+        The docstring style, one of "numpy", "google", "rest" or "mixed"
+        (the default is "numpy").
+    seed : int, optional
+        The random seed (the default is 0).
+
+    Returns
+    -------
+    str
+    """
+
+    rng = random.Random(seed)
+
+    def pick_style() -> str:
+        return rng.choice(STYLES) if style == "mixed" else style
+
+    parts = ['"""A generated module."""\n\n\n']
+    for i in range(n_functions):
+        parts.append(_function("function_{}".format(i), pick_style(), rng))
+    for i in range(n_classes):
+        class_style = pick_style()
+        parts.append(
+            'class Class{}:\n    """A generated class."""\n\n'.format(i)
+        )
+        parts.append(_function("__init__", class_style, rng, "    "))
+        for j in range(n_methods):
+            parts.append(
+                _function("method_{}".format(j), class_style, rng, "    ")
+            )
+        parts.append("\n")
+    return "".join(parts)
+
+
+def count_functions(n_functions: int, n_classes: int, n_methods: int) -> int:
+    """Count the functions and methods in a generated module.
+
+    Parameters
+    ----------
+    n_functions : int
+        The number of module-level functions.
+    n_classes : int
+        The number of classes.
+    n_methods : int
+        The number of methods per class, besides ``__init__``.
+
+    Returns
+    -------
+    int
+    """
+
+    return n_functions + n_classes * (n_methods + 1)
+
+
+def generate_codebase(
+    root: str,
+    n_files: int = 100,
+    files_per_package: int = 20,
+    style: str = "mixed",
+    **module_options
+) -> List[str]:
+    """Write a generated code base to disk.
+
+    Parameters
+    ----------
+    root : str
+        The directory to write to.
+    n_files : int, optional
+        The number of modules (the default is 100).
+    files_per_package : int, optional
+        How many modules to put in each package (the default is 20).
+    style : str, optional
+        The docstring style (the default is "mixed").
+    **module_options
+        Passed on to `generate_module`.
+
+    Returns
+    -------
+    List[str]
+        The paths of the modules.
+    """
+
+    paths = []
+    for i in range(n_files):
+        package = os.path.join(
+            root, "package_{}".format(i // files_per_package)
+        )
+        os.makedirs(package, exist_ok=True)
+        path = os.path.join(package, "module_{}.py".format(i))
+        with open(path, "w") as f:
+            f.write(generate_module(style=style, seed=i, **module_options))
+        paths.append(path)
+    return paths
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("root")
+    parser.add_argument("--files", type=int, default=100)
+    parser.add_argument(
+        "--style", choices=STYLES + ("mixed",), default="mixed"
+    )
+    arguments = parser.parse_args()
+    generate_codebase(arguments.root, arguments.files, style=arguments.style)
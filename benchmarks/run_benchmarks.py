@@ -0,0 +1,247 @@
+"""Measure how docargs scales on a generated code base.
+
+This times parsing, `get_doc_params`, `check` and the command line tool on a
+synthetic code base (see `generate.py`), reports throughput in files and
+functions per second, and records the results as JSON so that versions can
+be compared.
+
+Run with ``python benchmarks/run_benchmarks.py``, and compare against an
+earlier run with ``--compare benchmarks/results/<version>.json``.
+"""
+
+import argparse
+import ast
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+from docargs.check import check, docstring_params, get_doc_params
+from docargs.version import version
+from generate import STYLES, count_functions, generate_codebase
+
+MODULE_OPTIONS = dict(n_functions=100, n_classes=10, n_methods=10)
+
+
+def _read(path: str) -> str:
+    with open(path) as f:
+        return f.read()
+
+
+def best_time(function: Callable[[], object], repeat: int) -> float:
+    """Time a function, and return the fastest of several runs.
+
+    Parameters
+    ----------
+    function : Callable[[], object]
+        The function to time.
+    repeat : int
+        How many times to run it.
+
+    Returns
+    -------
+    float
+        The fastest run, in seconds.
+    """
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def definitions(trees: List[ast.Module]) -> List[ast.AST]:
+    """Find all functions and classes in some modules.
+
+    Parameters
+    ----------
+    trees : List[ast.Module]
+        The modules.
+
+    Returns
+    -------
+    List[ast.AST]
+    """
+
+    return [
+        node
+        for tree in trees
+        for node in ast.walk(tree)
+        if isinstance(node, (ast.FunctionDef, ast.ClassDef))
+    ]
+
+
+def run_benchmarks(root: str, n_files: int, repeat: int) -> Dict[str, Dict]:
+    """Run all benchmarks on a freshly generated code base.
+
+    Parameters
+    ----------
+    root : str
+        The directory to generate the code base in.
+    n_files : int
+        The number of files to generate.
+    repeat : int
+        How many times to run each benchmark.
+
+    Returns
+    -------
+    Dict[str, Dict]
+        For each benchmark, the time in seconds and the throughput.
+    """
+
+    n_functions = n_files * count_functions(**MODULE_OPTIONS)
+    results = {}
+
+    def record(name: str, seconds: float, files: int, functions: int):
+        results[name] = {
+            "seconds": seconds,
+            "files_per_second": files / seconds,
+            "functions_per_second": functions / seconds,
+        }
+        print(
+            "{:<32} {:>9.3f} s {:>10.0f} files/s {:>12.0f} functions/s".format(
+                name, seconds, files / seconds, functions / seconds
+            )
+        )
+
+    paths = generate_codebase(root, n_files, style="mixed", **MODULE_OPTIONS)
+    sources = [_read(path) for path in paths]
+
+    record(
+        "parse",
+        best_time(lambda: [ast.parse(source) for source in sources], repeat),
+        n_files,
+        n_functions,
+    )
+
+    def check_trees(trees: List[ast.Module]) -> list:
+        # start each repetition with an empty docstring cache, as a fresh
+        # run would, so that the repetitions are comparable
+        docstring_params.cache_clear()
+        return [list(check(tree)) for tree in trees]
+
+    trees = [ast.parse(source) for source in sources]
+    record(
+        "check",
+        best_time(lambda: check_trees(trees), repeat),
+        n_files,
+        n_functions,
+    )
+
+    # get_doc_params per docstring style, on a tenth of the files:
+    n_style_files = max(n_files // 10, 1)
+    for style in STYLES:
+        style_root = os.path.join(root, style)
+        style_trees = [
+            ast.parse(_read(path))
+            for path in generate_codebase(
+                style_root, n_style_files, style=style, **MODULE_OPTIONS
+            )
+        ]
+        nodes = definitions(style_trees)
+        for strict_parser in (False, True):
+            name = "get_doc_params[{}{}]".format(
+                style, ", strict" if strict_parser else ""
+            )
+            record(
+                name,
+                best_time(
+                    lambda: (
+                        docstring_params.cache_clear(),
+                        [
+                            get_doc_params(node, strict_parser=strict_parser)
+                            for node in nodes
+                        ],
+                    ),
+                    repeat,
+                ),
+                n_style_files,
+                len(nodes),
+            )
+
+    packages = sorted(
+        os.path.join(root, name)
+        for name in os.listdir(root)
+        if name.startswith("package_")
+    )
+    for jobs in ("1", "auto"):
+        command = [sys.executable, "-m", "docargs", "--no-cache"]
+        command += ["--jobs", jobs, "--format", "jsonl"] + packages
+        record(
+            "cli[jobs={}]".format(jobs),
+            best_time(
+                lambda: subprocess.run(command, stdout=subprocess.DEVNULL),
+                repeat,
+            ),
+            n_files,
+            n_functions,
+        )
+
+    return results
+
+
+def compare(results: Dict[str, Dict], baseline_path: str):
+    """Print how results compare to an earlier run.
+
+    Parameters
+    ----------
+    results : Dict[str, Dict]
+        The results of this run.
+    baseline_path : str
+        The JSON file of an earlier run.
+    """
+
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    print("\ncompared to docargs {}:".format(baseline["docargs_version"]))
+    for name, result in results.items():
+        if name in baseline["results"]:
+            ratio = baseline["results"][name]["seconds"] / result["seconds"]
+            print("{:<32} {:>6.2f}x faster".format(name, ratio))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--output",
+        default=os.path.join(
+            os.path.dirname(__file__), "results", version + ".json"
+        ),
+    )
+    parser.add_argument("--compare", metavar="BASELINE")
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        results = run_benchmarks(root, arguments.files, arguments.repeat)
+
+    record = {
+        "docargs_version": version,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "n_files": arguments.files,
+        "module": MODULE_OPTIONS,
+        "results": results,
+    }
+    os.makedirs(
+        os.path.dirname(os.path.abspath(arguments.output)), exist_ok=True
+    )
+    with open(arguments.output, "w") as f:
+        json.dump(record, f, indent=2)
+    print("\nwrote {}".format(arguments.output))
+
+    if arguments.compare is not None:
+        compare(results, arguments.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,22 @@
 """Find holes in your documentation."""
+
+import sys
+from typing import Any
+
+# the batch API is imported when first used, so that the flake8 plugin, which
+# is imported on every flake8 run, doesn't pay for it:
+__all__ = ["Result", "check_paths", "check_sources"]
+
+if sys.version_info < (3, 7):
+    # module __getattr__ (PEP 562) needs python 3.7
+    from .api import Result, check_paths, check_sources  # noqa: F401
+else:
+
+    def __getattr__(name: str) -> Any:
+        if name in __all__:
+            from . import api
+
+            return getattr(api, name)
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name)
+        )
@@ -0,0 +1,241 @@
+"""Check many files or sources from python, for build tools and services.
+
+Unlike `check`, which yields the syntax tree nodes it checked, these yield
+small records that don't keep any trees alive. Unlike the command line tool,
+they don't print anything or exit, so they can run in long-lived processes.
+"""
+
+from functools import partial
+from typing import Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+from .cache import ResultCache
+from .discover import DEFAULT_EXCLUDE, find_files
+from .run import (
+    DEFAULT_PREFETCH,
+    Finding,
+    check_files,
+    check_source,
+    map_batches,
+)
+from .symbols import build_index
+
+
+class Result:
+    """One function or class whose parameters don't match its docstring.
+
+    Parameters
+    ----------
+    path : str
+        The file, or name of the source, the definition is in.
+    qualname : str
+        The qualified name of the definition, such as ``"Class.method"``.
+    line : int
+        The line of the definition.
+    col : int
+        The column of the definition.
+    under : Tuple[str, ...]
+        Parameters in the signature but not in the docstring.
+    over : Tuple[str, ...]
+        Parameters in the docstring but not in the signature.
+    over_budget : str, optional
+        If the definition was not checked because it took longer than its
+        time budget, what did: ``"docstring"`` or ``"file"`` (the default is
+        "", for a definition that was checked).
+    """
+
+    __slots__ = (
+        "path",
+        "qualname",
+        "line",
+        "col",
+        "under",
+        "over",
+        "over_budget",
+    )
+
+    def __init__(
+        self,
+        path: str,
+        qualname: str,
+        line: int,
+        col: int,
+        under: Tuple[str, ...],
+        over: Tuple[str, ...],
+        over_budget: str = "",
+    ):
+        self.path = path
+        self.qualname = qualname
+        self.line = line
+        self.col = col
+        self.under = under
+        self.over = over
+        self.over_budget = over_budget
+
+    @classmethod
+    def from_finding(cls, finding: Finding) -> "Result":
+        """Make a result from a finding of `check_source`.
+
+        Parameters
+        ----------
+        finding : Finding
+            The finding.
+
+        Returns
+        -------
+        Result
+        """
+
+        return cls(
+            finding.file,
+            finding.qualname,
+            finding.lineno,
+            finding.col,
+            finding.under,
+            finding.over,
+            finding.over_budget,
+        )
+
+    def _fields(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Result):
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    def __hash__(self) -> int:
+        return hash(self._fields())
+
+    def __repr__(self) -> str:
+        return "Result({})".format(
+            ", ".join(
+                "{}={!r}".format(name, getattr(self, name))
+                for name in self.__slots__
+            )
+        )
+
+
+def check_paths(
+    paths: Iterable[str],
+    jobs: int = 1,
+    exclude: Iterable[str] = (),
+    use_gitignore: bool = True,
+    cache_dir: Optional[str] = None,
+    prefetch: int = DEFAULT_PREFETCH,
+    inherit_docstrings: bool = False,
+    **options
+) -> Iterator[Result]:
+    """Check python files and directories, yielding results as they come.
+
+    Parameters
+    ----------
+    paths : Iterable[str]
+        Files, and directories to search for python files.
+    jobs : int, optional
+        The number of worker processes. With 1 (the default), files are
+        checked in this process.
+    exclude : Iterable[str], optional
+        Glob patterns of files and directories to skip, besides
+        `DEFAULT_EXCLUDE`.
+    use_gitignore : bool, optional
+        Whether to skip files and directories ignored by git (the default is
+        True).
+    cache_dir : str, optional
+        A directory to cache findings in between runs (the default is None,
+        which checks every file).
+    prefetch : int, optional
+        With one job, how many files to read ahead while checking (the
+        default is 4).
+    inherit_docstrings : bool, optional
+        Whether to check methods without a docstring against the docstring
+        of the method they override, in any of the files (the default is
+        False).
+    **options
+        Passed on to `check_source`, such as ``docstring_style``.
+
+    Yields
+    ------
+    Result
+        The results of each file in turn, in order of their line.
+
+    Raises
+    ------
+    SyntaxError
+        If a file can't be parsed.
+    """
+
+    paths = list(paths)
+    exclude = list(DEFAULT_EXCLUDE) + list(exclude)
+    files = find_files(paths, exclude, use_gitignore)
+    symbols = None
+    if inherit_docstrings:
+        symbols = build_index(
+            find_files(paths, exclude, use_gitignore),
+            jobs,
+            options.get("docstring_style"),
+            options.get("strict_parser", False),
+        )
+    cache = None if cache_dir is None else ResultCache(cache_dir)
+    for findings in check_files(
+        files, jobs, cache, prefetch=prefetch, symbols=symbols, **options
+    ):
+        for finding in findings:
+            yield Result.from_finding(finding)
+    if cache is not None:
+        cache.prune()
+
+
+def _check_sources(
+    batch: List[Tuple[str, str]], **options
+) -> List[List[Finding]]:
+    return [check_source(name, source, **options) for name, source in batch]
+
+
+def check_sources(
+    sources: Union[Mapping[str, str], Iterable[Tuple[str, str]]],
+    jobs: int = 1,
+    **options
+) -> Iterator[Result]:
+    """Check python source code, yielding results as they come.
+
+    Parameters
+    ----------
+    sources : Union[Mapping[str, str], Iterable[Tuple[str, str]]]
+        The source code of each module by name, or (name, source) pairs. The
+        names are only used in the results.
+    jobs : int, optional
+        The number of worker processes. With 1 (the default), sources are
+        checked in this process.
+    **options
+        Passed on to `check_source`, such as ``docstring_style``.
+
+    Yields
+    ------
+    Result
+        The results of each source in turn, in order of their line.
+
+    Raises
+    ------
+    SyntaxError
+        If a source can't be parsed.
+    """
+
+    named_sources = (
+        sources.items() if isinstance(sources, Mapping) else sources
+    )
+    if jobs <= 1:
+        results: Iterable[List[Finding]] = (
+            check_source(name, source, **options)
+            for name, source in named_sources
+        )
+    else:
+        results = (
+            findings
+            for batch in map_batches(
+                partial(_check_sources, **options), named_sources, jobs
+            )
+            for findings in batch
+        )
+    for findings in results:
+        for finding in findings:
+            yield Result.from_finding(finding)
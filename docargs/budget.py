@@ -0,0 +1,241 @@
+"""Optional time budgets for parsing a docstring and for checking a file.
+
+Budgets are off by default. Once `enable` is called in a process, `limit`
+returns a context manager that a watchdog thread interrupts when its budget
+runs out, by raising `DocstringOverBudget` or `FileOverBudget` in the thread
+that entered it. The exception is raised between two bytecodes of python
+code, such as numpydoc's parser, so a single call into C code finishes
+first. Until then, `limit` returns a shared do-nothing context manager.
+"""
+
+import heapq
+import itertools
+import os
+import threading
+import time
+from typing import List, Optional, Tuple, Type
+
+DOCSTRING = "docstring"
+FILE = "file"
+
+
+class BudgetExceeded(Exception):
+    """Checking took longer than its time budget."""
+
+
+class DocstringOverBudget(BudgetExceeded):
+    """Parsing a docstring took longer than its time budget."""
+
+
+class FileOverBudget(BudgetExceeded):
+    """Checking a file took longer than its time budget."""
+
+
+_EXCEPTIONS = {DOCSTRING: DocstringOverBudget, FILE: FileOverBudget}
+
+
+def _interrupt(thread_id: int, exception: Optional[Type[BaseException]]):
+    # raise the exception in the thread, or cancel the pending one if None
+    import ctypes
+
+    ctypes.pythonapi.PyThreadState_SetAsyncExc(
+        ctypes.c_ulong(thread_id),
+        ctypes.py_object(exception) if exception is not None else None,
+    )
+
+
+class _NullLimit:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_LIMIT = _NullLimit()
+
+
+class _Limit:
+    __slots__ = ("watchdog", "exception", "seconds", "thread_id", "state")
+
+    def __init__(
+        self,
+        watchdog: "_Watchdog",
+        exception: Type[BudgetExceeded],
+        seconds: float,
+    ):
+        self.watchdog = watchdog
+        self.exception = exception
+        self.seconds = seconds
+
+    def __enter__(self):
+        self.thread_id = threading.get_ident()
+        # "running", then "fired" when interrupted, or "done"
+        self.state = "running"
+        self.watchdog.watch(self, time.monotonic() + self.seconds)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        with self.watchdog.condition:
+            if self.state == "fired" and not (
+                exc_type is not None and issubclass(exc_type, self.exception)
+            ):
+                # the body ended before the exception was raised, so don't
+                # raise it after the body
+                _interrupt(self.thread_id, None)
+            self.state = "done"
+        return False
+
+
+class _Watchdog:
+    # interrupts threads whose limits run out, in a daemon thread
+
+    def __init__(self) -> None:
+        self.condition = threading.Condition()
+        self.deadlines: List[Tuple[float, int, _Limit]] = []
+        self.order = itertools.count()
+        self.thread: Optional[threading.Thread] = None
+
+    def watch(self, limit: _Limit, deadline: float):
+        with self.condition:
+            # the thread only needs waking if it waits for a later deadline
+            if not self.deadlines or deadline < self.deadlines[0][0]:
+                self.condition.notify()
+            heapq.heappush(self.deadlines, (deadline, next(self.order), limit))
+            if self.thread is None:
+                self.thread = threading.Thread(
+                    target=self._run, name="docargs-watchdog", daemon=True
+                )
+                self.thread.start()
+
+    def _run(self):
+        with self.condition:
+            while True:
+                # finished limits are removed when their deadline is next
+                while self.deadlines and self.deadlines[0][2].state == "done":
+                    heapq.heappop(self.deadlines)
+                if not self.deadlines:
+                    self.condition.wait()
+                    continue
+                deadline, _, limit = self.deadlines[0]
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    self.condition.wait(remaining)
+                    continue
+                heapq.heappop(self.deadlines)
+                limit.state = "fired"
+                _interrupt(limit.thread_id, limit.exception)
+
+
+_active: Optional["Budgets"] = None
+# one watchdog thread serves all threads of a process:
+_watchdog: Optional[_Watchdog] = None
+
+
+class Budgets:
+    """Time budgets, in seconds, or None for no budget.
+
+    Parameters
+    ----------
+    docstring : float, optional
+        How long parsing a docstring may take (the default is None).
+    file : float, optional
+        How long checking a file may take (the default is None).
+    """
+
+    def __init__(
+        self, docstring: Optional[float] = None, file: Optional[float] = None
+    ):
+        self.seconds = {DOCSTRING: docstring, FILE: file}
+
+    def limit(self, what: str):
+        """Limit the time of a docstring or a file.
+
+        Parameters
+        ----------
+        what : str
+            `DOCSTRING` or `FILE`.
+
+        Returns
+        -------
+        ContextManager
+            Raises `DocstringOverBudget` or `FileOverBudget` in its body
+            when the budget runs out.
+        """
+        seconds = self.seconds[what]
+        if seconds is None:
+            return _NULL_LIMIT
+        global _watchdog
+        if _watchdog is None:
+            _watchdog = _Watchdog()
+        return _Limit(_watchdog, _EXCEPTIONS[what], seconds)
+
+
+def enable(
+    docstring: Optional[float] = None, file: Optional[float] = None
+) -> Optional[Budgets]:
+    """Start enforcing time budgets in this process.
+
+    Parameters
+    ----------
+    docstring : float, optional
+        How many seconds parsing a docstring may take (the default is None,
+        for no limit).
+    file : float, optional
+        How many seconds checking a file may take (the default is None, for
+        no limit).
+
+    Returns
+    -------
+    Optional[Budgets]
+        The budgets, or None if neither is given.
+    """
+    global _active
+    _active = None
+    if docstring is not None or file is not None:
+        _active = Budgets(docstring, file)
+    return _active
+
+
+def disable():
+    """Stop enforcing time budgets in this process."""
+    global _active
+    _active = None
+
+
+def active() -> Optional[Budgets]:
+    """Get the budgets enforced in this process, if there are any.
+
+    Returns
+    -------
+    Optional[Budgets]
+    """
+    return _active
+
+
+def limit(what: str):
+    """Limit the time of a docstring or a file, if budgets are enabled.
+
+    Parameters
+    ----------
+    what : str
+        `DOCSTRING` or `FILE`.
+
+    Returns
+    -------
+    ContextManager
+    """
+    if _active is None:
+        return _NULL_LIMIT
+    return _active.limit(what)
+
+
+def _after_fork():
+    # a forked worker process doesn't have the watchdog thread of its parent
+    global _watchdog
+    _watchdog = None
+    disable()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork)
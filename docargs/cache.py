@@ -0,0 +1,165 @@
+"""An on-disk cache of findings, keyed by the content of source files."""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+from typing import Any, Dict, List, Optional
+
+from .version import version
+
+DEFAULT_CACHE_DIR = ".docargs_cache"
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024
+# changed whenever the rows stored for findings change, so that entries in
+# an older format are not read:
+ROWS_FORMAT = 2
+
+# the names of the files and directories the cache writes, as `prune` must
+# not remove anything else:
+_SHARD_NAME = re.compile(r"\A[0-9a-f]{2}\Z")
+_ENTRY_NAME = re.compile(r"\A(?:[0-9a-f]{64}\.json|tmp\w+\.tmp)\Z")
+
+
+class ResultCache:
+    """A size-bounded, least-recently-used cache of findings.
+
+    Each entry is a small JSON file named after a hash of the source code,
+    the docargs version and the options the source was checked with. Entries
+    are written atomically, so several docargs processes can share a cache.
+
+    Parameters
+    ----------
+    directory : str
+        Where to store the cache.
+    max_size : int, optional
+        The size in bytes above which the least recently used entries are
+        removed by `prune` (the default is 64 MiB).
+    """
+
+    def __init__(self, directory: str, max_size: int = DEFAULT_MAX_SIZE):
+        self.directory = directory
+        self.max_size = max_size
+
+    def key(self, source: str, options: Dict[str, Any]) -> str:
+        """Compute the cache key for a file.
+
+        Parameters
+        ----------
+        source : str
+            The source code of the file.
+        options : Dict[str, Any]
+            The options the file is checked with.
+
+        Returns
+        -------
+        str
+        """
+
+        digest = hashlib.sha256()
+        digest.update(version.encode())
+        digest.update(str(ROWS_FORMAT).encode())
+        digest.update(json.dumps(options, sort_keys=True).encode())
+        digest.update(source.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + ".json")
+
+    def get(self, key: str) -> Optional[List[list]]:
+        """Look up the stored findings for a key.
+
+        Parameters
+        ----------
+        key : str
+            The key, from `key`.
+
+        Returns
+        -------
+        Optional[List[list]]
+            The stored rows, or None if there is no (readable) entry.
+        """
+
+        path = self._path(key)
+        try:
+            with open(path, "r") as f:
+                rows = json.load(f)
+            # mark the entry as recently used:
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return rows
+
+    def put(self, key: str, rows: List[list]):
+        """Store findings for a key.
+
+        Parameters
+        ----------
+        key : str
+            The key, from `key`.
+        rows : List[list]
+            JSON-serialisable findings.
+        """
+
+        path = self._path(key)
+        try:
+            self._ensure_directory(os.path.dirname(path))
+            descriptor, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(path), suffix=".tmp"
+            )
+            try:
+                with os.fdopen(descriptor, "w") as f:
+                    json.dump(rows, f)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            # the cache is an optimisation, so failing to write isn't fatal
+            pass
+
+    def _ensure_directory(self, directory: str):
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory, exist_ok=True)
+            with open(os.path.join(self.directory, ".gitignore"), "w") as f:
+                f.write("# created by docargs\n*\n")
+        os.makedirs(directory, exist_ok=True)
+
+    def prune(self):
+        """Remove the least recently used entries above the size limit.
+
+        Only the cache's own entries are counted and removed, so other files
+        in its directory are left alone.
+        """
+
+        entries = []
+        try:
+            shards = os.scandir(self.directory)
+        except OSError:
+            return
+        with shards:
+            for shard in shards:
+                if not (
+                    _SHARD_NAME.match(shard.name)
+                    and shard.is_dir(follow_symlinks=False)
+                ):
+                    continue
+                for entry in os.scandir(shard.path):
+                    if not _ENTRY_NAME.match(entry.name):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                # another process may have removed it already
+                pass
+            total_size -= size
@@ -0,0 +1,175 @@
+"""Restrict checks to the definitions touched by a git diff."""
+
+import ast
+import copy
+import os
+import re
+import subprocess
+from typing import Dict, List, Optional, Sequence, Tuple
+
+LineRanges = Sequence[Tuple[int, int]]
+
+_HUNK_HEADER = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+
+
+def parse_diff(diff: str) -> Dict[str, List[Tuple[int, int]]]:
+    """Find the changed lines in each file of a unified diff.
+
+    Parameters
+    ----------
+    diff : str
+        The output of ``git diff --unified=0``, with the default ``b/``
+        prefix on paths after the change.
+
+    Returns
+    -------
+    Dict[str, List[Tuple[int, int]]]
+        The first and last changed line of each hunk, by path of the file
+        after the change.
+    """
+
+    changed: Dict[str, List[Tuple[int, int]]] = {}
+    ranges: Optional[List[Tuple[int, int]]] = None
+    for line in diff.splitlines():
+        if line.startswith("+++ "):
+            path = line[4:]
+            if path == "/dev/null":
+                ranges = None
+            else:
+                ranges = changed.setdefault(path[2:], [])
+            continue
+
+        match = _HUNK_HEADER.match(line)
+        if match is not None and ranges is not None:
+            start = int(match.group(1))
+            count = 1 if match.group(2) is None else int(match.group(2))
+            # a pure deletion is reported after the line before it:
+            start = max(start, 1)
+            ranges.append((start, start + max(count, 1) - 1))
+    return changed
+
+
+def changed_lines(ref: str) -> Dict[str, List[Tuple[int, int]]]:
+    """Find the lines of python files that changed since a git revision.
+
+    Parameters
+    ----------
+    ref : str
+        The git revision to compare the working tree to.
+
+    Returns
+    -------
+    Dict[str, List[Tuple[int, int]]]
+        The changed line ranges, by real path of each changed file.
+
+    Raises
+    ------
+    RuntimeError
+        If git fails, for example because ``ref`` doesn't exist.
+    """
+
+    def git(*args: str) -> str:
+        result = subprocess.run(
+            ("git",) + args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip())
+        return result.stdout
+
+    root = git("rev-parse", "--show-toplevel").strip()
+    # explicit prefixes, as diff.noprefix or diff.mnemonicPrefix in the
+    # user's config change the ones parse_diff strips:
+    diff = git(
+        "diff",
+        "--unified=0",
+        "--no-color",
+        "--no-ext-diff",
+        "--src-prefix=a/",
+        "--dst-prefix=b/",
+        ref,
+        "--",
+    )
+    return {
+        os.path.realpath(os.path.join(root, path)): ranges
+        for path, ranges in parse_diff(diff).items()
+    }
+
+
+def _spans(nodes: List[ast.stmt], last_line: int) -> List[Tuple[int, int]]:
+    # end_lineno only exists from python 3.8, so fall back to the start of
+    # the next statement:
+    spans = []
+    for i, node in enumerate(nodes):
+        decorators = getattr(node, "decorator_list", [])
+        start = min([node.lineno] + [d.lineno for d in decorators])
+        end = getattr(node, "end_lineno", None)
+        if end is None:
+            end = nodes[i + 1].lineno - 1 if i + 1 < len(nodes) else last_line
+        spans.append((start, end))
+    return spans
+
+
+def _overlaps(span: Tuple[int, int], line_ranges: LineRanges) -> bool:
+    start, end = span
+    return any(first <= end and start <= last for first, last in line_ranges)
+
+
+def select_changed(
+    module: ast.Module, line_ranges: LineRanges, last_line: int
+) -> ast.Module:
+    """Reduce a module to the definitions that overlap some line ranges.
+
+    Functions are kept if any of their lines changed. Classes are kept whole
+    if their header or docstring changed (as that is where ``__init__``
+    parameters may be documented), and otherwise reduced to the methods that
+    changed.
+
+    Parameters
+    ----------
+    module : ast.Module
+        The module.
+    line_ranges : Sequence[Tuple[int, int]]
+        The first and last line of each change.
+    last_line : int
+        The number of lines in the module.
+
+    Returns
+    -------
+    ast.Module
+        A module with only the changed definitions.
+    """
+
+    body: List[ast.stmt] = []
+    for node, span in zip(module.body, _spans(module.body, last_line)):
+        if not _overlaps(span, line_ranges):
+            continue
+        if not isinstance(node, ast.ClassDef):
+            body.append(node)
+            continue
+
+        class_body = node.body
+        if ast.get_docstring(node) is not None:
+            class_body = class_body[1:]
+        if not class_body:
+            body.append(node)
+            continue
+        child_spans = _spans(class_body, span[1])
+        header = (span[0], child_spans[0][0] - 1)
+        if _overlaps(header, line_ranges):
+            body.append(node)
+            continue
+
+        changed_class = copy.copy(node)
+        changed_class.body = [
+            child
+            for child, child_span in zip(class_body, child_spans)
+            if _overlaps(child_span, line_ranges)
+        ]
+        body.append(changed_class)
+
+    changed_module = copy.copy(module)
+    changed_module.body = body
+    return changed_module
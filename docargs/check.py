@@ -1,19 +1,42 @@
 import ast
 import itertools
-from functools import singledispatch
-from typing import Set, Tuple, Union, Iterator, List, Container
-
-from numpydoc.docscrape import NumpyDocString
-
+from functools import lru_cache, singledispatch
+from typing import (
+    Callable,
+    Dict,
+    Type,
+    Set,
+    Tuple,
+    Union,
+    Iterator,
+    List,
+    Container,
+    Optional,
+    FrozenSet,
+    AbstractSet,
+    cast,
+)
+
+from . import budget, timing
+from .extract import extract_params
 from .identify import find_init, is_private
+from .styles import EPYDOC, GOOGLE, NUMPY, REST, detect_style
+
+# names of docstring_parser styles, which is only imported when it's needed:
+_DOCSTRING_PARSER_STYLES = {GOOGLE: "GOOGLE", REST: "REST", EPYDOC: "EPYDOC"}
 
-from docstring_parser.parser import ParseError, parse
+# how many distinct docstrings to remember the parameters of:
+DOC_PARAMS_CACHE_SIZE = 4096
 
 
 @singledispatch
 def check(
-    node, ignore_ambiguous_signatures: bool = True
-) -> Iterator[Tuple[ast.AST, List[str], List[str]]]:
+    node,
+    ignore_ambiguous_signatures: bool = True,
+    docstring_style: Optional[str] = None,
+    strict_parser: bool = False,
+    max_depth: Optional[int] = None,
+) -> Iterator[Tuple[ast.AST, Optional[List[str]], Optional[List[str]]]]:
     """Check an object's argument documentation.
 
     Parameters
@@ -23,6 +46,15 @@ def check(
     ignore_ambiguous_signatures : bool, optional
         Whether to not fail extra documented parameters if the object
         takes *args or *kwargs (the default is True)
+    docstring_style : str, optional
+        The style all docstrings are written in. If None (the default), it is
+        detected for each docstring.
+    strict_parser : bool, optional
+        Whether to fully parse docstrings with numpydoc or docstring_parser
+        (the default is False).
+    max_depth : int, optional
+        How many levels of classes to look into for methods and nested
+        classes. If None (the default), there is no limit.
 
     Returns
     -------
@@ -34,42 +66,67 @@ def check(
 
 
 @check.register(ast.FunctionDef)
+@check.register(ast.AsyncFunctionDef)
 def check_function(
-    func: ast.FunctionDef, ignore_ambiguous_signatures: bool = True
-) -> Iterator[Tuple[ast.AST, List[str], List[str]]]:
+    func: Union[ast.FunctionDef, ast.AsyncFunctionDef],
+    ignore_ambiguous_signatures: bool = True,
+    docstring_style: Optional[str] = None,
+    strict_parser: bool = False,
+    max_depth: Optional[int] = None,
+) -> Iterator[Tuple[ast.AST, Optional[List[str]], Optional[List[str]]]]:
     """Check the documented and actual arguments for a function.
 
     Parameters
     ----------
-    func : ast.FunctionDef
+    func : Union[ast.FunctionDef, ast.AsyncFunctionDef]
         The function to check
     ignore_ambiguous_signatures : bool, optional
         Whether to ignore extra docstring parameters if the function signature
         is ambiguous (the default is True).
+    docstring_style : str, optional
+        The style all docstrings are written in. If None (the default), it is
+        detected for each docstring.
+    strict_parser : bool, optional
+        Whether to fully parse docstrings with numpydoc or docstring_parser
+        (the default is False).
+    max_depth : int, optional
+        Unused, as functions in functions are not checked.
 
     Returns
     -------
     ast.FunctionDef
         The function
     Set[str]
-        Parameters in the signature but not in the docstring.
+        Parameters in the signature but not in the docstring, or None if
+        parsing the docstring took longer than its time budget.
     Set[str]]
-        Parameters in the docstring but not in the signature.
+        Parameters in the docstring but not in the signature, or None if
+        parsing the docstring took longer than its time budget.
     """
 
-    signature_args, ambiguous = get_signature_params(func)
-    docced_args = get_doc_params(func)
+    with timing.function(func):
+        signature_args, ambiguous = get_signature_params(func)
+        try:
+            docced_args = get_doc_params(func, docstring_style, strict_parser)
+        except budget.DocstringOverBudget:
+            yield func, None, None
+            return
 
-    underdocumented, overdocumented = compare_args(
-        signature_args, docced_args, ignore_ambiguous_signatures and ambiguous
-    )
+        underdocumented, overdocumented = compare_args(
+            signature_args,
+            docced_args,
+            ignore_ambiguous_signatures and ambiguous,
+        )
 
     yield func, underdocumented, overdocumented
 
 
 def check_init(
-    obj: ast.ClassDef, ignore_ambiguous_signatures: bool = False
-) -> Iterator[Tuple[ast.AST, List[str], List[str]]]:
+    obj: ast.ClassDef,
+    ignore_ambiguous_signatures: bool = False,
+    docstring_style: Optional[str] = None,
+    strict_parser: bool = False,
+) -> Iterator[Tuple[ast.AST, Optional[List[str]], Optional[List[str]]]]:
     """Check the documented and actual arguments for an init method.
 
     This combines the parameters in the init method docstring and the class
@@ -82,33 +139,141 @@ def check_init(
     ignore_ambiguous_signatures : bool, optional
         Whether to ignore extra docstring parameters if the function signature
         is ambiguous (the default is True).
+    docstring_style : str, optional
+        The style all docstrings are written in. If None (the default), it is
+        detected for each docstring.
+    strict_parser : bool, optional
+        Whether to fully parse docstrings with numpydoc or docstring_parser
+        (the default is False).
 
     Yields
     ------
     ast.FunctionDef
         The __init__ method AST node.
     Set[str]
-        Parameters in the signature but not in the docstring.
+        Parameters in the signature but not in the docstring, or None if
+        parsing a docstring took longer than its time budget.
     Set[str]]
-        Parameters in the docstring but not in the signature.
+        Parameters in the docstring but not in the signature, or None if
+        parsing a docstring took longer than its time budget.
     """
     init_method = find_init(obj)
 
     if init_method is not None:
-        signature_args, ambiguous = get_signature_params(init_method)
-        docced_args = get_doc_params(obj) | get_doc_params(init_method)
-        underdocumented, overdocumented = compare_args(
-            signature_args,
-            docced_args,
-            ignore_ambiguous_signatures and ambiguous,
-        )
+        with timing.function(init_method):
+            signature_args, ambiguous = get_signature_params(init_method)
+            try:
+                docced_args = get_doc_params(
+                    obj, docstring_style, strict_parser
+                ) | get_doc_params(init_method, docstring_style, strict_parser)
+            except budget.DocstringOverBudget:
+                yield init_method, None, None
+                return
+            underdocumented, overdocumented = compare_args(
+                signature_args,
+                docced_args,
+                ignore_ambiguous_signatures and ambiguous,
+            )
         yield init_method, underdocumented, overdocumented
 
 
+def walk(
+    node: ast.AST,
+    ignore_ambiguous_signatures: bool = True,
+    docstring_style: Optional[str] = None,
+    strict_parser: bool = False,
+    max_depth: Optional[int] = None,
+    names: Optional[Container[str]] = None,
+) -> Iterator[Tuple[ast.AST, Optional[List[str]], Optional[List[str]]]]:
+    """Check a module, class or function and everything in it in one pass.
+
+    Definitions are visited in order, with an explicit stack rather than by
+    recursion, and checked by the function `VISITORS` holds for their type.
+    Private definitions, and functions in functions, are not checked.
+
+    Parameters
+    ----------
+    node : ast.AST
+        The module, class or function to check.
+    ignore_ambiguous_signatures : bool, optional
+        Whether to ignore extra documented arguments if the function has an
+        ambiguous (*args / **kwargs) signature (the default is True).
+    docstring_style : str, optional
+        The style all docstrings are written in. If None (the default), it is
+        detected for each docstring.
+    strict_parser : bool, optional
+        Whether to fully parse docstrings with numpydoc or docstring_parser
+        (the default is False).
+    max_depth : int, optional
+        How many levels of classes to look into: with 0, only the functions
+        and the ``__init__`` methods of classes in a module are checked, with
+        1 also their methods, and so on. If None (the default), there is no
+        limit.
+    names : Container[str], optional
+        If given, only check the module-level functions and classes with
+        these names, whether or not they are private.
+
+    Yields
+    ------
+    ast.FunctionDef
+        A function or method.
+    List[str]
+        Parameters in the signature but not in the docstring.
+    List[str]
+        Parameters in the docstring but not in the signature.
+    """
+
+    options = (ignore_ambiguous_signatures, docstring_style, strict_parser)
+    # (definition, the number of classes around it) to visit, last first:
+    stack: List[Tuple[ast.AST, int]] = []
+    if isinstance(node, ast.Module):
+        stack.extend(_definitions_in(node, 0, names))
+    elif type(node) in VISITORS:
+        stack.append((node, 0))
+
+    while stack:
+        node, depth = stack.pop()
+        visit, look_inside = VISITORS[type(node)]
+        yield from visit(node, *options)
+        if look_inside and (max_depth is None or depth < max_depth):
+            stack.extend(_definitions_in(cast(ast.ClassDef, node), depth + 1))
+
+
+def _definitions_in(
+    node: Union[ast.Module, ast.ClassDef],
+    depth: int,
+    names: Optional[Container[str]] = None,
+) -> List[Tuple[ast.AST, int]]:
+    # the public (or named) definitions in a module or class body, reversed
+    # for the stack
+    return [
+        (child, depth)
+        for child in reversed(node.body)
+        if type(child) in VISITORS
+        and (
+            not is_private(child)
+            if names is None
+            else getattr(child, "name") in names
+        )
+    ]
+
+
+# how to check each type of definition, and whether to look inside it:
+VISITORS: Dict[Type[ast.AST], Tuple[Callable[..., Iterator], bool]] = {
+    ast.FunctionDef: (check_function, False),
+    ast.AsyncFunctionDef: (check_function, False),
+    ast.ClassDef: (check_init, True),
+}
+
+
 @check.register(ast.ClassDef)
 def check_class(
-    obj: ast.ClassDef, ignore_ambiguous_signatures: bool = False
-) -> Iterator[Tuple[ast.AST, List[str], List[str]]]:
+    obj: ast.ClassDef,
+    ignore_ambiguous_signatures: bool = False,
+    docstring_style: Optional[str] = None,
+    strict_parser: bool = False,
+    max_depth: Optional[int] = None,
+) -> Iterator[Tuple[ast.AST, Optional[List[str]], Optional[List[str]]]]:
     """Check the documented and actual arguments for a class's methods.
 
     Parameters
@@ -118,6 +283,15 @@ def check_class(
     ignore_ambiguous_signatures : bool, optional
         Whether to ignore extra docstring parameters if the function signature
         is ambiguous (the default is True).
+    docstring_style : str, optional
+        The style all docstrings are written in. If None (the default), it is
+        detected for each docstring.
+    strict_parser : bool, optional
+        Whether to fully parse docstrings with numpydoc or docstring_parser
+        (the default is False).
+    max_depth : int, optional
+        How many levels of classes to look into. With 0, only ``__init__`` is
+        checked. If None (the default), there is no limit.
 
     Yields
     ------
@@ -129,21 +303,23 @@ def check_class(
         Parameters in the docstring but not in the signature.
     """
 
-    if find_init(obj) is not None:
-        yield from check_init(obj, ignore_ambiguous_signatures)
-
-    for node in ast.iter_child_nodes(obj):
-
-        if not is_private(node):
-            check_result = check(node, ignore_ambiguous_signatures)
-            if check_result is not None:
-                yield from check_result
+    yield from walk(
+        obj,
+        ignore_ambiguous_signatures,
+        docstring_style,
+        strict_parser,
+        max_depth,
+    )
 
 
 @check.register(ast.Module)
 def check_module(
-    module: ast.Module, ignore_ambiguous_signatures: bool = True
-) -> Iterator[Tuple[ast.AST, List[str], List[str]]]:
+    module: ast.Module,
+    ignore_ambiguous_signatures: bool = True,
+    docstring_style: Optional[str] = None,
+    strict_parser: bool = False,
+    max_depth: Optional[int] = None,
+) -> Iterator[Tuple[ast.AST, Optional[List[str]], Optional[List[str]]]]:
     """Check a module.
 
     Parameters
@@ -153,17 +329,28 @@ def check_module(
     ignore_ambiguous_signatures : bool, optional
         Whether to ignore extra documented arguments if the function as an
         ambiguous (*args / **kwargs) signature (the default is True).
+    docstring_style : str, optional
+        The style all docstrings are written in. If None (the default), it is
+        detected for each docstring.
+    strict_parser : bool, optional
+        Whether to fully parse docstrings with numpydoc or docstring_parser
+        (the default is False).
+    max_depth : int, optional
+        How many levels of classes to look into. If None (the default), there
+        is no limit.
 
     Returns
     -------
     dict
     """
 
-    for node in ast.iter_child_nodes(module):
-        if not is_private(node):
-            check_result = check(node, ignore_ambiguous_signatures)
-            if check_result is not None:
-                yield from check_result
+    yield from walk(
+        module,
+        ignore_ambiguous_signatures,
+        docstring_style,
+        strict_parser,
+        max_depth,
+    )
 
 
 def get_signature_params(
@@ -196,54 +383,138 @@ def get_signature_params(
 
 
 def get_doc_params(
-    node: Union[ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef]
-) -> Set[str]:
+    node: Union[ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef],
+    docstring_style: Optional[str] = None,
+    strict_parser: bool = False,
+) -> FrozenSet[str]:
     """Get parameters in a function signature.
 
     Parameters
     ----------
     node : ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef
         An ast function node
+    docstring_style : str, optional
+        The style the docstring is written in, one of "numpy", "google",
+        "rest" or "epydoc". If None (the default), the style is detected
+        from the docstring, so that it only needs to be parsed once.
+    strict_parser : bool, optional
+        Whether to fully parse the docstring with numpydoc or
+        docstring_parser, rather than only scanning its parameter sections
+        (the default is False).
 
     Returns
     -------
-    signature_params : Set[str]
-    ambiguous : bool
+    FrozenSet[str]
     """
+    # get_docstring normalizes indentation, so the same docstring on a
+    # method and on a function is only parsed once
     docstring = ast.get_docstring(node)
+    if docstring is None:
+        return frozenset()
+    return docstring_params(docstring, docstring_style, strict_parser)
+
+
+@lru_cache(maxsize=DOC_PARAMS_CACHE_SIZE)
+def docstring_params(
+    docstring: str,
+    docstring_style: Optional[str] = None,
+    strict_parser: bool = False,
+) -> FrozenSet[str]:
+    """Get the parameters documented in a docstring.
+
+    Results are kept in a bounded LRU cache that is shared by all files
+    checked in a process, as generated code, wrappers and mixins often
+    repeat docstrings. ``docstring_params.cache_info()`` tells its hits and
+    misses. Docstrings that take longer to parse than the docstring budget
+    (see `budget.enable`) raise `budget.DocstringOverBudget`, and are not
+    cached.
+
+    Parameters
+    ----------
+    docstring : str
+        The docstring, with its indentation removed.
+    docstring_style : str, optional
+        The style the docstring is written in. If None (the default), it is
+        detected.
+    strict_parser : bool, optional
+        Whether to fully parse the docstring with numpydoc or
+        docstring_parser (the default is False).
+
+    Returns
+    -------
+    FrozenSet[str]
+    """
+
+    with budget.limit(budget.DOCSTRING):
+        if docstring_style is None:
+            with timing.phase("detect style"):
+                docstring_style = detect_style(docstring)
+
+        if strict_parser:
+            return frozenset(parse_doc_params(docstring, docstring_style))
+        with timing.phase("scan docstring"):
+            return frozenset(extract_params(docstring, docstring_style))
+
+
+def parse_doc_params(
+    docstring: str, docstring_style: Optional[str]
+) -> Set[str]:
+    """Get the parameters in a docstring with numpydoc or docstring_parser.
+
+    Both are slow to import, so they are only imported when first needed.
+
+    Parameters
+    ----------
+    docstring : str
+        The docstring.
+    docstring_style : str, optional
+        The style the docstring is written in. If None, no parameters are
+        found.
+
+    Returns
+    -------
+    Set[str]
+    """
+
     parameters_in_docstring: Set[str] = set()
-    if docstring is not None:
-        # try numpy doc:
-        docstring_numpy = NumpyDocString(docstring)
-        if any(list(docstring_numpy.values())[3:]):
-            parameters_in_docstring = parameters_in_docstring | {
+    if docstring_style == NUMPY:
+        from numpydoc.docscrape import NumpyDocString
+
+        with timing.phase("numpydoc"):
+            docstring_numpy = NumpyDocString(docstring)
+            parameters_in_docstring = {
                 arg[0] for arg in docstring_numpy["Parameters"]
             }
-            # return parameters_in_docstring
-
-        else:
-            try:
-                # check if google or Rest docstring works:
-                parsed_docstring = parse(docstring)
-                parameters_in_docstring = parameters_in_docstring | {
-                    param.arg_name for param in parsed_docstring.params
-                }
-            except ParseError:
-                pass
+    elif docstring_style in _DOCSTRING_PARSER_STYLES:
+        from docstring_parser import Style
+        from docstring_parser.parser import ParseError, parse
+
+        try:
+            # check if google or Rest docstring works:
+            style = getattr(Style, _DOCSTRING_PARSER_STYLES[docstring_style])
+            with timing.phase("docstring_parser"):
+                parsed_docstring = parse(docstring, style)
+            parameters_in_docstring = {
+                param.arg_name for param in parsed_docstring.params
+            }
+        except ParseError:
+            pass
 
     return parameters_in_docstring
 
 
 def compare_args(
-    signature_args: set, docced_args: set, ambiguous: bool
+    signature_args: AbstractSet[str],
+    docced_args: AbstractSet[str],
+    ambiguous: bool,
 ) -> Tuple[list, list]:
     """[summary]
 
     Parameters
     ----------
-    signature_args : set
+    signature_args : AbstractSet[str]
         The arguments in the function signature
-    docced_args : set
+    docced_args : AbstractSet[str]
         The arguments in the docstring.
     ambiguous : bool
         Whether the function is ambiguous.
@@ -254,7 +525,10 @@ def compare_args(
     overdocumented : list
     """
 
-    underdocumented = list(signature_args - docced_args)
-    overdocumented = [] if ambiguous else list(docced_args - signature_args)
+    with timing.phase("compare_args"):
+        underdocumented = list(signature_args - docced_args)
+        overdocumented = (
+            [] if ambiguous else list(docced_args - signature_args)
+        )
 
     return underdocumented, overdocumented
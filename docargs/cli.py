@@ -1,86 +1,917 @@
+import json
+import os
+import signal
 import sys
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
 import click
-from colorama import Fore
-import ast
 
-from .check import check
+from . import budget, timing
+from .cache import DEFAULT_CACHE_DIR, ResultCache
+from .changes import changed_lines
+from .discover import DEFAULT_EXCLUDE, find_files
+from .report import REPORTERS, cli_error
+from .run import (
+    DEFAULT_PREFETCH,
+    Finding,
+    check_files,
+    check_source_cached,
+    resolve_jobs,
+)
+from .styles import STYLES
+
+if TYPE_CHECKING:
+    from .symbols import SymbolIndex
+    from .watch import Watcher
+
+# the modules of the other commands, and of options such as --shard and
+# --watch, are imported where they are used, so that a plain check doesn't
+# pay for them
+
+
+class _DefaultCommandGroup(click.Group):
+    # runs the "check" command unless another command is named, so that
+    # ``docargs FILES`` means ``docargs check FILES``
+    def parse_args(self, ctx, args):
+        if not args or (
+            args[0] not in self.commands
+            and args[0] not in ctx.help_option_names
+        ):
+            args = ["check"] + list(args)
+        return super().parse_args(ctx, args)
+
+
+@click.group(cls=_DefaultCommandGroup)
+def cli():
+    """
+    Find holes in your documentation.
+
+    Without a command, docargs runs "check", so "docargs FILES" checks FILES.
+    """
+
+
+def _jobs_callback(ctx, param, value):
+    try:
+        return resolve_jobs(value)
+    except ValueError:
+        raise click.BadParameter(
+            "must be a positive integer or 'auto', not {!r}".format(value)
+        )
+
+
+def _shard_callback(ctx, param, value):
+    if value is None:
+        return None
+    index, _, count = value.partition("/")
+    try:
+        shard = int(index), int(count)
+    except ValueError:
+        shard = (0, 0)
+    if not 1 <= shard[0] <= shard[1]:
+        raise click.BadParameter(
+            "must be I/N with 1 <= I <= N, not {!r}".format(value)
+        )
+    return shard
+
+
+_FORMAT_OPTION = click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(sorted(REPORTERS)),
+    default="text",
+    help=(
+        "How to report findings: as text, as JSON Lines written as files "
+        "are checked, or as a SARIF document."
+    ),
+    show_default=True,
+)
+
+_SLOW_REPORT_OPTION = click.option(
+    "--slow-report",
+    type=click.Path(dir_okay=False, writable=True),
+    help=(
+        "Save the docstrings and files that took longer than their time "
+        "budget to this JSON file."
+    ),
+)
+
+_TIMINGS_OPTION = click.option(
+    "--timings",
+    type=click.Path(dir_okay=False),
+    help="The file of how long each file took to check, to balance shards.",
+    show_default=".docargs_timings.json",
+)
+
+# options of how docstrings are checked:
+_DOCSTRING_OPTIONS = [
+    click.option(
+        "--ignore-ambiguous-signatures",
+        default=True,
+        is_flag=True,
+        help=(
+            "Whether to ignore extra arguments in docstrings if the function "
+            "has *args or **kwargs."
+        ),
+    ),
+    click.option(
+        "--docstring-style",
+        type=click.Choice(["auto"] + list(STYLES)),
+        default="auto",
+        help=(
+            "The style all docstrings are written in. By default, it is "
+            "detected for each docstring."
+        ),
+        show_default=True,
+    ),
+    click.option(
+        "--strict-parser",
+        is_flag=True,
+        help=(
+            "Fully parse docstrings with numpydoc or docstring_parser, rather "
+            "than only scanning their parameter sections."
+        ),
+    ),
+]
+
+# options of both checking files here and through a server:
+_CHECK_OPTIONS = _DOCSTRING_OPTIONS + [
+    click.option(
+        "--cache-dir",
+        default=DEFAULT_CACHE_DIR,
+        type=click.Path(file_okay=False),
+        help="Where to cache results between runs.",
+        show_default=True,
+    ),
+    click.option(
+        "--no-cache",
+        is_flag=True,
+        help=(
+            "Check every file, rather than reusing results from earlier "
+            "runs."
+        ),
+    ),
+    click.option(
+        "--changed-since",
+        metavar="REF",
+        help=(
+            "Only check functions and classes that changed since this git "
+            "revision."
+        ),
+    ),
+    click.option(
+        "--exclude",
+        multiple=True,
+        metavar="PATTERN",
+        help=(
+            "Skip files and directories matching this glob. Can be given "
+            "several times, and adds to the default: {}.".format(
+                ",".join(DEFAULT_EXCLUDE)
+            )
+        ),
+    ),
+    click.option(
+        "--no-gitignore",
+        is_flag=True,
+        help="Also check files that are ignored by git.",
+    ),
+    click.option(
+        "--prescan",
+        is_flag=True,
+        help=(
+            "Only parse the public top-level functions and classes of files, "
+            "found by scanning their lines, when that is safe. Files without "
+            "any are skipped, so their syntax errors aren't reported."
+        ),
+    ),
+    click.option(
+        "--max-depth",
+        type=click.IntRange(min=0),
+        help=(
+            "How many levels of classes to look into for methods and nested "
+            "classes. With 0, only module-level functions and the __init__ "
+            "methods of classes are checked. By default, there is no limit."
+        ),
+    ),
+    click.option(
+        "--exported-only",
+        is_flag=True,
+        help=(
+            "Only check the functions and classes that modules export, "
+            "through their __all__ or their package's __init__.py."
+        ),
+    ),
+    _FORMAT_OPTION,
+]
+
+_SOCKET_OPTION = click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False),
+    help="The Unix socket the server listens on.",
+    show_default="a socket in $XDG_RUNTIME_DIR or the temporary directory",
+)
+
+
+def _options_of(options):
+    def add_options(command):
+        for option in reversed(options):
+            command = option(command)
+        return command
+
+    return add_options
 
 
-@click.command()
+@cli.command("check")
+@_options_of(_CHECK_OPTIONS)
 @click.option(
-    "--ignore-ambiguous-signatures",
-    default=True,
+    "-j",
+    "--jobs",
+    default="1",
+    callback=_jobs_callback,
+    help=(
+        "The number of processes to check files with, or 'auto' for one "
+        "per CPU."
+    ),
+)
+@click.option(
+    "--prefetch",
+    type=click.IntRange(min=0),
+    default=DEFAULT_PREFETCH,
+    help=(
+        "With one job, how many files to read ahead while checking, which "
+        "helps on slow file systems such as NFS."
+    ),
+    show_default=True,
+)
+@click.option(
+    "--inherit-docstrings",
+    is_flag=True,
+    help=(
+        "Check methods without a docstring against the docstring of the "
+        "method they override, in any of the files to check."
+    ),
+)
+@click.option(
+    "--shard",
+    metavar="I/N",
+    callback=_shard_callback,
+    help=(
+        "Only check the I-th of N parts of the files, split so that each "
+        "part takes about as long to check."
+    ),
+)
+@click.option(
+    "--shard-output",
+    type=click.Path(dir_okay=False, writable=True),
+    help='Save the findings to this file, for "docargs merge".',
+)
+@_TIMINGS_OPTION
+@click.option(
+    "--docstring-budget",
+    type=click.FloatRange(min=0, min_open=True),
+    metavar="SECONDS",
+    help=(
+        "Skip docstrings that take longer than this to parse, and report "
+        "them as not checked (rule D003 in SARIF)."
+    ),
+)
+@click.option(
+    "--file-budget",
+    type=click.FloatRange(min=0, min_open=True),
+    metavar="SECONDS",
+    help=(
+        "Skip files that take longer than this to check, and report them "
+        "as not checked (rule D003 in SARIF)."
+    ),
+)
+@_SLOW_REPORT_OPTION
+@click.option(
+    "--watch",
+    is_flag=True,
+    help="Keep running, and check files again whenever they change.",
+)
+@click.option(
+    "--profile",
     is_flag=True,
     help=(
-        "Whether to ignore extra arguments in docstrings if the function "
-        "has *args or **kwargs."
+        "Time each phase of the run, and print the totals and the slowest "
+        "files and functions at the end."
+    ),
+)
+@click.option(
+    "--profile-output",
+    type=click.Path(dir_okay=False, writable=True),
+    help=(
+        "Also run under cProfile, and save its statistics to this file for "
+        "pstats or snakeviz."
     ),
 )
-@click.argument("files", nargs=-1, type=click.File("r"))
-def cli(ignore_ambiguous_signatures=False, files=()):
+@click.argument("files", nargs=-1, type=click.Path(exists=True))
+def check_command(
+    ignore_ambiguous_signatures=False,
+    jobs=1,
+    docstring_style="auto",
+    strict_parser=False,
+    cache_dir=DEFAULT_CACHE_DIR,
+    no_cache=False,
+    changed_since=None,
+    prefetch=DEFAULT_PREFETCH,
+    inherit_docstrings=False,
+    shard=None,
+    shard_output=None,
+    timings=None,
+    docstring_budget=None,
+    file_budget=None,
+    slow_report=None,
+    watch=False,
+    exclude=(),
+    no_gitignore=False,
+    prescan=False,
+    max_depth=None,
+    exported_only=False,
+    output_format="text",
+    profile=False,
+    profile_output=None,
+    files=(),
+):
     """
     Check if arguments in functions in FILES have been documented.
 
+    FILES can be python files, or directories to search for python files.
+
     Parameters
     ----------
     ignore_ambiguous_signatures : bool
         Whether to be strict on ambiguous function signatures
+    jobs : int
+        The number of processes to check files with.
+    docstring_style : str
+        The style of docstrings, or "auto" to detect it per docstring.
+    strict_parser : bool
+        Whether to fully parse docstrings.
+    cache_dir : str
+        The directory to cache results in.
+    no_cache : bool
+        Whether to not use the cache.
+    changed_since : str
+        A git revision; only definitions changed since then are checked.
+    prefetch : int
+        How many files to read ahead while checking.
+    inherit_docstrings : bool
+        Whether methods without docstrings inherit those they override.
+    shard : Tuple[int, int]
+        Which part of the files to check, and into how many parts to split
+        them, or None to check all files.
+    shard_output : str
+        A file to save the findings in for merging.
+    timings : str
+        The file of how long files took to check before.
+    docstring_budget : float
+        How many seconds parsing a docstring may take, or None for no limit.
+    file_budget : float
+        How many seconds checking a file may take, or None for no limit.
+    slow_report : str
+        A file to save what took longer than its time budget in.
+    watch : bool
+        Whether to keep checking files as they change, until interrupted.
+    exclude : list
+        Glob patterns of files and directories to skip.
+    no_gitignore : bool
+        Whether to check files that are ignored by git.
+    prescan : bool
+        Whether to only parse the public top-level definitions of files.
+    max_depth : int
+        How many levels of classes to look into, or None for no limit.
+    exported_only : bool
+        Whether to only check the definitions that modules export.
+    output_format : str
+        How to report findings, one of "text", "jsonl" or "sarif".
+    profile : bool
+        Whether to time the phases of the run and print a summary.
+    profile_output : str
+        A file to save cProfile statistics to.
     files : list
-        The files to check.
+        The files and directories to check.
     """
 
-    failed = False
-    for module_file in files:
-        source_code = module_file.read()
-        tree = ast.parse(source_code)
-
-        for statement, underdocumented, overdocumented in check(tree):
-            failed = True
-            if underdocumented or overdocumented:
-                cli_error(
-                    module_file.name,
-                    statement,
-                    underdocumented,
-                    overdocumented,
-                )
+    if watch and output_format != "text":
+        # watch mode reports each change as it happens, as text
+        raise click.UsageError(
+            "--format {} can't be used with --watch".format(output_format)
+        )
+    paths, line_ranges = _find_paths(
+        files, exclude, no_gitignore, changed_since
+    )
+    all_paths = []
+    positions = []
+    split = ""
+    if shard is not None or shard_output is not None:
+        if watch:
+            raise click.UsageError(
+                "--shard and --shard-output can't be used with --watch"
+            )
+        from .shard import (
+            DEFAULT_TIMINGS,
+            read_timings,
+            select_shard,
+            split_key,
+        )
 
-    if failed:
-        sys.exit(1)
-    else:
-        click.echo(Fore.GREEN + "All arguments are documented ✓")
-        sys.exit(0)
+        all_paths = list(paths)
+        index, count = shard or (1, 1)
+        file_timings = read_timings(timings or DEFAULT_TIMINGS)
+        positions = select_shard(all_paths, index, count, file_timings)
+        split = split_key(all_paths, file_timings)
+        paths = iter([all_paths[position] for position in positions])
+    cache = None if no_cache else ResultCache(cache_dir)
+    options = _options(
+        ignore_ambiguous_signatures, docstring_style, strict_parser
+    )
+    options.update(
+        prescan=prescan, max_depth=max_depth, exported_only=exported_only
+    )
 
+    # the shard's output includes how long each file took
+    profiler = timing.enable() if profile or shard_output else None
+    budget.enable(docstring_budget, file_budget)
+    symbols = None
+    if inherit_docstrings:
+        # base classes can be in any file, including ones that are not
+        # checked because they haven't changed
+        from .symbols import build_index
 
-def cli_error(  # noqa DOO1
-    file_name, statement, underdocumented, overdocumented
-):
-    """[summary]
+        with timing.phase("index"):
+            symbols = build_index(
+                find_files(
+                    sorted(files),
+                    exclude=DEFAULT_EXCLUDE + tuple(exclude),
+                    use_gitignore=not no_gitignore,
+                ),
+                jobs,
+                options["docstring_style"],
+                strict_parser,
+            )
 
-    Args:
-        file_name: hi friends
-        underdocumented (bool): hello there
-        overdocumented (bool): hello there
-    """
-    click.echo(
-        "{}:{}:{}: ".format(file_name, statement.lineno, statement.col_offset)
+    if watch:
+        from .fingerprint import DefinitionCache
+        from .watch import Watcher
+        from .watch import watch as watch_files
+
+        # files are checked again whenever they change, so keep the findings
+        # of their definitions to only check the definitions that changed
+        check_changed = partial(
+            check_source_cached,
+            cache=cache,
+            definitions=DefinitionCache(),
+            symbols=symbols,
+            **options
+        )
+        if symbols is not None:
+            check_changed = partial(
+                _index_and_check,
+                symbols,
+                options["docstring_style"],
+                strict_parser,
+                check_changed,
+            )
+        # files added to directories are watched too
+        directories = sorted(path for path in files if os.path.isdir(path))
+        find_paths = None
+        if directories:
+            find_paths = partial(
+                find_files,
+                directories,
+                exclude=DEFAULT_EXCLUDE + tuple(exclude),
+                use_gitignore=not no_gitignore,
+            )
+        watcher = Watcher(list(paths), check_changed, find_paths)
+        click.echo(
+            "Watching {} files for changes...".format(len(watcher.stats))
+        )
+        watch_files(watcher, report_changes)
+        sys.exit(1 if watcher.failed else 0)
+
+    c_profiler = None
+    if profile_output is not None:
+        import cProfile
+
+        c_profiler = cProfile.Profile()
+        c_profiler.enable()
+
+    results = check_files(
+        paths, jobs, cache, line_ranges, prefetch, symbols=symbols, **options
     )
-    if len(underdocumented) > 0:
-        click.secho(
+    shard_findings = []
+    if shard_output is not None:
+        results = _recorded(results, shard_findings)
+    slow = []
+    failed = _report(results, output_format, slow)
+    budget.disable()
+
+    if cache is not None:
+        with timing.phase("cache prune"):
+            cache.prune()
+
+    if c_profiler is not None:
+        c_profiler.disable()
+        c_profiler.dump_stats(profile_output)
+    if shard_output is not None and profiler is not None:
+        from .shard import write_shard_results
+
+        write_shard_results(
+            shard_output,
+            shard or (1, 1),
+            len(all_paths),
+            split,
+            dict(
+                options,
+                changed_since=changed_since,
+                inherit_docstrings=inherit_docstrings,
+                docstring_budget=docstring_budget,
+                file_budget=file_budget,
+            ),
             (
-                "These parameters are not "
-                "documented: {}".format(", ".join(underdocumented))
+                (
+                    position,
+                    all_paths[position],
+                    profiler.files.get(all_paths[position], (0.0, 0))[0],
+                    findings,
+                )
+                for position, findings in zip(positions, shard_findings)
             ),
-            fg="red",
         )
-    if len(overdocumented) > 0:
-        click.secho(
-            (
-                "These parameters are documented but not in the "
-                "function signature: {}".format(", ".join(overdocumented))
+    if profiler is not None:
+        timing.disable()
+        if profile:
+            click.echo(profiler.summary(), err=True)
+    _report_slow(slow, slow_report)
+    sys.exit(1 if failed else 0)
+
+
+@cli.command("merge")
+@_FORMAT_OPTION
+@_TIMINGS_OPTION
+@_SLOW_REPORT_OPTION
+@click.argument(
+    "results", nargs=-1, required=True, type=click.Path(dir_okay=False)
+)
+def merge_command(
+    output_format="text", timings=None, slow_report=None, results=()
+):
+    """
+    Report the findings that "docargs check --shard-output" saved in RESULTS.
+
+    The report and exit status are the same as checking all files at once.
+    How long each file took is added to the timings file, to balance the
+    next runs' shards.
+
+    Parameters
+    ----------
+    output_format : str
+        How to report findings, one of "text", "jsonl" or "sarif".
+    timings : str
+        The file of how long files took to check, to update.
+    slow_report : str
+        A file to save what took longer than its time budget in.
+    results : list
+        The files saved by each shard.
+    """
+
+    from .shard import DEFAULT_TIMINGS, merge_shard_results, update_timings
+
+    timings = timings or DEFAULT_TIMINGS
+    try:
+        findings, times = merge_shard_results(results)
+    except ValueError as error:
+        raise click.ClickException(str(error))
+    try:
+        update_timings(timings, times)
+    except OSError as error:
+        click.echo("Could not update {}: {}".format(timings, error), err=True)
+    slow = []
+    failed = _report(findings, output_format, slow)
+    _report_slow(slow, slow_report)
+    sys.exit(1 if failed else 0)
+
+
+@cli.command("serve")
+@_SOCKET_OPTION
+def serve_command(socket_path=None):
+    """
+    Check files for "docargs client" and editors, until interrupted.
+
+    Imports and the cache of parsed docstrings stay warm between checks.
+
+    Parameters
+    ----------
+    socket_path : str
+        The Unix socket to listen on.
+    """
+
+    from .server import default_socket_path, make_server
+
+    socket_path = socket_path or default_socket_path()
+    try:
+        server = make_server(socket_path)
+    except RuntimeError as error:
+        raise click.ClickException(str(error))
+    click.echo("Listening on {}".format(socket_path), err=True)
+    # stop cleanly, removing the socket, when terminated as well
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    with server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+@cli.command("client")
+@_options_of(_CHECK_OPTIONS)
+@_SOCKET_OPTION
+@click.argument("files", nargs=-1, type=click.Path(exists=True))
+def client_command(
+    ignore_ambiguous_signatures=False,
+    docstring_style="auto",
+    strict_parser=False,
+    cache_dir=DEFAULT_CACHE_DIR,
+    no_cache=False,
+    changed_since=None,
+    exclude=(),
+    no_gitignore=False,
+    prescan=False,
+    max_depth=None,
+    exported_only=False,
+    output_format="text",
+    socket_path=None,
+    files=(),
+):
+    """
+    Check FILES like "docargs check", but with a running "docargs serve".
+
+    Parameters
+    ----------
+    ignore_ambiguous_signatures : bool
+        Whether to be strict on ambiguous function signatures
+    docstring_style : str
+        The style of docstrings, or "auto" to detect it per docstring.
+    strict_parser : bool
+        Whether to fully parse docstrings.
+    cache_dir : str
+        The directory to cache results in.
+    no_cache : bool
+        Whether to not use the cache.
+    changed_since : str
+        A git revision; only definitions changed since then are checked.
+    exclude : list
+        Glob patterns of files and directories to skip.
+    no_gitignore : bool
+        Whether to check files that are ignored by git.
+    prescan : bool
+        Whether to only parse the public top-level definitions of files.
+    max_depth : int
+        How many levels of classes to look into, or None for no limit.
+    exported_only : bool
+        Whether to only check the definitions that modules export.
+    output_format : str
+        How to report findings, one of "text", "jsonl" or "sarif".
+    socket_path : str
+        The Unix socket the server listens on.
+    files : list
+        The files and directories to check.
+    """
+
+    paths, line_ranges = _find_paths(
+        files, exclude, no_gitignore, changed_since
+    )
+    # the server reads the files itself, so only their paths are sent
+    requested_files = [
+        {
+            "path": path,
+            "line_ranges": (
+                None if line_ranges is None else line_ranges.get(path, ())
             ),
-            fg="yellow",
+        }
+        for path in paths
+    ]
+    options = _options(
+        ignore_ambiguous_signatures, docstring_style, strict_parser
+    )
+    options.update(
+        prescan=prescan, max_depth=max_depth, exported_only=exported_only
+    )
+    from .server import default_socket_path, request_checks
+
+    results = request_checks(
+        socket_path or default_socket_path(),
+        requested_files,
+        options,
+        cache_dir=None if no_cache else os.path.abspath(cache_dir),
+    )
+    try:
+        failed = _report(results, output_format)
+    except (ConnectionError, RuntimeError) as error:
+        raise click.ClickException(str(error))
+    sys.exit(1 if failed else 0)
+
+
+@cli.command("lsp")
+@_options_of(_DOCSTRING_OPTIONS)
+@click.option(
+    "--debounce",
+    type=click.FloatRange(min=0),
+    default=0.3,
+    help="How many seconds a document has to stay unchanged to be checked.",
+    show_default=True,
+)
+def lsp_command(
+    ignore_ambiguous_signatures=False,
+    docstring_style="auto",
+    strict_parser=False,
+    debounce=0.3,
+):
+    """
+    Run a language server on stdin and stdout, for editors.
+
+    Parameters
+    ----------
+    ignore_ambiguous_signatures : bool
+        Whether to be strict on ambiguous function signatures
+    docstring_style : str
+        The style of docstrings, or "auto" to detect it per docstring.
+    strict_parser : bool
+        Whether to fully parse docstrings.
+    debounce : float
+        How many seconds a document has to stay unchanged to be checked.
+    """
+
+    from .lsp import LanguageServer
+
+    server = LanguageServer(
+        sys.stdout.buffer,
+        debounce,
+        **_options(ignore_ambiguous_signatures, docstring_style, strict_parser)
+    )
+    sys.exit(server.serve(sys.stdin.buffer))
+
+
+def _find_paths(
+    files: Iterable[str],
+    exclude: Iterable[str],
+    no_gitignore: bool,
+    changed_since: Optional[str],
+) -> Tuple[Iterator[str], Optional[Dict[str, List[Tuple[int, int]]]]]:
+    paths = find_files(
+        sorted(files),
+        exclude=DEFAULT_EXCLUDE + tuple(exclude),
+        use_gitignore=not no_gitignore,
+    )
+
+    line_ranges: Optional[Dict[str, List[Tuple[int, int]]]] = None
+    if changed_since is not None:
+        try:
+            changed = changed_lines(changed_since)
+        except RuntimeError as error:
+            raise click.ClickException(str(error))
+        line_ranges = {}
+        paths = _select_changed_paths(paths, changed, line_ranges)
+    return paths, line_ranges
+
+
+def _options(
+    ignore_ambiguous_signatures: bool,
+    docstring_style: str,
+    strict_parser: bool,
+) -> Dict[str, Any]:
+    return dict(
+        ignore_ambiguous_signatures=ignore_ambiguous_signatures,
+        docstring_style=None if docstring_style == "auto" else docstring_style,
+        strict_parser=strict_parser,
+    )
+
+
+def _recorded(
+    results: Iterable[List[Finding]], record: List[List[Finding]]
+) -> Iterator[List[Finding]]:
+    # pass on the findings of each file, keeping them in record as well
+    for findings in results:
+        record.append(findings)
+        yield findings
+
+
+def _report(
+    results: Iterable[List[Finding]],
+    output_format: str,
+    slow: Optional[List[Finding]] = None,
+) -> bool:
+    # report the findings for each file as it is checked, and return whether
+    # there were any. Definitions and files that were not checked in time
+    # are reported, and added to slow, but don't fail the run
+    reporter = REPORTERS[output_format]()
+    failed = False
+    for findings in results:
+        for finding in findings:
+            if not finding.over_budget:
+                failed = True
+            elif slow is not None:
+                slow.append(finding)
+        with timing.phase("report"):
+            reporter.report(findings)
+    reporter.finish(failed)
+    return failed
+
+
+def _report_slow(slow: List[Finding], slow_report: Optional[str]):
+    # tell what wasn't checked in time, and save it for a closer look
+    if slow:
+        click.echo(
+            "{} docstrings or files were not checked, as they took longer "
+            "than their time budget.".format(len(slow)),
+            err=True,
         )
+    if slow_report is not None:
+        with open(slow_report, "w") as f:
+            json.dump(
+                [
+                    {
+                        "file": finding.file,
+                        "line": finding.lineno,
+                        "col": finding.col,
+                        "qualname": finding.qualname,
+                        "over_budget": finding.over_budget,
+                    }
+                    for finding in slow
+                ],
+                f,
+                indent=2,
+            )
+
+
+def _select_changed_paths(
+    paths: Iterable[str],
+    changed: Dict[str, List[Tuple[int, int]]],
+    line_ranges: Dict[str, List[Tuple[int, int]]],
+) -> Iterator[str]:
+    # record the changed lines of each path before it is checked, so that
+    # line_ranges only grows with the size of the diff:
+    for path in paths:
+        real_path = os.path.realpath(path)
+        if real_path in changed:
+            line_ranges[path] = changed[real_path]
+            yield path
+
+
+def _index_and_check(
+    symbols: "SymbolIndex",
+    docstring_style: Optional[str],
+    strict_parser: bool,
+    check: Callable[[str, str], List[Finding]],
+    path: str,
+    source: str,
+) -> List[Finding]:
+    # classes added to or changed in a watched file take part in inheritance
+    symbols.refresh(path, source, docstring_style, strict_parser)
+    return check(path, source)
+
+
+def report_changes(watcher: "Watcher", changed: List[str]):
+    """Print the findings for files that were checked again.
+
+    Parameters
+    ----------
+    watcher : Watcher
+        The watcher that checked the files.
+    changed : List[str]
+        The files that changed.
+    """
+
+    for path in changed:
+        if path in watcher.errors:
+            error = watcher.errors[path]
+            if isinstance(error, SyntaxError):
+                message = "{}:{}:{}: could not parse: {}".format(
+                    path, error.lineno, error.offset, error.msg
+                )
+            else:
+                message = "{}: could not parse: {}".format(path, error)
+            click.secho(message, fg="red")
+        elif watcher.findings.get(path):
+            for finding in watcher.findings[path]:
+                cli_error(finding)
+        elif path in watcher.findings:
+            click.secho(
+                "{}: all arguments are documented ✓".format(path), fg="green"
+            )
 
 
 def color_text(text: str) -> str:
@@ -97,6 +928,8 @@ def color_text(text: str) -> str:
         The colored text.
     """
 
+    from colorama import Fore
+
     colored_text = []
     for line in text.split("\n"):
         if "Not in" in line:
@@ -0,0 +1,254 @@
+"""Find the python files to check in a set of files and directories."""
+
+import fnmatch
+import os
+import re
+from typing import Iterable, Iterator, List, NamedTuple, Pattern, Sequence
+
+DEFAULT_EXCLUDE = (
+    ".svn",
+    "CVS",
+    ".bzr",
+    ".hg",
+    ".git",
+    "__pycache__",
+    ".tox",
+    ".nox",
+    ".eggs",
+    "*.egg",
+)
+
+
+class IgnoreRule(NamedTuple):
+    """One pattern from a .gitignore file.
+
+    Parameters
+    ----------
+    base : str
+        The absolute path of the directory of the .gitignore file the pattern
+        is from.
+    pattern : Pattern
+        The compiled pattern, matched against paths relative to ``base``.
+    negate : bool
+        Whether the pattern re-includes paths ("!pattern").
+    directory_only : bool
+        Whether the pattern only matches directories ("pattern/").
+    """
+
+    base: str
+    pattern: Pattern
+    negate: bool
+    directory_only: bool
+
+
+def _translate(pattern: str) -> str:
+    regex = ""
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            regex += "(?:.*/)?"
+            i += 3
+        elif pattern.startswith("/**", i) and i + 3 == len(pattern):
+            regex += "/.*"
+            i += 3
+        elif pattern[i] == "*":
+            regex += "[^/]*"
+            i += 1
+        elif pattern[i] == "?":
+            regex += "[^/]"
+            i += 1
+        elif pattern[i] == "[" and pattern.find("]", i + 1) != -1:
+            start, end = i + 1, pattern.index("]", i + 1)
+            regex += "[" + pattern[start:end].replace("!", "^", 1) + "]"
+            i = end + 1
+        else:
+            regex += re.escape(pattern[i])
+            i += 1
+    return regex
+
+
+def read_gitignore(directory: str) -> List[IgnoreRule]:
+    """Read the rules in a directory's .gitignore file, if there is one.
+
+    Parameters
+    ----------
+    directory : str
+        The directory.
+
+    Returns
+    -------
+    List[IgnoreRule]
+    """
+
+    try:
+        with open(os.path.join(directory, ".gitignore"), "r") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return []
+
+    base = os.path.abspath(directory)
+    rules = []
+    for line in lines:
+        line = line.rstrip()
+        if not line or line.startswith("#"):
+            continue
+        negate = line.startswith("!")
+        line = line[1:] if negate else line
+        directory_only = line.endswith("/")
+        line = line.rstrip("/")
+        # patterns with a slash are relative to the .gitignore's directory,
+        # others can match at any depth:
+        anchored = "/" in line
+        regex = _translate(line.lstrip("/"))
+        if not anchored:
+            regex = "(?:.*/)?" + regex
+        rules.append(
+            IgnoreRule(base, re.compile(regex + "$"), negate, directory_only)
+        )
+    return rules
+
+
+def is_ignored(path: str, is_dir: bool, rules: Sequence[IgnoreRule]) -> bool:
+    """Check whether gitignore rules exclude a path.
+
+    Parameters
+    ----------
+    path : str
+        The absolute path.
+    is_dir : bool
+        Whether the path is a directory.
+    rules : Sequence[IgnoreRule]
+        The rules that apply, with later rules taking precedence.
+
+    Returns
+    -------
+    bool
+    """
+
+    ignored = False
+    for rule in rules:
+        if rule.directory_only and not is_dir:
+            continue
+        if not path.startswith(rule.base + os.sep):
+            continue
+        start = len(rule.base) + 1
+        relative = path[start:].replace(os.sep, "/")
+        if rule.pattern.match(relative):
+            ignored = not rule.negate
+    return ignored
+
+
+def is_excluded(path: str, exclude: Iterable[str]) -> bool:
+    """Check whether a path matches any exclude glob.
+
+    Parameters
+    ----------
+    path : str
+        The path.
+    exclude : Iterable[str]
+        Glob patterns, matched against both the name and the full path.
+
+    Returns
+    -------
+    bool
+    """
+
+    name = os.path.basename(os.path.normpath(path))
+    return any(
+        fnmatch.fnmatch(name, pattern) or fnmatch.fnmatch(path, pattern)
+        for pattern in exclude
+    )
+
+
+def _parent_gitignores(directory: str) -> List[IgnoreRule]:
+    # .gitignore files apply from the root of the repository downwards
+    parents = []
+    current = os.path.abspath(directory)
+    while not os.path.exists(os.path.join(current, ".git")):
+        parent = os.path.dirname(current)
+        if parent == current:
+            # not in a git repository
+            return []
+        current = parent
+        parents.append(current)
+    rules: List[IgnoreRule] = []
+    for parent in reversed(parents):
+        rules.extend(read_gitignore(parent))
+    return rules
+
+
+def _walk(
+    root: str, exclude: Sequence[str], use_gitignore: bool
+) -> Iterator[str]:
+    rules = _parent_gitignores(root) if use_gitignore else []
+    # a stack of (directory, its absolute path, the gitignore rules that
+    # apply in it):
+    stack = [(root, os.path.abspath(root), rules)]
+    while stack:
+        directory, absolute_directory, rules = stack.pop()
+        if use_gitignore:
+            rules = rules + read_gitignore(directory)
+        try:
+            with os.scandir(directory) as scanner:
+                entries = sorted(scanner, key=lambda entry: entry.name)
+        except OSError:
+            continue
+
+        subdirectories = []
+        for entry in entries:
+            # like os.walk, don't follow symlinks to directories, which may
+            # form a loop
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            if not is_dir and not entry.name.endswith(".py"):
+                continue
+            if is_excluded(entry.path, exclude):
+                continue
+            absolute_path = os.path.join(absolute_directory, entry.name)
+            if rules and is_ignored(absolute_path, is_dir, rules):
+                continue
+            if is_dir:
+                subdirectories.append((entry.path, absolute_path, rules))
+            else:
+                yield entry.path
+        # reversed, so that subdirectories are walked in order of their name
+        stack.extend(reversed(subdirectories))
+
+
+def find_files(
+    paths: Iterable[str],
+    exclude: Sequence[str] = DEFAULT_EXCLUDE,
+    use_gitignore: bool = True,
+) -> Iterator[str]:
+    """Find the python files in a set of files and directories.
+
+    Directories are searched recursively, and files are found lazily, so
+    that checking can start before the search is finished.
+
+    Parameters
+    ----------
+    paths : Iterable[str]
+        Files and directories. Files are always checked, whatever their
+        extension, unless they are excluded.
+    exclude : Sequence[str], optional
+        Glob patterns of files and directories to skip (the default is
+        `DEFAULT_EXCLUDE`, a list of version control and build directories).
+    use_gitignore : bool, optional
+        Whether to skip files and directories ignored by git (the default is
+        True).
+
+    Yields
+    ------
+    str
+        The path of a python file.
+    """
+
+    for path in paths:
+        if is_excluded(path, exclude):
+            continue
+        if os.path.isdir(path):
+            yield from _walk(path, exclude, use_gitignore)
+        else:
+            yield path
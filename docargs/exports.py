@@ -0,0 +1,236 @@
+"""Find the definitions a module exports, through `__all__` or its package.
+
+A module's ``__all__`` is resolved from the literal lists or tuples it is
+assigned, extended with ``+=``, ``extend`` or ``append``. A package's
+``__init__.py`` can also export definitions of its modules by importing
+them, which is how private modules such as ``_impl.py`` are made public.
+"""
+
+import ast
+import os
+import sys
+import tokenize
+from functools import lru_cache
+from typing import AbstractSet, Dict, FrozenSet, Optional, Set
+
+# the names a package imports with ``from .module import *``:
+ALL = "*"
+
+
+def _is_all(node: ast.AST) -> bool:
+    return isinstance(node, ast.Name) and node.id == "__all__"
+
+
+def _string(node: ast.AST) -> Optional[str]:
+    # the value of a string literal, which python 3.6 and 3.7 parse as Str
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    if sys.version_info < (3, 8) and isinstance(node, ast.Str):
+        return node.s
+    return None
+
+
+def _literal_names(node: Optional[ast.AST]) -> Optional[Set[str]]:
+    # the strings in a literal list, tuple or set, or a sum of them
+    if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+        names = set()
+        for element in node.elts:
+            name = _string(element)
+            if name is None:
+                return None
+            names.add(name)
+        return names
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        left = _literal_names(node.left)
+        right = _literal_names(node.right)
+        if left is None or right is None:
+            return None
+        return left | right
+    return None
+
+
+def module_exports(module: ast.Module) -> Optional[Set[str]]:
+    """Resolve the ``__all__`` of a module.
+
+    Parameters
+    ----------
+    module : ast.Module
+        The module.
+
+    Returns
+    -------
+    Optional[Set[str]]
+        The names in ``__all__``, or None if the module doesn't set it at the
+        top level, or sets it to something other than literals.
+    """
+
+    names: Optional[Set[str]] = None
+    for statement in module.body:
+        added: Optional[Set[str]] = set()
+        if isinstance(statement, ast.Assign) and any(
+            _is_all(target) for target in statement.targets
+        ):
+            names = set()
+            added = _literal_names(statement.value)
+        elif isinstance(statement, ast.AnnAssign) and _is_all(
+            statement.target
+        ):
+            names = set()
+            added = _literal_names(statement.value)
+        elif (
+            isinstance(statement, ast.AugAssign)
+            and _is_all(statement.target)
+            and isinstance(statement.op, ast.Add)
+        ):
+            added = _literal_names(statement.value)
+        elif (
+            isinstance(statement, ast.Expr)
+            and isinstance(statement.value, ast.Call)
+            and isinstance(statement.value.func, ast.Attribute)
+            and _is_all(statement.value.func.value)
+            and len(statement.value.args) == 1
+        ):
+            method = statement.value.func.attr
+            argument = statement.value.args[0]
+            if method == "extend":
+                added = _literal_names(argument)
+            elif method == "append":
+                added = _literal_names(ast.List(elts=[argument]))
+        else:
+            continue
+        if names is None or added is None:
+            return None
+        names |= added
+    return names
+
+
+def package_reexports(init: ast.Module, package: str) -> Dict[str, Set[str]]:
+    """Find the names that a package's ``__init__`` exports from its modules.
+
+    Parameters
+    ----------
+    init : ast.Module
+        The package's ``__init__`` module.
+    package : str
+        The name of the package, for absolute imports from it.
+
+    Returns
+    -------
+    Dict[str, Set[str]]
+        The names each module of the package defines that the package
+        exports, by the name of the module. `ALL` stands for all public
+        names, imported with ``*``.
+    """
+
+    exported = module_exports(init)
+    reexports: Dict[str, Set[str]] = {}
+    for statement in init.body:
+        if not isinstance(statement, ast.ImportFrom) or not statement.module:
+            continue
+        if statement.level == 1:
+            module = statement.module
+        elif statement.level == 0 and statement.module.startswith(
+            package + "."
+        ):
+            start = len(package) + 1
+            module = statement.module[start:]
+        else:
+            continue
+        for alias in statement.names:
+            name = alias.asname or alias.name
+            if alias.name == ALL or (
+                name in exported
+                if exported is not None
+                else not name.startswith("_")
+            ):
+                reexports.setdefault(module, set()).add(alias.name)
+    return reexports
+
+
+@lru_cache(maxsize=256)
+def _read_reexports(
+    init_path: str, modified: int
+) -> Dict[str, FrozenSet[str]]:
+    # the re-exports of an __init__.py, which is read again if it changes
+    try:
+        with tokenize.open(init_path) as f:
+            init = ast.parse(f.read(), filename=init_path)
+    except (OSError, SyntaxError, UnicodeDecodeError):
+        return {}
+    package = os.path.basename(os.path.dirname(os.path.abspath(init_path)))
+    return {
+        module: frozenset(names)
+        for module, names in package_reexports(init, package).items()
+    }
+
+
+def reexported_names(path: str) -> FrozenSet[str]:
+    """Find the names a module's package exports from it.
+
+    Parameters
+    ----------
+    path : str
+        The module's file.
+
+    Returns
+    -------
+    FrozenSet[str]
+        The exported names, including `ALL` if the package imports all of
+        them. Empty if the module is not in a package.
+    """
+
+    init_path = os.path.join(os.path.dirname(path), "__init__.py")
+    try:
+        modified = os.stat(init_path).st_mtime_ns
+    except OSError:
+        return frozenset()
+    module = os.path.splitext(os.path.basename(path))[0]
+    return _read_reexports(init_path, modified).get(module, frozenset())
+
+
+def is_private_module(name: str) -> bool:
+    """Whether a module only exports what its package imports from it.
+
+    Parameters
+    ----------
+    name : str
+        The name of the module, such as "_impl" or "__init__".
+
+    Returns
+    -------
+    bool
+    """
+
+    return name.startswith("_") and name != "__init__"
+
+
+def exported_names(
+    module: ast.Module, reexported: AbstractSet[str], name: str
+) -> Optional[Set[str]]:
+    """Combine a module's ``__all__`` with what its package exports of it.
+
+    Parameters
+    ----------
+    module : ast.Module
+        The module.
+    reexported : AbstractSet[str]
+        The names its package exports from it (see `reexported_names`).
+    name : str
+        The name of the module, such as "_impl" or "__init__".
+
+    Returns
+    -------
+    Optional[Set[str]]
+        The names of the module's exported definitions, or None if all of
+        its public definitions are exported.
+    """
+
+    own = module_exports(module)
+    if ALL in reexported and own is None:
+        return None
+    if own is not None:
+        return own | (reexported - {ALL})
+    if is_private_module(name):
+        # private modules only export what their package imports
+        return set(reexported)
+    return None
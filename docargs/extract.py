@@ -0,0 +1,118 @@
+"""Find the names of documented parameters by scanning docstring lines."""
+
+import re
+from typing import Iterator, List, Optional, Pattern
+
+from .styles import EPYDOC, GOOGLE, NUMPY, REST
+
+_NUMPY_SECTIONS = ("Parameters",)
+_GOOGLE_SECTIONS = (
+    "Args",
+    "Arguments",
+    "Parameters",
+    "Params",
+    "Keyword Args",
+    "Keyword Arguments",
+)
+_UNDERLINE = re.compile(r"^[ \t]*-{3,}[ \t]*$")
+_REST_FIELD = re.compile(
+    r"^[ \t]*:(?:param|parameter|arg|argument|key|keyword)\s+([^:]+):"
+)
+_EPYDOC_FIELD = re.compile(r"^[ \t]*@(?:param|keyword)\s+([^:\s]+)\s*:")
+
+
+def _indentation(line: str) -> int:
+    return len(line) - len(line.lstrip())
+
+
+def _is_numpy_header(lines: List[str], index: int) -> bool:
+    return (
+        index + 1 < len(lines)
+        and lines[index].strip() != ""
+        and _UNDERLINE.match(lines[index + 1]) is not None
+    )
+
+
+def _numpy_params(lines: List[str]) -> Iterator[str]:
+    index = 0
+    while index < len(lines):
+        if not (
+            _is_numpy_header(lines, index)
+            and lines[index].strip() in _NUMPY_SECTIONS
+        ):
+            index += 1
+            continue
+
+        indent = _indentation(lines[index])
+        index += 2
+        while index < len(lines) and not _is_numpy_header(lines, index):
+            line = lines[index]
+            if line.strip() and _indentation(line) <= indent:
+                names = line.split(":", 1)[0]
+                for name in names.split(","):
+                    if name.strip():
+                        yield name.strip()
+            index += 1
+
+
+def _google_params(lines: List[str]) -> Iterator[str]:
+    section_indent: Optional[int] = None
+    item_indent: Optional[int] = None
+    for line in lines:
+        stripped = line.strip()
+        if not stripped:
+            continue
+        indent = _indentation(line)
+
+        if section_indent is not None and indent <= section_indent:
+            section_indent = None
+        if section_indent is None:
+            if stripped.endswith(":") and stripped[:-1] in _GOOGLE_SECTIONS:
+                section_indent, item_indent = indent, None
+            continue
+
+        if item_indent is None:
+            item_indent = indent
+        if indent == item_indent:
+            name = stripped.split(":", 1)[0].split("(", 1)[0].strip()
+            if name:
+                yield name
+
+
+def _field_params(lines: List[str], field: Pattern) -> Iterator[str]:
+    for line in lines:
+        match = field.match(line)
+        if match is not None:
+            # the name is the last word, after an optional type:
+            yield match.group(1).split()[-1].replace("\\", "")
+
+
+def extract_params(docstring: str, style: Optional[str]) -> Iterator[str]:
+    """Find the names of the parameters documented in a docstring.
+
+    Unlike the parsers in numpydoc and docstring_parser, this only looks at
+    the lines of the parameter sections, and ignores everything else.
+
+    Parameters
+    ----------
+    docstring : str
+        The docstring, with indentation removed.
+    style : str, optional
+        The style the docstring is written in, one of "numpy", "google",
+        "rest" or "epydoc". If None, no parameters are found.
+
+    Yields
+    ------
+    str
+        The name of a documented parameter.
+    """
+
+    lines = docstring.splitlines()
+    if style == NUMPY:
+        yield from _numpy_params(lines)
+    elif style == GOOGLE:
+        yield from _google_params(lines)
+    elif style == REST:
+        yield from _field_params(lines, _REST_FIELD)
+    elif style == EPYDOC:
+        yield from _field_params(lines, _EPYDOC_FIELD)
@@ -0,0 +1,222 @@
+"""Reuse the findings of definitions whose signatures and docstrings match.
+
+A definition's findings only depend on the signatures and docstrings of the
+functions and classes in it, so they can be reused when its body, or another
+part of its file, changes. This lets long-running checks (watch mode, the
+server and the language server) re-check only the definitions that changed.
+"""
+
+import ast
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import (
+    Container,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .check import check
+from .identify import is_private
+
+# how many definitions to remember the findings of:
+DEFAULT_MAX_DEFINITIONS = 65536
+
+DEFINITION_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+Definition = Union[ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef]
+
+# findings as (index in `definitions`, under, over):
+Rows = List[Tuple[int, Optional[List[str]], Optional[List[str]]]]
+
+
+def definitions(node: Definition) -> List[Definition]:
+    """List a definition and the definitions in it that `check` looks at.
+
+    Parameters
+    ----------
+    node : Definition
+        A function or class definition.
+
+    Returns
+    -------
+    List[Definition]
+        The definition, followed by its methods and nested classes (and
+        theirs), in order.
+    """
+
+    found: List[Definition] = [node]
+    if isinstance(node, ast.ClassDef):
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, DEFINITION_TYPES):
+                found.extend(definitions(child))
+    return found
+
+
+def fingerprint(node: Definition) -> str:
+    """Hash the signatures and docstrings of a definition.
+
+    Parameters
+    ----------
+    node : Definition
+        A function or class definition.
+
+    Returns
+    -------
+    str
+    """
+
+    digest = hashlib.sha1()
+    for definition in definitions(node):
+        parts = [type(definition).__name__, getattr(definition, "name", "")]
+        arguments = getattr(definition, "args", None)
+        if arguments is not None:
+            parts += [argument.arg for argument in arguments.args]
+            parts.append("*")
+            parts += [argument.arg for argument in arguments.kwonlyargs]
+            parts.append(str(arguments.vararg is not None))
+            parts.append(str(arguments.kwarg is not None))
+        parts.append(ast.get_docstring(definition) or "")
+        # separate the parts with characters that can't occur in them:
+        digest.update("\0".join(parts).encode("utf-8", "surrogatepass"))
+        digest.update(b"\1")
+    return digest.hexdigest()
+
+
+class DefinitionCache:
+    """A bounded, least-recently-used store of findings by fingerprint.
+
+    It can be shared between threads, such as those of the server.
+
+    Parameters
+    ----------
+    max_size : int, optional
+        How many definitions to remember (the default is 65536).
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_DEFINITIONS):
+        self.max_size = max_size
+        self.entries: "OrderedDict[Tuple[str, str], Rows]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, key: Tuple[str, str]) -> Optional[Rows]:
+        """Look up the findings of a definition.
+
+        Parameters
+        ----------
+        key : Tuple[str, str]
+            The definition's fingerprint, and the options it was checked
+            with.
+
+        Returns
+        -------
+        Optional[Rows]
+            The findings, or None if they aren't known.
+        """
+
+        with self.lock:
+            rows = self.entries.get(key)
+            if rows is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return rows
+
+    def put(self, key: Tuple[str, str], rows: Rows):
+        """Store the findings of a definition.
+
+        Parameters
+        ----------
+        key : Tuple[str, str]
+            The definition's fingerprint, and the options it was checked
+            with.
+        rows : Rows
+            The findings.
+        """
+
+        with self.lock:
+            self.entries[key] = rows
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+
+def check_definitions(
+    module: ast.Module,
+    cache: DefinitionCache,
+    ignore_ambiguous_signatures: bool = True,
+    docstring_style: Optional[str] = None,
+    strict_parser: bool = False,
+    max_depth: Optional[int] = None,
+    names: Optional[Container[str]] = None,
+) -> Iterator[Tuple[ast.AST, Optional[List[str]], Optional[List[str]]]]:
+    """Check a module like `check`, reusing the findings of definitions.
+
+    Parameters
+    ----------
+    module : ast.Module
+        The module.
+    cache : DefinitionCache
+        The findings of definitions checked before.
+    ignore_ambiguous_signatures : bool, optional
+        Whether to ignore extra documented arguments if the function has an
+        ambiguous (*args / **kwargs) signature (the default is True).
+    docstring_style : str, optional
+        The style all docstrings are written in. If None (the default), it is
+        detected for each docstring.
+    strict_parser : bool, optional
+        Whether to fully parse docstrings with numpydoc or docstring_parser
+        (the default is False).
+    max_depth : int, optional
+        How many levels of classes to look into. If None (the default), there
+        is no limit.
+    names : Container[str], optional
+        If given, only check the module-level functions and classes with
+        these names, whether or not they are private.
+
+    Yields
+    ------
+    ast.FunctionDef
+        A function or method.
+    List[str]
+        Parameters in the signature but not in the docstring.
+    List[str]
+        Parameters in the docstring but not in the signature.
+    """
+
+    options = (
+        ignore_ambiguous_signatures,
+        docstring_style,
+        strict_parser,
+        max_depth,
+    )
+    options_key = repr(options)
+    for node in module.body:
+        if not isinstance(node, DEFINITION_TYPES) or (
+            is_private(node) if names is None else node.name not in names
+        ):
+            continue
+        key = (fingerprint(node), options_key)
+        nodes = definitions(node)
+        rows = cache.get(key)
+        if rows is None:
+            index: Dict[int, int] = {
+                id(definition): i for i, definition in enumerate(nodes)
+            }
+            rows = [
+                (index[id(statement)], underdocumented, overdocumented)
+                for statement, underdocumented, overdocumented in check(
+                    node, *options
+                )
+            ]
+            if all(under is not None for _, under, _ in rows):
+                # a docstring over its time budget is parsed again next time
+                cache.put(key, rows)
+        for i, underdocumented, overdocumented in rows:
+            yield nodes[i], underdocumented, overdocumented
@@ -1,14 +1,14 @@
 import ast
 
-from flake8 import utils as stdin_utils
-
-from .check import check
+from .styles import STYLES
 from .version import version
 
 
 class DocargsChecker:
     name = "flake8_docargs"
     version = version
+    docstring_style = None
+    strict_parser = False
 
     def __init__(self, tree: ast.AST, filename):
         """Create a DocargsChecker
@@ -24,13 +24,63 @@ class DocargsChecker:
         self.tree = tree
         self.filename = filename
 
+    @classmethod
+    def add_options(cls, parser):
+        """Register docargs' options with flake8.
+
+        Parameters
+        ----------
+        parser : flake8.options.manager.OptionManager
+            The flake8 option manager.
+        """
+
+        parser.add_option(
+            "--docargs-docstring-style",
+            choices=("auto",) + STYLES,
+            default="auto",
+            parse_from_config=True,
+            help=(
+                "The style all docstrings are written in. By default, it is "
+                "detected for each docstring."
+            ),
+        )
+        parser.add_option(
+            "--docargs-strict-parser",
+            action="store_true",
+            parse_from_config=True,
+            help=(
+                "Fully parse docstrings with numpydoc or docstring_parser, "
+                "rather than only scanning their parameter sections."
+            ),
+        )
+
+    @classmethod
+    def parse_options(cls, options):
+        """Read docargs' options from the parsed flake8 options.
+
+        Parameters
+        ----------
+        options : argparse.Namespace
+            The flake8 options.
+        """
+
+        style = options.docargs_docstring_style
+        cls.docstring_style = None if style == "auto" else style
+        cls.strict_parser = options.docargs_strict_parser
+
     def run(self):
-        tree = self.tree
-        if self.filename == "stdin":
-            lines = stdin_utils.stdin_get_value()
-            tree = ast.parse(lines)
+        # only import the checks once a file is actually checked, so that
+        # registering the plugin doesn't slow down flake8's startup
+        from .check import check
 
-        for statement, underdocumented, overdocumented in check(tree):
+        # flake8 builds the tree from stdin too, so it is never parsed again
+        # here. The plugin keeps no state between files, which lets flake8
+        # run it in worker processes, where options reach parse_options.
+        for statement, underdocumented, overdocumented in check(
+            self.tree,
+            docstring_style=self.docstring_style,
+            strict_parser=self.strict_parser,
+        ):
             for error in self.error(
                 statement, underdocumented, overdocumented
             ):
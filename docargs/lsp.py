@@ -0,0 +1,396 @@
+"""Publish docargs findings as diagnostics over the Language Server Protocol.
+
+``docargs lsp`` talks JSON-RPC over stdin and stdout. It keeps the text of
+each open document, and remembers the findings of each top-level function
+and class by the fingerprint of its signatures and docstrings, so that after
+an edit only the definitions that changed are checked again. Diagnostics
+are published once a document has not changed for a short while.
+"""
+
+import ast
+import io
+import json
+import threading
+from typing import IO, Any, Dict, List, Optional
+
+from .fingerprint import DefinitionCache, check_definitions
+from .report import OVERDOCUMENTED, UNDERDOCUMENTED
+from .run import Finding, to_finding
+from .version import version
+
+# LSP constants:
+_INCREMENTAL_SYNC = 2
+_WARNING = 2
+_METHOD_NOT_FOUND = -32601
+
+
+def read_message(stream: IO[bytes]) -> Optional[Dict[str, Any]]:
+    """Read one JSON-RPC message.
+
+    Parameters
+    ----------
+    stream : IO[bytes]
+        The stream to read from.
+
+    Returns
+    -------
+    Optional[Dict[str, Any]]
+        The message, or None at the end of the stream.
+    """
+
+    length = None
+    while True:
+        line = stream.readline()
+        if not line:
+            return None
+        line = line.strip()
+        if not line:
+            break
+        name, _, value = line.decode("ascii").partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    if length is None:
+        return None
+    return json.loads(stream.read(length).decode("utf-8"))
+
+
+def write_message(stream: IO[bytes], message: Dict[str, Any]):
+    """Write one JSON-RPC message.
+
+    Parameters
+    ----------
+    stream : IO[bytes]
+        The stream to write to.
+    message : Dict[str, Any]
+        The message.
+    """
+
+    body = json.dumps(message).encode("utf-8")
+    stream.write(b"Content-Length: %d\r\n\r\n" % len(body) + body)
+    stream.flush()
+
+
+def _lines(text: str) -> List[str]:
+    # split at "\n", "\r\n" and "\r" only, as both LSP and python do
+    return io.StringIO(text, newline="").readlines()
+
+
+def _index(line: str, character: int) -> int:
+    # LSP counts characters in UTF-16 code units
+    encoded = line.encode("utf-16-le")[: 2 * character]
+    return len(encoded.decode("utf-16-le", errors="ignore"))
+
+
+class Document:
+    """An open document, and the findings of its definitions.
+
+    Parameters
+    ----------
+    uri : str
+        The document's URI.
+    text : str
+        The document's text.
+    version : int
+        The document's version.
+    """
+
+    def __init__(self, uri: str, text: str, version: int):
+        self.uri = uri
+        self.text = text
+        self.version = version
+
+    def apply_change(self, change: Dict[str, Any]):
+        """Apply a change from a ``didChange`` notification.
+
+        Parameters
+        ----------
+        change : Dict[str, Any]
+            The change: either the whole new text, or a range and the text
+            to replace it with.
+        """
+
+        if "range" not in change:
+            self.text = change["text"]
+            return
+        lines = _lines(self.text)
+        if not lines or lines[-1].endswith(("\n", "\r")):
+            lines.append("")
+
+        def offset(position: Dict[str, int]) -> int:
+            line = min(position["line"], len(lines) - 1)
+            start = sum(len(previous) for previous in lines[:line])
+            return start + _index(lines[line], position["character"])
+
+        start = offset(change["range"]["start"])
+        end = offset(change["range"]["end"])
+        self.text = self.text[:start] + change["text"] + self.text[end:]
+
+    def check(self, definitions: DefinitionCache, **options) -> List[Finding]:
+        """Parse the document, and check the definitions that changed.
+
+        Parameters
+        ----------
+        definitions : DefinitionCache
+            The findings of definitions checked before.
+        **options
+            Passed on to `check_definitions`.
+
+        Returns
+        -------
+        List[Finding]
+            The findings in the whole document.
+
+        Raises
+        ------
+        SyntaxError
+            If the document can't be parsed.
+        """
+
+        tree = ast.parse(self.text)
+        findings = [
+            to_finding(self.uri, node, underdocumented, overdocumented)
+            for node, underdocumented, overdocumented in check_definitions(
+                tree, definitions, **options
+            )
+            if underdocumented or overdocumented
+        ]
+        return sorted(findings)
+
+
+def to_diagnostics(finding: Finding) -> List[Dict[str, Any]]:
+    """Turn a finding into LSP diagnostics, one for each kind of mismatch.
+
+    Parameters
+    ----------
+    finding : Finding
+        The finding.
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+    """
+
+    line = finding.lineno - 1
+    diagnostics = []
+    for code, message, parameters in (
+        ("D001", UNDERDOCUMENTED, finding.under),
+        ("D002", OVERDOCUMENTED, finding.over),
+    ):
+        if parameters:
+            diagnostics.append(
+                {
+                    "range": {
+                        "start": {"line": line, "character": finding.col},
+                        "end": {"line": line + 1, "character": 0},
+                    },
+                    "severity": _WARNING,
+                    "code": code,
+                    "source": "docargs",
+                    "message": message.format(", ".join(parameters)),
+                }
+            )
+    return diagnostics
+
+
+class LanguageServer:
+    """Check documents for an editor, and publish their diagnostics.
+
+    Parameters
+    ----------
+    output : IO[bytes]
+        The stream to write messages to.
+    debounce : float, optional
+        How many seconds a document has to stay unchanged before it is
+        checked (the default is 0.3). With 0, documents are checked as soon
+        as they change.
+    **options
+        Passed on to `check_definitions`.
+    """
+
+    def __init__(self, output: IO[bytes], debounce: float = 0.3, **options):
+        self.output = output
+        self.debounce = debounce
+        self.options = options
+        self.definitions = DefinitionCache()
+        self.documents: Dict[str, Document] = {}
+        self.timers: Dict[str, threading.Timer] = {}
+        self.lock = threading.RLock()
+        self.shutdown = False
+
+    def serve(self, input: IO[bytes]) -> int:
+        """Handle messages until the client asks the server to exit.
+
+        Parameters
+        ----------
+        input : IO[bytes]
+            The stream to read messages from.
+
+        Returns
+        -------
+        int
+            The exit code: 0 if the client asked to shut down first.
+        """
+
+        try:
+            while True:
+                message = read_message(input)
+                if message is None or message.get("method") == "exit":
+                    break
+                with self.lock:
+                    self.handle(message)
+        finally:
+            with self.lock:
+                for timer in self.timers.values():
+                    timer.cancel()
+        return 0 if self.shutdown else 1
+
+    def handle(self, message: Dict[str, Any]):
+        """Handle one request or notification.
+
+        Parameters
+        ----------
+        message : Dict[str, Any]
+            The message.
+        """
+
+        method = message.get("method")
+        params = message.get("params", {})
+        result: Any = None
+        if method == "initialize":
+            result = {
+                "capabilities": {
+                    "textDocumentSync": {
+                        "openClose": True,
+                        "change": _INCREMENTAL_SYNC,
+                    }
+                },
+                "serverInfo": {"name": "docargs", "version": version},
+            }
+        elif method == "shutdown":
+            self.shutdown = True
+        elif method == "textDocument/didOpen":
+            document = params["textDocument"]
+            self.documents[document["uri"]] = Document(
+                document["uri"], document["text"], document["version"]
+            )
+            self.schedule(document["uri"])
+        elif method == "textDocument/didChange":
+            document = self.documents.get(params["textDocument"]["uri"])
+            if document is not None:
+                for change in params["contentChanges"]:
+                    document.apply_change(change)
+                document.version = params["textDocument"]["version"]
+                self.schedule(document.uri)
+        elif method == "textDocument/didClose":
+            uri = params["textDocument"]["uri"]
+            self.documents.pop(uri, None)
+            timer = self.timers.pop(uri, None)
+            if timer is not None:
+                timer.cancel()
+            self.publish(uri, [])
+        elif "id" in message:
+            self.send(
+                {
+                    "jsonrpc": "2.0",
+                    "id": message["id"],
+                    "error": {
+                        "code": _METHOD_NOT_FOUND,
+                        "message": "Unknown method {}".format(method),
+                    },
+                }
+            )
+            return
+
+        if "id" in message:
+            self.send(
+                {"jsonrpc": "2.0", "id": message["id"], "result": result}
+            )
+
+    def schedule(self, uri: str):
+        """Check a document once it stops changing.
+
+        Parameters
+        ----------
+        uri : str
+            The document's URI.
+        """
+
+        timer = self.timers.pop(uri, None)
+        if timer is not None:
+            timer.cancel()
+        if self.debounce <= 0:
+            self.check(uri)
+            return
+        timer = threading.Timer(self.debounce, self.check, (uri,))
+        timer.daemon = True
+        self.timers[uri] = timer
+        timer.start()
+
+    def check(self, uri: str):
+        """Check a document, and publish its diagnostics.
+
+        While a document has syntax errors, its last diagnostics are kept.
+
+        Parameters
+        ----------
+        uri : str
+            The document's URI.
+        """
+
+        with self.lock:
+            document = self.documents.get(uri)
+            if document is None:
+                return
+            try:
+                findings = document.check(self.definitions, **self.options)
+            except SyntaxError:
+                return
+            self.publish(uri, findings, document.version)
+
+    def publish(
+        self,
+        uri: str,
+        findings: List[Finding],
+        version: Optional[int] = None,
+    ):
+        """Publish the diagnostics of a document.
+
+        Parameters
+        ----------
+        uri : str
+            The document's URI.
+        findings : List[Finding]
+            The document's findings.
+        version : int, optional
+            The version of the document that was checked.
+        """
+
+        params: Dict[str, Any] = {
+            "uri": uri,
+            "diagnostics": [
+                diagnostic
+                for finding in findings
+                for diagnostic in to_diagnostics(finding)
+            ],
+        }
+        if version is not None:
+            params["version"] = version
+        self.send(
+            {
+                "jsonrpc": "2.0",
+                "method": "textDocument/publishDiagnostics",
+                "params": params,
+            }
+        )
+
+    def send(self, message: Dict[str, Any]):
+        """Send a message to the client.
+
+        Parameters
+        ----------
+        message : Dict[str, Any]
+            The message.
+        """
+
+        with self.lock:
+            write_message(self.output, message)
@@ -0,0 +1,126 @@
+"""Parse only the public top-level definitions of a module, when it is safe.
+
+`check` only looks at public top-level functions and classes (and
+``__all__``, to know which are exported), so everything else in a module,
+such as large data literals or private helpers, doesn't need to be parsed.
+Top-level definitions always start at the beginning of a line, so a cheap
+scan of the lines finds them. The rest of the module is blanked out, keeping
+line numbers, and the result is parsed. If the scan
+could have been misled, for example by a definition-like line in a
+multi-line string, or if the reduced source doesn't parse, the whole module
+is parsed instead.
+"""
+
+import ast
+import re
+from typing import AbstractSet, List, Optional, Tuple
+
+# the first line of a top-level statement, which isn't indented, blank, a
+# comment or the closing bracket of an earlier line, after its line break
+# (searching for the line break is much faster than for the start of a line):
+_STATEMENT = re.compile(r"\n([^\s#)\]}].*)")
+_DEFINITION = re.compile(r"(?:async[ \t]+def|def|class)[ \t]+(\w+)")
+_ALL = re.compile(r"__all__\b")
+# line breaks that `_STATEMENT` doesn't see, and form feeds, which can indent
+# a top-level definition:
+_AMBIGUOUS = re.compile(r"\r(?!\n)|\f")
+
+
+def reduce_source(
+    source: str, keep: AbstractSet[str] = frozenset()
+) -> Optional[str]:
+    """Blank out all lines but public top-level definitions and ``__all__``.
+
+    Parameters
+    ----------
+    source : str
+        The source code of a module.
+    keep : AbstractSet[str], optional
+        Names of private definitions to keep as well, such as those in
+        ``__all__`` (the default is none).
+
+    Returns
+    -------
+    Optional[str]
+        The reduced source code, with the same line numbers, or None if the
+        scan was ambiguous and the whole module needs to be parsed.
+    """
+
+    if _AMBIGUOUS.search(source):
+        return None
+
+    # (start, end) offsets of the definitions to keep:
+    kept: List[Tuple[int, int]] = []
+    decorated_from = None
+    # with a line break in front of the source, each match starts at the
+    # offset of its line in the source:
+    statements = list(_STATEMENT.finditer("\n" + source))
+    starts = [statement.start() for statement in statements]
+    for statement, start, end in zip(
+        statements, starts, starts[1:] + [len(source)]
+    ):
+        line = statement.group(1)
+        if line.startswith("@"):
+            if decorated_from is None:
+                decorated_from = start
+            continue
+        match = _DEFINITION.match(line)
+        if (
+            match is not None
+            and (not match.group(1).startswith("_") or match.group(1) in keep)
+        ) or _ALL.match(line):
+            kept.append(
+                (start if decorated_from is None else decorated_from, end)
+            )
+        decorated_from = None
+
+    reduced: List[str] = []
+    blanked_from = 0
+    for start, end in kept:
+        blanked = source[blanked_from:start]
+        if _opens_string(blanked):
+            return None
+        reduced.append("\n" * blanked.count("\n"))
+        reduced.append(source[start:end])
+        blanked_from = end
+    return "".join(reduced)
+
+
+def _opens_string(text: str) -> bool:
+    # whether blanked out text may have left a multi-line string open, so
+    # that the next kept line is really inside the string
+    return text.count('"""') % 2 == 1 or text.count("'''") % 2 == 1
+
+
+def parse_definitions(
+    source: str,
+    filename: str = "<unknown>",
+    keep: AbstractSet[str] = frozenset(),
+) -> ast.Module:
+    """Parse a module's public top-level definitions, or the whole module.
+
+    Parameters
+    ----------
+    source : str
+        The source code of the module.
+    filename : str, optional
+        The name of the file, for syntax errors.
+    keep : AbstractSet[str], optional
+        Names of private definitions to parse as well (the default is none).
+
+    Returns
+    -------
+    ast.Module
+        A module with at least the public top-level definitions, at their
+        original lines.
+    """
+
+    reduced = reduce_source(source, keep)
+    if reduced is not None:
+        if not reduced:
+            return ast.Module(body=[], type_ignores=[])
+        try:
+            return ast.parse(reduced, filename=filename)
+        except SyntaxError:
+            pass
+    return ast.parse(source, filename=filename)
@@ -0,0 +1,240 @@
+"""Report findings as text, JSON Lines or SARIF."""
+
+import json
+import os
+from typing import Any, Dict, List, Type, Union
+
+import click
+
+from .run import Finding
+from .version import version
+
+UNDERDOCUMENTED = "These parameters are not documented: {}"
+OVERDOCUMENTED = (
+    "These parameters are documented but not in the function signature: {}"
+)
+OVER_BUDGET = "Not checked: its {} took longer than the time budget"
+
+
+def cli_error(finding: Finding):
+    """Print a finding.
+
+    Parameters
+    ----------
+    finding : Finding
+        The mismatch between signature and docstring to report.
+    """
+    click.echo("{}:{}:{}: ".format(finding.file, finding.lineno, finding.col))
+    if finding.over_budget:
+        click.secho(OVER_BUDGET.format(finding.over_budget), fg="yellow")
+    if len(finding.under) > 0:
+        click.secho(
+            UNDERDOCUMENTED.format(", ".join(finding.under)),
+            fg="red",
+        )
+    if len(finding.over) > 0:
+        click.secho(
+            OVERDOCUMENTED.format(", ".join(finding.over)),
+            fg="yellow",
+        )
+
+
+class TextReporter:
+    """Print findings for people to read."""
+
+    def __init__(self) -> None:
+        self.over_budget = False
+
+    def report(self, findings: List[Finding]):
+        """Report the findings for one file.
+
+        Parameters
+        ----------
+        findings : List[Finding]
+            The findings.
+        """
+        for finding in findings:
+            self.over_budget = self.over_budget or bool(finding.over_budget)
+            cli_error(finding)
+
+    def finish(self, failed: bool):
+        """Finish the report after all files were checked.
+
+        Parameters
+        ----------
+        failed : bool
+            Whether there were any findings.
+        """
+        if not failed and not self.over_budget:
+            click.secho("All arguments are documented ✓", fg="green")
+
+
+def finding_to_json(finding: Finding) -> Dict[str, Any]:
+    """Turn a finding into a JSON-serialisable dictionary.
+
+    Parameters
+    ----------
+    finding : Finding
+        The finding.
+
+    Returns
+    -------
+    Dict[str, Any]
+        With an "over_budget" key only if the definition was not checked.
+    """
+
+    record = {
+        "file": finding.file,
+        "line": finding.lineno,
+        "col": finding.col,
+        "underdocumented": list(finding.under),
+        "overdocumented": list(finding.over),
+    }
+    if finding.over_budget:
+        record["over_budget"] = finding.over_budget
+    return record
+
+
+class JsonLinesReporter:
+    """Write one JSON object per finding, as soon as its file is checked."""
+
+    def report(self, findings: List[Finding]):
+        """Report the findings for one file.
+
+        Parameters
+        ----------
+        findings : List[Finding]
+            The findings.
+        """
+        for finding in findings:
+            click.echo(json.dumps(finding_to_json(finding)))
+
+    def finish(self, failed: bool):
+        """Finish the report after all files were checked.
+
+        Parameters
+        ----------
+        failed : bool
+            Whether there were any findings.
+        """
+
+
+SARIF_RULES = [
+    {
+        "id": "D001",
+        "name": "UndocumentedParameter",
+        "shortDescription": {"text": "Parameters are not documented."},
+    },
+    {
+        "id": "D002",
+        "name": "DocumentedParameterNotInSignature",
+        "shortDescription": {
+            "text": "Documented parameters are not in the signature."
+        },
+    },
+    {
+        "id": "D003",
+        "name": "OverTimeBudget",
+        "shortDescription": {
+            "text": "Checking took longer than the time budget."
+        },
+    },
+]
+
+
+class SarifReporter:
+    """Write all findings as one SARIF 2.1.0 document."""
+
+    def __init__(self) -> None:
+        self.results: List[Dict[str, Any]] = []
+
+    def report(self, findings: List[Finding]):
+        """Report the findings for one file.
+
+        Parameters
+        ----------
+        findings : List[Finding]
+            The findings.
+        """
+        for finding in findings:
+            location = {
+                "physicalLocation": {
+                    "artifactLocation": {
+                        "uri": finding.file.replace(os.sep, "/")
+                    },
+                    "region": {
+                        "startLine": finding.lineno,
+                        "startColumn": finding.col + 1,
+                    },
+                }
+            }
+            properties = {
+                "underdocumented": list(finding.under),
+                "overdocumented": list(finding.over),
+            }
+            if finding.over_budget:
+                self.results.append(
+                    {
+                        "ruleId": "D003",
+                        "level": "warning",
+                        "message": {
+                            "text": OVER_BUDGET.format(finding.over_budget)
+                        },
+                        "locations": [location],
+                        "properties": {"over_budget": finding.over_budget},
+                    }
+                )
+            for rule, message, parameters in (
+                ("D001", UNDERDOCUMENTED, finding.under),
+                ("D002", OVERDOCUMENTED, finding.over),
+            ):
+                if parameters:
+                    self.results.append(
+                        {
+                            "ruleId": rule,
+                            "level": "error",
+                            "message": {
+                                "text": message.format(", ".join(parameters))
+                            },
+                            "locations": [location],
+                            "properties": properties,
+                        }
+                    )
+
+    def finish(self, failed: bool):
+        """Write the SARIF document.
+
+        Parameters
+        ----------
+        failed : bool
+            Whether there were any findings.
+        """
+        document = {
+            "$schema": "https://json.schemastore.org/sarif-2.1.0.json",
+            "version": "2.1.0",
+            "runs": [
+                {
+                    "tool": {
+                        "driver": {
+                            "name": "docargs",
+                            "version": version,
+                            "informationUri": (
+                                "https://github.com/janfreyberg/docargs"
+                            ),
+                            "rules": SARIF_RULES,
+                        }
+                    },
+                    "results": self.results,
+                }
+            ],
+        }
+        click.echo(json.dumps(document, indent=2))
+
+
+Reporter = Union[TextReporter, JsonLinesReporter, SarifReporter]
+
+REPORTERS: Dict[str, Type[Reporter]] = {
+    "text": TextReporter,
+    "jsonl": JsonLinesReporter,
+    "sarif": SarifReporter,
+}
@@ -0,0 +1,683 @@
+"""Check whole source files, serially or over a pool of worker processes."""
+
+import ast
+import itertools
+import os
+import sys
+import tokenize
+import uuid
+from collections import deque
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    TYPE_CHECKING,
+    Tuple,
+    TypeVar,
+    cast,
+)
+
+from . import budget, timing
+from .cache import ResultCache
+from .changes import LineRanges, select_changed
+from .check import docstring_params, walk
+from .exports import exported_names, is_private_module, reexported_names
+from .fingerprint import (
+    DEFINITION_TYPES,
+    DefinitionCache,
+    check_definitions,
+)
+from .prescan import parse_definitions
+
+if TYPE_CHECKING:
+    from .symbols import SymbolIndex
+
+# how many files to read ahead while checking in one process:
+DEFAULT_PREFETCH = 4
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class Finding(NamedTuple):
+    """A compact, picklable record of one documentation mismatch.
+
+    Parameters
+    ----------
+    file : str
+        The name of the file the finding is in.
+    lineno : int
+        The line of the function definition.
+    col : int
+        The column of the function definition.
+    under : Tuple[str, ...]
+        Parameters in the signature but not in the docstring.
+    over : Tuple[str, ...]
+        Parameters in the docstring but not in the signature.
+    qualname : str, optional
+        The qualified name of the function or class, such as
+        ``"Class.method"`` (the default is "", for unknown).
+    over_budget : str, optional
+        If the definition was not checked because it took longer than its
+        time budget, what did: ``"docstring"`` or ``"file"`` (the default is
+        "", for a definition that was checked).
+    """
+
+    file: str
+    lineno: int
+    col: int
+    under: Tuple[str, ...]
+    over: Tuple[str, ...]
+    qualname: str = ""
+    over_budget: str = ""
+
+
+def to_finding(
+    file_name: str,
+    statement: ast.AST,
+    underdocumented: Optional[Iterable[str]],
+    overdocumented: Optional[Iterable[str]],
+    qualname: str = "",
+) -> Finding:
+    """Condense a result of `check` into a finding.
+
+    Parameters
+    ----------
+    file_name : str
+        The name of the file the statement is in.
+    statement : ast.AST
+        The function definition that was checked.
+    underdocumented : Iterable[str], optional
+        Parameters in the signature but not in the docstring, or None if the
+        docstring took longer than its time budget to parse.
+    overdocumented : Iterable[str], optional
+        Parameters in the docstring but not in the signature, or None if the
+        docstring took longer than its time budget to parse.
+    qualname : str, optional
+        The qualified name of the statement (the default is "").
+
+    Returns
+    -------
+    Finding
+    """
+
+    statement = cast(ast.stmt, statement)
+    if underdocumented is None or overdocumented is None:
+        return Finding(
+            file_name,
+            statement.lineno,
+            statement.col_offset,
+            (),
+            (),
+            qualname,
+            budget.DOCSTRING,
+        )
+    return Finding(
+        file_name,
+        statement.lineno,
+        statement.col_offset,
+        tuple(sorted(underdocumented)),
+        tuple(sorted(overdocumented)),
+        qualname,
+    )
+
+
+def qualnames(module: ast.Module) -> Dict[int, str]:
+    """Name the definitions in a module that `check` looks at.
+
+    Parameters
+    ----------
+    module : ast.Module
+        The module.
+
+    Returns
+    -------
+    Dict[int, str]
+        The qualified name of each top-level function and class, and of the
+        methods and nested classes in classes, by the `id` of its node.
+    """
+
+    names: Dict[int, str] = {}
+    pending: List[Tuple[ast.AST, str]] = [(node, "") for node in module.body]
+    while pending:
+        node, prefix = pending.pop()
+        if isinstance(node, DEFINITION_TYPES):
+            name = prefix + node.name
+            names[id(node)] = name
+            if isinstance(node, ast.ClassDef):
+                pending.extend((child, name + ".") for child in node.body)
+    return names
+
+
+def read_source(path: str) -> str:
+    """Read a python file, respecting its encoding declaration.
+
+    Parameters
+    ----------
+    path : str
+        The file to read.
+
+    Returns
+    -------
+    str
+    """
+
+    with tokenize.open(path) as f:
+        return f.read()
+
+
+def resolve_jobs(jobs: str) -> int:
+    """Turn a ``--jobs`` value into a number of worker processes.
+
+    Parameters
+    ----------
+    jobs : str
+        Either a positive integer, or "auto" for one process per CPU.
+
+    Returns
+    -------
+    int
+    """
+
+    if jobs == "auto":
+        return os.cpu_count() or 1
+    n_jobs = int(jobs)
+    if n_jobs < 1:
+        raise ValueError("The number of jobs must be at least 1.")
+    return n_jobs
+
+
+def check_source(
+    file_name: str,
+    source: str,
+    ignore_ambiguous_signatures: bool = True,
+    docstring_style: Optional[str] = None,
+    strict_parser: bool = False,
+    line_ranges: Optional[LineRanges] = None,
+    definitions: Optional[DefinitionCache] = None,
+    prescan: bool = False,
+    max_depth: Optional[int] = None,
+    exported_only: bool = False,
+    symbols: Optional["SymbolIndex"] = None,
+) -> List[Finding]:
+    """Parse and check one file's source code.
+
+    Parameters
+    ----------
+    file_name : str
+        The name to report findings under.
+    source : str
+        The python source code.
+    ignore_ambiguous_signatures : bool, optional
+        Whether to ignore extra documented arguments if the function has an
+        ambiguous (*args / **kwargs) signature (the default is True).
+    docstring_style : str, optional
+        The style all docstrings are written in. If None (the default), it is
+        detected for each docstring.
+    strict_parser : bool, optional
+        Whether to fully parse docstrings with numpydoc or docstring_parser
+        (the default is False).
+    line_ranges : Sequence[Tuple[int, int]], optional
+        If given, only check definitions that overlap these (first, last)
+        line ranges.
+    definitions : DefinitionCache, optional
+        If given, the findings of definitions whose signatures and
+        docstrings are in it are reused, and those of other definitions are
+        added to it.
+    prescan : bool, optional
+        Whether to only parse the public top-level definitions, when a scan
+        of the lines can find them safely (the default is False). Syntax
+        errors elsewhere in the file are then not reported.
+    max_depth : int, optional
+        How many levels of classes to look into for methods and nested
+        classes. If None (the default), there is no limit.
+    exported_only : bool, optional
+        Whether to only check the definitions the module exports, through
+        its ``__all__`` or its package's ``__init__.py`` (the default is
+        False). The package is looked up next to ``file_name``.
+    symbols : SymbolIndex, optional
+        If given, methods without docstrings are checked against the
+        docstrings they inherit from base classes in the index.
+
+    Returns
+    -------
+    List[Finding]
+        The findings in the file, sorted by line and column.
+    """
+
+    # findings don't reference the tree, so it is freed once this returns
+    with timing.phase("parse"):
+        if prescan:
+            tree = parse_definitions(source, filename=file_name)
+        else:
+            tree = ast.parse(source, filename=file_name)
+    exported = None
+    if exported_only:
+        exported = exported_names(
+            tree,
+            reexported_names(file_name),
+            os.path.splitext(os.path.basename(file_name))[0],
+        )
+        if (
+            prescan
+            and exported is not None
+            and any(name.startswith("_") for name in exported)
+        ):
+            # the scan left out the private definitions the module exports
+            with timing.phase("parse"):
+                tree = parse_definitions(source, file_name, keep=exported)
+    if line_ranges is not None:
+        tree = select_changed(tree, line_ranges, source.count("\n") + 1)
+    options = (ignore_ambiguous_signatures, docstring_style, strict_parser)
+    if definitions is None:
+        results = walk(tree, *options, max_depth=max_depth, names=exported)
+    else:
+        results = check_definitions(
+            tree, definitions, *options, max_depth=max_depth, names=exported
+        )
+    names = qualnames(tree)
+    if symbols is not None:
+        results = symbols.inherit(
+            file_name, results, names, ignore_ambiguous_signatures
+        )
+    findings = [
+        to_finding(
+            file_name,
+            node,
+            underdocumented,
+            overdocumented,
+            names.get(id(node), ""),
+        )
+        for node, underdocumented, overdocumented in results
+        if underdocumented or overdocumented or underdocumented is None
+    ]
+    return sorted(findings)
+
+
+def _check_source_in_budget(
+    file_name: str, source: str, **options
+) -> List[Finding]:
+    # check a file, or report that it wasn't if it took too long
+    try:
+        with budget.limit(budget.FILE):
+            return check_source(file_name, source, **options)
+    except budget.FileOverBudget:
+        return [Finding(file_name, 1, 0, (), (), "", budget.FILE)]
+
+
+def check_source_cached(
+    file_name: str,
+    source: str,
+    cache: Optional[ResultCache] = None,
+    line_ranges: Optional[LineRanges] = None,
+    definitions: Optional[DefinitionCache] = None,
+    symbols: Optional["SymbolIndex"] = None,
+    **options
+) -> List[Finding]:
+    """Check one file's source code, reusing cached findings if possible.
+
+    If time budgets are enabled (see `budget.enable`), a file that takes
+    longer than its budget has a single finding for the whole file, and
+    files with findings over budget are not cached.
+
+    Parameters
+    ----------
+    file_name : str
+        The name to report findings under.
+    source : str
+        The python source code.
+    cache : ResultCache, optional
+        The cache to look findings up in and store them to. If None (the
+        default), the source is always checked.
+    line_ranges : Sequence[Tuple[int, int]], optional
+        If given, only check definitions that overlap these line ranges. The
+        cache is not used in this case.
+    definitions : DefinitionCache, optional
+        Findings of single definitions to reuse and add to, on a cache miss
+        (the default is None).
+    symbols : SymbolIndex, optional
+        The classes of the project, to check methods against the docstrings
+        they inherit (the default is None).
+    **options
+        Passed on to `check_source`.
+
+    Returns
+    -------
+    List[Finding]
+    """
+
+    if cache is None or line_ranges is not None:
+        return _check_source_in_budget(
+            file_name,
+            source,
+            line_ranges=line_ranges,
+            definitions=definitions,
+            symbols=symbols,
+            **options
+        )
+
+    with timing.phase("cache lookup"):
+        key_options = options
+        if options.get("exported_only"):
+            # what is exported also depends on the package's __init__.py,
+            # and on whether the module is private
+            name = os.path.splitext(os.path.basename(file_name))[0]
+            key_options = dict(
+                key_options,
+                reexported=sorted(reexported_names(file_name)),
+                private_module=is_private_module(name),
+            )
+        if symbols is not None:
+            # and what its classes inherit on what other modules document
+            key_options = dict(
+                key_options, inherited=symbols.dependency_key(file_name)
+            )
+        key = cache.key(source, key_options)
+        rows = cache.get(key)
+    if rows is not None:
+        return [
+            Finding(
+                file_name, lineno, col, tuple(under), tuple(over), qualname
+            )
+            for lineno, col, under, over, qualname in rows
+        ]
+
+    findings = _check_source_in_budget(
+        file_name, source, definitions=definitions, symbols=symbols, **options
+    )
+    if not any(finding.over_budget for finding in findings):
+        with timing.phase("cache store"):
+            # rows don't include the always empty over_budget
+            cache.put(key, [list(finding[1:6]) for finding in findings])
+    return findings
+
+
+def check_path(
+    path: str,
+    cache: Optional[ResultCache] = None,
+    line_ranges: Optional[LineRanges] = None,
+    symbols: Optional["SymbolIndex"] = None,
+    **options
+) -> List[Finding]:
+    """Read and check one file.
+
+    Parameters
+    ----------
+    path : str
+        The file to check.
+    cache : ResultCache, optional
+        The cache to look findings up in and store them to (the default is
+        None, which always checks the file).
+    line_ranges : Sequence[Tuple[int, int]], optional
+        If given, only check definitions that overlap these line ranges.
+    symbols : SymbolIndex, optional
+        The classes of the project, to check methods against the docstrings
+        they inherit (the default is None).
+    **options
+        Passed on to `check_source`.
+
+    Returns
+    -------
+    List[Finding]
+    """
+
+    with timing.file(path):
+        with timing.phase("read"):
+            source = read_source(path)
+        return check_source_cached(
+            path, source, cache, line_ranges, symbols=symbols, **options
+        )
+
+
+def _count_cache_use(profiler: timing.Profiler, hits: int, misses: int):
+    # count the docstring cache's hits and misses since it had these counts
+    info = docstring_params.cache_info()
+    profiler.count("docstring cache hits", info.hits - hits)
+    profiler.count("docstring cache misses", info.misses - misses)
+
+
+def _prefetch(
+    paths_with_ranges: Iterable[Tuple[str, Optional[LineRanges]]],
+    depth: int,
+) -> Iterator[Tuple[str, Optional[LineRanges], Callable[[], str]]]:
+    # yield each path with a function that returns its source. With a depth,
+    # up to that many files are read ahead by threads, so that slow reads
+    # overlap with parsing and checking
+    if depth < 1:
+        for path, ranges in paths_with_ranges:
+            yield path, ranges, partial(read_source, path)
+        return
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(depth) as executor:
+        pending: deque = deque()
+        for path, ranges in paths_with_ranges:
+            future = executor.submit(read_source, path)
+            pending.append((path, ranges, future.result))
+            if len(pending) > depth:
+                yield pending.popleft()
+        while pending:
+            yield pending.popleft()
+
+
+# the symbol index in worker processes, which is sent once when they start
+# rather than with every batch:
+_worker_symbols: Optional["SymbolIndex"] = None
+
+
+def _init_worker(
+    symbols: Optional["SymbolIndex"],
+    budgets: Optional[Dict[str, Optional[float]]],
+):
+    global _worker_symbols
+    _worker_symbols = symbols
+    if budgets is not None:
+        # each worker has its own watchdog
+        budget.enable(**budgets)
+
+
+def _check_batch(
+    batch: List[Tuple[str, Optional[LineRanges]]],
+    profile: bool = False,
+    **options
+) -> Tuple[List[List[Finding]], Optional[Dict[str, Dict]]]:
+    # with profile, the worker times its batch and sends the times back to
+    # be merged into the parent's profiler
+    profiler = timing.enable() if profile else None
+    before = docstring_params.cache_info()
+    try:
+        results = [
+            check_path(
+                path,
+                line_ranges=line_ranges,
+                symbols=_worker_symbols,
+                **options
+            )
+            for path, line_ranges in batch
+        ]
+    finally:
+        if profiler is not None:
+            _count_cache_use(profiler, before.hits, before.misses)
+            timing.disable()
+    return results, None if profiler is None else profiler.stats()
+
+
+def check_files(
+    paths: Iterable[str],
+    jobs: int = 1,
+    cache: Optional[ResultCache] = None,
+    line_ranges: Optional[Mapping[str, LineRanges]] = None,
+    prefetch: int = DEFAULT_PREFETCH,
+    symbols: Optional["SymbolIndex"] = None,
+    **options
+) -> Iterator[List[Finding]]:
+    """Check many files, yielding the findings for each in input order.
+
+    Files are read, parsed and checked one at a time (per process), and only
+    their findings are kept, so memory use doesn't grow with the number of
+    files. The time budgets enabled in this process, if any, are enforced in
+    worker processes too.
+
+    Parameters
+    ----------
+    paths : Iterable[str]
+        The files to check. This can be a lazy iterator, which is only
+        consumed as fast as files are checked.
+    jobs : int, optional
+        The number of worker processes. With 1 (the default), files are
+        checked in this process.
+    cache : ResultCache, optional
+        A cache of findings from earlier runs (the default is None, which
+        checks every file).
+    line_ranges : Mapping[str, Sequence[Tuple[int, int]]], optional
+        If given, only check the definitions in each file that overlap the
+        line ranges for its path.
+    prefetch : int, optional
+        With one job, how many files to read ahead in threads while checking,
+        which helps on slow file systems (the default is 4). 0 reads each file
+        just before checking it.
+    symbols : SymbolIndex, optional
+        The classes of the project, to check methods against the docstrings
+        they inherit (the default is None).
+    **options
+        Passed on to `check_source`.
+
+    Yields
+    ------
+    List[Finding]
+        The findings for one file.
+    """
+
+    paths_with_ranges = (
+        (path, None if line_ranges is None else line_ranges.get(path, ()))
+        for path in paths
+    )
+
+    profiler = timing.active()
+    budgets = budget.active()
+    if jobs <= 1:
+        before = docstring_params.cache_info()
+        for path, ranges, read in _prefetch(paths_with_ranges, prefetch):
+            with timing.file(path):
+                with timing.phase("read"):
+                    source = read()
+                findings = check_source_cached(
+                    path, source, cache, ranges, symbols=symbols, **options
+                )
+            yield findings
+        if profiler is not None:
+            _count_cache_use(profiler, before.hits, before.misses)
+        return
+
+    # workers read the files themselves, so only paths are sent to them
+    worker = partial(
+        _check_batch, profile=profiler is not None, cache=cache, **options
+    )
+    for results, stats in map_batches(
+        worker,
+        paths_with_ranges,
+        jobs,
+        initializer=_init_worker,
+        initargs=(
+            symbols,
+            None if budgets is None else budgets.seconds,
+        ),
+    ):
+        if profiler is not None and stats is not None:
+            profiler.merge(stats)
+        yield from results
+
+
+# the initializer that last ran in this worker process, by a token of its
+# pool, for python 3.6:
+_initialized: Optional[str] = None
+
+
+def _call_initialized(
+    token: str,
+    initializer: Callable,
+    initargs: Tuple,
+    function: Callable[[List[T]], R],
+    batch: List[T],
+) -> R:
+    global _initialized
+    if _initialized != token:
+        initializer(*initargs)
+        _initialized = token
+    return function(batch)
+
+
+def map_batches(
+    function: Callable[[List[T]], R],
+    items: Iterable[T],
+    jobs: int,
+    batch_size: int = 8,
+    initializer: Optional[Callable] = None,
+    initargs: Tuple = (),
+) -> Iterator[R]:
+    """Call a function on batches of items in worker processes, in order.
+
+    Items are sent in small batches to amortise the cost of pickling, and
+    only a few batches per worker are in flight, so memory stays bounded
+    however many items there are.
+
+    Parameters
+    ----------
+    function : Callable[[List[T]], R]
+        A picklable function that processes a batch of items.
+    items : Iterable[T]
+        The picklable items. This can be a lazy iterator, which is only
+        consumed as fast as batches are processed.
+    jobs : int
+        The number of worker processes.
+    batch_size : int, optional
+        The number of items in each batch (the default is 8).
+    initializer : Callable, optional
+        Called with `initargs` in each worker process when it starts, to
+        send it data that all batches need once. Before python 3.7, the
+        arguments are sent with every batch instead.
+    initargs : Tuple, optional
+        The arguments of `initializer`.
+
+    Yields
+    ------
+    R
+        The result for each batch, in the order of the items.
+    """
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    pool_options: Dict[str, Any] = {}
+    if initializer is not None:
+        if sys.version_info >= (3, 7):
+            pool_options = dict(initializer=initializer, initargs=initargs)
+        else:
+            # process pools only run initializers from python 3.7, so
+            # workers run it before their first batch instead
+            function = partial(
+                _call_initialized,
+                uuid.uuid4().hex,
+                initializer,
+                initargs,
+                function,
+            )
+
+    items = iter(items)
+    with ProcessPoolExecutor(jobs, **pool_options) as executor:
+        pending: deque = deque()
+        while True:
+            batch = list(itertools.islice(items, batch_size))
+            if batch:
+                pending.append(executor.submit(function, batch))
+            if pending and (not batch or len(pending) >= 4 * jobs):
+                yield pending.popleft().result()
+            elif not batch:
+                return
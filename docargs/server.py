@@ -0,0 +1,285 @@
+"""Check files in a long-running process, for editors and other tools.
+
+``docargs serve`` listens on a Unix socket, so that imports and the cache of
+parsed docstrings stay warm between checks. Clients send one JSON object per
+line::
+
+    {"cwd": "/path/to/project", "options": {"strict_parser": false},
+     "cache_dir": null, "files": [{"path": "module.py", "line_ranges": null},
+                                  {"path": "unsaved.py", "source": "..."}]}
+
+``options`` are passed on to `check_source`, relative paths are read relative
+to ``cwd``, and a file's ``source``, if given, is checked instead of reading
+it. The server answers with one JSON object per file, in order, which has
+either ``findings`` (as ``[lineno, col, under, over, qualname, over_budget]``
+rows) or an ``error``, and ends with ``{"done": true}``.
+"""
+
+import importlib
+import json
+import os
+import socket
+import socketserver
+import tempfile
+from typing import Any, Dict, Iterator, List, Optional
+
+from .cache import ResultCache
+from .fingerprint import DefinitionCache
+from .run import Finding, check_source_cached, read_source
+
+
+def default_socket_path() -> str:
+    """Get the socket the server listens on if no other is given.
+
+    Returns
+    -------
+    str
+        A socket in the user's runtime directory, or the temporary directory.
+    """
+
+    directory = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(directory, "docargs-{}.sock".format(os.getuid()))
+
+
+def handle_request(
+    request: Dict[str, Any], definitions: Optional[DefinitionCache] = None
+) -> Iterator[Dict[str, Any]]:
+    """Check the files in a request.
+
+    Parameters
+    ----------
+    request : Dict[str, Any]
+        The request, as described in the module documentation.
+    definitions : DefinitionCache, optional
+        Findings of definitions from earlier requests, to reuse when only
+        some definitions in a file changed.
+
+    Yields
+    ------
+    Dict[str, Any]
+        The response for each file, and finally ``{"done": true}``.
+    """
+
+    cwd = request.get("cwd") or os.getcwd()
+    options = request.get("options", {})
+    cache_dir = request.get("cache_dir")
+    cache = None if cache_dir is None else ResultCache(cache_dir)
+
+    for entry in request.get("files", []):
+        path = entry["path"]
+        try:
+            # the full path lets --exported-only find the file's package
+            full_path = os.path.join(cwd, path)
+            source = entry.get("source")
+            if source is None:
+                source = read_source(full_path)
+            findings = check_source_cached(
+                full_path,
+                source,
+                cache,
+                entry.get("line_ranges"),
+                definitions,
+                **options
+            )
+        except SyntaxError as error:
+            yield {
+                "path": path,
+                "error": "SyntaxError",
+                "args": [
+                    error.msg,
+                    [error.filename, error.lineno, error.offset, error.text],
+                ],
+            }
+        except (OSError, TypeError, ValueError) as error:
+            yield {
+                "path": path,
+                "error": type(error).__name__,
+                "args": [str(error)],
+            }
+        else:
+            yield {
+                "path": path,
+                "findings": [list(finding[1:]) for finding in findings],
+            }
+
+    if cache is not None:
+        cache.prune()
+    yield {"done": True}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: "CheckServer"
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+            except ValueError as error:
+                responses: Any = [
+                    {"error": "ValueError", "args": [str(error)]}
+                ]
+            else:
+                responses = handle_request(request, self.server.definitions)
+            for response in responses:
+                self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+
+class CheckServer(socketserver.ThreadingUnixStreamServer):
+    """A server that checks files for clients on a Unix socket.
+
+    Parameters
+    ----------
+    socket_path : str
+        The socket to listen on.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str):
+        super().__init__(socket_path, _Handler)
+        self.socket_path = socket_path
+        self.definitions = DefinitionCache()
+
+    def server_close(self):
+        """Stop listening, and remove the socket."""
+        super().server_close()
+        try:
+            os.unlink(self.socket_path)
+        except OSError:
+            pass
+
+
+def _is_listening(socket_path: str) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(socket_path)
+        except OSError:
+            return False
+    return True
+
+
+def make_server(socket_path: str) -> CheckServer:
+    """Create a server, replacing a stale socket if there is one.
+
+    The optional docstring parsers are imported up front, so that no request
+    has to wait for them.
+
+    Parameters
+    ----------
+    socket_path : str
+        The socket to listen on.
+
+    Returns
+    -------
+    CheckServer
+
+    Raises
+    ------
+    RuntimeError
+        If another server is already listening on the socket.
+    """
+
+    if os.path.exists(socket_path):
+        if _is_listening(socket_path):
+            raise RuntimeError(
+                "A docargs server is already listening on {}.".format(
+                    socket_path
+                )
+            )
+        os.unlink(socket_path)
+
+    for module in ("numpydoc.docscrape", "docstring_parser"):
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            pass
+    return CheckServer(socket_path)
+
+
+def request_checks(
+    socket_path: str,
+    files: List[Dict[str, Any]],
+    options: Dict[str, Any],
+    cache_dir: Optional[str] = None,
+    cwd: Optional[str] = None,
+) -> Iterator[List[Finding]]:
+    """Have a server check files, yielding the findings for each in order.
+
+    Parameters
+    ----------
+    socket_path : str
+        The socket the server listens on.
+    files : List[Dict[str, Any]]
+        The files to check, each with a ``path``, and optionally
+        ``line_ranges`` or ``source``.
+    options : Dict[str, Any]
+        Passed on to `check_source`.
+    cache_dir : str, optional
+        The absolute path of the result cache to use (the default is None,
+        which checks every file).
+    cwd : str, optional
+        The directory relative paths are relative to (the default is the
+        current directory).
+
+    Yields
+    ------
+    List[Finding]
+        The findings for one file.
+
+    Raises
+    ------
+    ConnectionError
+        If no server is listening on the socket.
+    SyntaxError
+        If a file can't be parsed, as when checking it in this process.
+    RuntimeError
+        If the server fails to check a file for another reason.
+    """
+
+    request = {
+        "cwd": cwd or os.getcwd(),
+        "options": options,
+        "cache_dir": cache_dir,
+        "files": files,
+    }
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(socket_path)
+        except OSError as error:
+            raise ConnectionError(
+                "No docargs server is listening on {} ({}). Start one with "
+                "'docargs serve'.".format(socket_path, error.strerror)
+            )
+        client.sendall(json.dumps(request).encode() + b"\n")
+        with client.makefile("rb") as responses:
+            for line in responses:
+                response = json.loads(line)
+                if response.get("done"):
+                    return
+                if response.get("error") == "SyntaxError":
+                    raise SyntaxError(*response["args"])
+                if "error" in response:
+                    raise RuntimeError(
+                        "{}: {}".format(response["error"], *response["args"])
+                    )
+                yield [
+                    Finding(
+                        response["path"],
+                        lineno,
+                        col,
+                        tuple(under),
+                        tuple(over),
+                        qualname,
+                        over_budget,
+                    )
+                    for (
+                        lineno,
+                        col,
+                        under,
+                        over,
+                        qualname,
+                        over_budget,
+                    ) in response["findings"]
+                ]
+    raise ConnectionError("The docargs server closed the connection.")
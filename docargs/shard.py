@@ -0,0 +1,304 @@
+"""Split the files to check between CI nodes, and merge their results.
+
+Files are assigned to shards by how long they took to check before, which
+is kept in a small JSON file of seconds per file, so that every shard takes
+about as long. Each shard saves its findings, with the position of each file
+among all the files, so that merging them reports exactly what checking all
+the files on one node would have.
+"""
+
+import hashlib
+import heapq
+import json
+import os
+import tempfile
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple
+
+from .run import Finding
+
+DEFAULT_TIMINGS = ".docargs_timings.json"
+# changed whenever the layout of shard result files changes:
+RESULTS_FORMAT = 2
+
+
+def _timing_key(path: str) -> str:
+    # the same file has the same key on every platform and however it was
+    # spelled on the command line
+    return os.path.normpath(path).replace(os.sep, "/")
+
+
+def read_timings(path: str) -> Dict[str, float]:
+    """Read the seconds each file took to check in earlier runs.
+
+    Parameters
+    ----------
+    path : str
+        The timing database.
+
+    Returns
+    -------
+    Dict[str, float]
+        The seconds by file, empty if the database doesn't exist or can't be
+        read.
+    """
+
+    try:
+        with open(path, "r") as f:
+            timings = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(timings, dict):
+        return {}
+    return {
+        file: float(seconds)
+        for file, seconds in timings.items()
+        if isinstance(seconds, (int, float))
+    }
+
+
+def update_timings(path: str, times: Mapping[str, float]):
+    """Record the seconds files took to check, keeping other files' times.
+
+    Parameters
+    ----------
+    path : str
+        The timing database, which is created if it doesn't exist.
+    times : Mapping[str, float]
+        The seconds by file.
+    """
+
+    timings = read_timings(path)
+    timings.update(
+        (_timing_key(file), round(seconds, 6))
+        for file, seconds in times.items()
+    )
+    directory = os.path.dirname(os.path.abspath(path))
+    descriptor, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "w") as f:
+            json.dump(timings, f, indent=0, sort_keys=True)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def select_shard(
+    paths: Sequence[str],
+    index: int,
+    count: int,
+    timings: Mapping[str, float],
+) -> List[int]:
+    """Choose the files of one shard, balancing the time of all shards.
+
+    The slowest files are assigned first, each to the shard with the least
+    time so far. Files without a time count as the median of the others, or
+    all the same if none has one, which balances the number of files. Given
+    the same paths and timings, every shard makes the same choice.
+
+    Parameters
+    ----------
+    paths : Sequence[str]
+        All the files to check.
+    index : int
+        The shard, from 1 to `count`.
+    count : int
+        The number of shards.
+    timings : Mapping[str, float]
+        The seconds files took to check before, from `read_timings`.
+
+    Returns
+    -------
+    List[int]
+        The positions in `paths` of the shard's files, in order.
+    """
+
+    known = sorted(
+        timings[key] for key in map(_timing_key, paths) if key in timings
+    )
+    default = known[len(known) // 2] if known else 1.0
+    weights = [timings.get(_timing_key(path), default) for path in paths]
+    order = sorted(
+        range(len(paths)), key=lambda i: (-weights[i], _timing_key(paths[i]))
+    )
+    loads = [(0.0, shard) for shard in range(count)]
+    selected = []
+    for position in order:
+        load, shard = heapq.heappop(loads)
+        if shard == index - 1:
+            selected.append(position)
+        heapq.heappush(loads, (load + weights[position], shard))
+    return sorted(selected)
+
+
+def split_key(paths: Sequence[str], timings: Mapping[str, float]) -> str:
+    """Hash what `select_shard` splits files by.
+
+    Shards with the same key split the files the same way.
+
+    Parameters
+    ----------
+    paths : Sequence[str]
+        All the files to check.
+    timings : Mapping[str, float]
+        The seconds files took to check before.
+
+    Returns
+    -------
+    str
+    """
+
+    keys = [_timing_key(path) for path in paths]
+    digest = hashlib.sha256()
+    digest.update(
+        json.dumps(
+            [keys, [timings.get(key) for key in keys]], separators=(",", ":")
+        ).encode("utf-8", "surrogatepass")
+    )
+    return digest.hexdigest()
+
+
+def write_shard_results(
+    path: str,
+    shard: Tuple[int, int],
+    n_files: int,
+    split: str,
+    options: Mapping[str, Any],
+    files: Iterable[Tuple[int, str, float, List[Finding]]],
+):
+    """Save the findings of one shard for `merge_shard_results`.
+
+    Parameters
+    ----------
+    path : str
+        The file to save them in.
+    shard : Tuple[int, int]
+        The shard, and the number of shards.
+    n_files : int
+        The number of files of all shards.
+    split : str
+        The `split_key` of the files and timings the shards were chosen by.
+    options : Mapping[str, Any]
+        The JSON-serialisable options the files were checked with.
+    files : Iterable[Tuple[int, str, float, List[Finding]]]
+        The position among all files, path, seconds to check and findings of
+        each of the shard's files.
+    """
+
+    results = {
+        "format": RESULTS_FORMAT,
+        "shard": list(shard),
+        "n_files": n_files,
+        "split": split,
+        "options": dict(options),
+        "files": [
+            [position, file, seconds, [list(finding) for finding in findings]]
+            for position, file, seconds, findings in files
+        ],
+    }
+    with open(path, "w") as f:
+        json.dump(results, f)
+
+
+def merge_shard_results(
+    paths: Iterable[str],
+) -> Tuple[List[List[Finding]], Dict[str, float]]:
+    """Combine the findings that each shard saved.
+
+    Parameters
+    ----------
+    paths : Iterable[str]
+        The files written by `write_shard_results`, one for every shard.
+
+    Returns
+    -------
+    List[List[Finding]]
+        The findings of each file, in the order of all files.
+    Dict[str, float]
+        The seconds each file took to check.
+
+    Raises
+    ------
+    ValueError
+        If a file is not a shard's results, or the shards don't fit
+        together: some are missing or repeated, they were split from
+        different files or timings, so that files are missing or repeated,
+        or they were checked with different options.
+    """
+
+    shards: Dict[int, Dict[str, Any]] = {}
+    for path in paths:
+        try:
+            with open(path, "r") as f:
+                results = json.load(f)
+        except (OSError, ValueError) as error:
+            raise ValueError(
+                "Can't read shard results from {}: {}".format(path, error)
+            )
+        if (
+            not isinstance(results, dict)
+            or results.get("format") != RESULTS_FORMAT
+        ):
+            raise ValueError(
+                "{} is not a shard result of this version of docargs".format(
+                    path
+                )
+            )
+        index, count = results["shard"]
+        if index in shards:
+            raise ValueError("Shard {}/{} is repeated".format(index, count))
+        shards[index] = results
+
+    if not shards:
+        raise ValueError("No shard results to merge")
+    first = next(iter(shards.values()))
+    count = first["shard"][1]
+    for results in shards.values():
+        if (
+            results["shard"][1] != count
+            or results["n_files"] != first["n_files"]
+            or results["split"] != first["split"]
+        ):
+            raise ValueError(
+                "The shards were split differently, or from different files"
+            )
+        if results["options"] != first["options"]:
+            raise ValueError("The shards were checked with different options")
+    missing = sorted(set(range(1, count + 1)) - set(shards))
+    if missing:
+        raise ValueError(
+            "Missing shards: {}".format(
+                ", ".join("{}/{}".format(index, count) for index in missing)
+            )
+        )
+
+    n_files = first["n_files"]
+    findings: List[List[Finding]] = [[] for _ in range(n_files)]
+    checked = [False] * n_files
+    times: Dict[str, float] = {}
+    for results in shards.values():
+        for position, file, seconds, rows in results["files"]:
+            if not 0 <= position < n_files or checked[position]:
+                raise ValueError(
+                    "{} was checked by more than one shard".format(file)
+                )
+            checked[position] = True
+            findings[position] = [
+                Finding(
+                    row[0],
+                    row[1],
+                    row[2],
+                    tuple(row[3]),
+                    tuple(row[4]),
+                    *row[5:],
+                )
+                for row in rows
+            ]
+            times[file] = seconds
+    if not all(checked):
+        raise ValueError(
+            "{} files were not checked by any shard".format(
+                checked.count(False)
+            )
+        )
+    return findings, times
@@ -0,0 +1,57 @@
+"""Cheaply tell which convention a docstring is written in."""
+
+import re
+from typing import Optional
+
+NUMPY = "numpy"
+GOOGLE = "google"
+REST = "rest"
+EPYDOC = "epydoc"
+STYLES = (NUMPY, GOOGLE, REST, EPYDOC)
+
+_PATTERNS = (
+    # a section header underlined with dashes:
+    (NUMPY, re.compile(r"^[ \t]*\S.*\n[ \t]*-{3,}[ \t]*$", re.MULTILINE)),
+    (
+        REST,
+        re.compile(
+            r"^[ \t]*:(param|parameter|arg|argument|key|keyword|type"
+            r"|returns?|rtype|raises?|yields?)\b",
+            re.MULTILINE,
+        ),
+    ),
+    (
+        GOOGLE,
+        re.compile(
+            r"^[ \t]*(Args|Arguments|Parameters|Params|Keyword Args"
+            r"|Keyword Arguments|Other Parameters|Attributes|Returns"
+            r"|Yields|Raises|Example|Examples):[ \t]*$",
+            re.MULTILINE,
+        ),
+    ),
+    (
+        EPYDOC,
+        re.compile(r"^[ \t]*@(param|type|return|rtype|raise)\b", re.MULTILINE),
+    ),
+)
+
+
+def detect_style(docstring: str) -> Optional[str]:
+    """Detect the style of a docstring without parsing it.
+
+    Parameters
+    ----------
+    docstring : str
+        The docstring.
+
+    Returns
+    -------
+    Optional[str]
+        One of "numpy", "google", "rest" or "epydoc", or None if the
+        docstring has no sections in any of these styles.
+    """
+
+    for style, pattern in _PATTERNS:
+        if pattern.search(docstring):
+            return style
+    return None
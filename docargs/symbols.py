@@ -0,0 +1,542 @@
+"""Resolve the docstrings that methods inherit from base classes in a project.
+
+Like Sphinx's autodoc and numpydoc, a method without a docstring can rely on
+the docstring of the method it overrides. Before checking, every module of
+the project is summarized, in parallel if need be, into its imports and its
+classes, with their bases and the parameters documented by each of their
+methods. Looking up what an undocumented method inherits then only takes
+dictionary lookups, whichever module its base classes are in.
+"""
+
+import ast
+import hashlib
+import os
+from functools import lru_cache, partial
+from typing import (
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from .budget import DocstringOverBudget
+from .check import compare_args, get_doc_params, get_signature_params
+from .run import map_batches, read_source
+
+# how many imports to follow to find the class a name refers to:
+MAX_HOPS = 32
+
+
+class ClassSummary(NamedTuple):
+    """What a project-wide index needs to know about a class.
+
+    Parameters
+    ----------
+    bases : Tuple[str, ...]
+        The dotted names of its bases, as far as they can be resolved in
+        their module.
+    methods : Dict[str, FrozenSet[str]]
+        The parameters documented by each of its methods with a docstring.
+    """
+
+    bases: Tuple[str, ...]
+    methods: Dict[str, FrozenSet[str]]
+
+
+class ModuleSummary(NamedTuple):
+    """What a project-wide index needs to know about a module.
+
+    Parameters
+    ----------
+    path : str
+        The absolute path of the module's file.
+    name : str
+        The dotted name of the module.
+    aliases : Dict[str, str]
+        The dotted names that imports bind to names in the module.
+    classes : Dict[str, ClassSummary]
+        Its classes, including nested ones, by qualified name.
+    """
+
+    path: str
+    name: str
+    aliases: Dict[str, str]
+    classes: Dict[str, ClassSummary]
+
+
+@lru_cache(maxsize=1024)
+def _package(directory: str) -> str:
+    # the dotted name of the package in a directory, or "" if it isn't one
+    if not os.path.exists(os.path.join(directory, "__init__.py")):
+        return ""
+    parent, name = os.path.split(directory)
+    outer = _package(parent) if parent != directory else ""
+    return outer + "." + name if outer else name
+
+
+def module_name(path: str) -> str:
+    """Find the dotted name of a module from its file and its packages.
+
+    Parameters
+    ----------
+    path : str
+        The module's file.
+
+    Returns
+    -------
+    str
+        Such as "package.module", or "package" for its ``__init__.py``.
+    """
+
+    directory, file_name = os.path.split(os.path.abspath(path))
+    package = _package(directory)
+    name = os.path.splitext(file_name)[0]
+    if name == "__init__" and package:
+        return package
+    return package + "." + name if package else name
+
+
+def _dotted(node: ast.AST) -> Optional[str]:
+    # the dotted name of a name or attribute expression, like "a.b.Base"
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        value = _dotted(node.value)
+        return None if value is None else value + "." + node.attr
+    return None
+
+
+def _import_base(
+    statement: ast.ImportFrom, name: str, is_package: bool
+) -> str:
+    # the absolute name of the module an import from imports from
+    if not statement.level:
+        return statement.module or ""
+    parts = name.split(".")
+    if not is_package:
+        parts = parts[:-1]
+    if statement.level > 1:
+        end = len(parts) - statement.level + 1
+        parts = parts[:end]
+    if statement.module:
+        parts.append(statement.module)
+    return ".".join(parts)
+
+
+def summarize(
+    module: ast.Module,
+    path: str,
+    docstring_style: Optional[str] = None,
+    strict_parser: bool = False,
+) -> ModuleSummary:
+    """Summarize a module's imports and classes for a `SymbolIndex`.
+
+    Parameters
+    ----------
+    module : ast.Module
+        The module.
+    path : str
+        Its file.
+    docstring_style : str, optional
+        The style all docstrings are written in. If None (the default), it is
+        detected for each docstring.
+    strict_parser : bool, optional
+        Whether to fully parse docstrings with numpydoc or docstring_parser
+        (the default is False).
+
+    Returns
+    -------
+    ModuleSummary
+    """
+
+    name = module_name(path)
+    is_package = os.path.basename(path) == "__init__.py"
+    aliases: Dict[str, str] = {}
+    for statement in module.body:
+        if isinstance(statement, ast.Import):
+            for alias in statement.names:
+                if alias.asname:
+                    aliases[alias.asname] = alias.name
+                else:
+                    top = alias.name.split(".")[0]
+                    aliases[top] = top
+        elif isinstance(statement, ast.ImportFrom):
+            base = _import_base(statement, name, is_package)
+            for alias in statement.names:
+                if alias.name != "*":
+                    aliases[alias.asname or alias.name] = (
+                        base + "." + alias.name
+                    )
+        elif isinstance(statement, ast.ClassDef):
+            # classes defined later shadow imports of the same name
+            aliases[statement.name] = name + "." + statement.name
+
+    classes: Dict[str, ClassSummary] = {}
+    pending: List[Tuple[ast.AST, str]] = [(node, "") for node in module.body]
+    while pending:
+        node, prefix = pending.pop()
+        if not isinstance(node, ast.ClassDef):
+            continue
+        qualname = prefix + node.name
+        bases = []
+        for base_node in node.bases:
+            dotted = _dotted(base_node)
+            if dotted is not None:
+                first, _, rest = dotted.partition(".")
+                first = aliases.get(first, first)
+                bases.append(first + "." + rest if rest else first)
+        methods = {}
+        for child in node.body:
+            if (
+                isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef))
+                and ast.get_docstring(child) is not None
+            ):
+                try:
+                    methods[child.name] = get_doc_params(
+                        child, docstring_style, strict_parser
+                    )
+                except DocstringOverBudget:
+                    # it is reported when its own class is checked
+                    pass
+        classes[qualname] = ClassSummary(tuple(bases), methods)
+        pending.extend((child, qualname + ".") for child in node.body)
+    return ModuleSummary(os.path.abspath(path), name, aliases, classes)
+
+
+class SymbolIndex:
+    """An index of the classes in a project, to look up inherited docs.
+
+    Parameters
+    ----------
+    summaries : Iterable[ModuleSummary]
+        The summaries of the project's modules.
+    """
+
+    def __init__(self, summaries: Iterable[ModuleSummary]):
+        self.modules: Dict[str, str] = {}
+        self.aliases: Dict[str, Dict[str, str]] = {}
+        self.classes: Dict[str, ClassSummary] = {}
+        self.module_classes: Dict[str, List[str]] = {}
+        self._inherited: Dict[Tuple[str, str], Optional[FrozenSet[str]]] = {}
+        self._keys: Dict[str, str] = {}
+        for summary in summaries:
+            self._add(summary)
+
+    def _add(self, summary: ModuleSummary):
+        self.modules[summary.path] = summary.name
+        self.aliases[summary.name] = summary.aliases
+        keys = self.module_classes.setdefault(summary.name, [])
+        for qualname, class_summary in summary.classes.items():
+            key = summary.name + "." + qualname
+            self.classes[key] = class_summary
+            keys.append(key)
+
+    def update(self, summary: ModuleSummary):
+        """Replace what the index knows of a module, after it changed.
+
+        Parameters
+        ----------
+        summary : ModuleSummary
+            The module's new summary.
+        """
+
+        old_keys = self.module_classes.pop(summary.name, [])
+        old_classes = {key: self.classes.pop(key) for key in old_keys}
+        old_aliases = self.aliases.get(summary.name)
+        known = self.modules.get(summary.path) == summary.name
+        self._add(summary)
+        new_classes = {
+            key: self.classes[key] for key in self.module_classes[summary.name]
+        }
+        if (
+            not known
+            or old_aliases != summary.aliases
+            or old_classes != new_classes
+        ):
+            # what other modules inherit may have changed too
+            self._inherited.clear()
+            self._keys.clear()
+
+    def refresh(
+        self,
+        path: str,
+        source: str,
+        docstring_style: Optional[str] = None,
+        strict_parser: bool = False,
+    ):
+        """Summarize a module again, such as when watch mode sees it change.
+
+        Parameters
+        ----------
+        path : str
+            The module's file.
+        source : str
+            Its new source code. If it can't be parsed, the index is left as
+            it is.
+        docstring_style : str, optional
+            The style all docstrings are written in. If None (the default),
+            it is detected for each docstring.
+        strict_parser : bool, optional
+            Whether to fully parse docstrings with numpydoc or
+            docstring_parser (the default is False).
+        """
+
+        try:
+            module = ast.parse(source, filename=path)
+        except (SyntaxError, ValueError):
+            # the error is reported when the file is checked
+            return
+        self.update(summarize(module, path, docstring_style, strict_parser))
+
+    def resolve(self, dotted: str) -> Optional[str]:
+        """Find the class a dotted name refers to, following imports.
+
+        Parameters
+        ----------
+        dotted : str
+            A name such as "package.module.Class", or "package.Class" if the
+            package imports it.
+
+        Returns
+        -------
+        Optional[str]
+            The key of the class in `classes`, or None if it isn't in the
+            project.
+        """
+
+        for _ in range(MAX_HOPS):
+            if dotted in self.classes:
+                return dotted
+            parts = dotted.split(".")
+            for i in range(len(parts) - 1, 0, -1):
+                module = ".".join(parts[:i])
+                target = self.aliases.get(module, {}).get(parts[i])
+                if target is not None:
+                    start = i + 1
+                    dotted = ".".join([target] + parts[start:])
+                    break
+            else:
+                return None
+        return None
+
+    def inherited_params(
+        self, class_key: str, method: str
+    ) -> Optional[FrozenSet[str]]:
+        """Find the documented parameters a method inherits.
+
+        Parameters
+        ----------
+        class_key : str
+            The key of the class the method is in, such as
+            "package.module.Class".
+        method : str
+            The name of the method.
+
+        Returns
+        -------
+        Optional[FrozenSet[str]]
+            The parameters documented by the nearest method of that name in
+            the class's bases (depth first, like a simple method resolution
+            order), or None if none of them documents it.
+        """
+
+        key = (class_key, method)
+        if key not in self._inherited:
+            self._inherited[key] = self._find_inherited(class_key, method)
+        return self._inherited[key]
+
+    def _find_inherited(
+        self, class_key: str, method: str
+    ) -> Optional[FrozenSet[str]]:
+        # the bases, depth first and left to right:
+        seen: Set[str] = {class_key}
+        pending = [class_key]
+        while pending:
+            current = pending.pop()
+            summary = self.classes.get(current)
+            if summary is None:
+                # such as a class added since the index was built
+                continue
+            if current != class_key and method in summary.methods:
+                return summary.methods[method]
+            for base in reversed(summary.bases):
+                resolved = self.resolve(base)
+                if resolved is not None and resolved not in seen:
+                    seen.add(resolved)
+                    pending.append(resolved)
+        return None
+
+    def _ancestors(self, class_key: str) -> Set[str]:
+        found: Set[str] = set()
+        pending = [class_key]
+        while pending:
+            summary = self.classes.get(pending.pop())
+            if summary is None:
+                continue
+            for base in summary.bases:
+                resolved = self.resolve(base)
+                if resolved is not None and resolved not in found:
+                    found.add(resolved)
+                    pending.append(resolved)
+        return found
+
+    def dependency_key(self, path: str) -> str:
+        """Hash what a module's classes inherit from other modules.
+
+        Findings of the module can be reused as long as this, and the
+        module's own source, doesn't change.
+
+        Parameters
+        ----------
+        path : str
+            The module's file.
+
+        Returns
+        -------
+        str
+        """
+
+        name = self.modules.get(os.path.abspath(path), "")
+        if name not in self._keys:
+            ancestors: Set[str] = set()
+            for class_key in self.module_classes.get(name, []):
+                ancestors |= self._ancestors(class_key)
+            digest = hashlib.sha1()
+            for ancestor in sorted(ancestors):
+                methods = self.classes[ancestor].methods
+                digest.update(
+                    repr(
+                        (
+                            ancestor,
+                            self.classes[ancestor].bases,
+                            sorted(
+                                (method, sorted(params))
+                                for method, params in methods.items()
+                            ),
+                        )
+                    ).encode("utf-8", "surrogatepass")
+                )
+            self._keys[name] = digest.hexdigest()
+        return self._keys[name]
+
+    def inherit(
+        self,
+        path: str,
+        results: Iterable[
+            Tuple[ast.AST, Optional[List[str]], Optional[List[str]]]
+        ],
+        qualnames: Mapping[int, str],
+        ignore_ambiguous_signatures: bool = True,
+    ) -> Iterator[Tuple[ast.AST, Optional[List[str]], Optional[List[str]]]]:
+        """Check methods without docstrings against their inherited docs.
+
+        Parameters
+        ----------
+        path : str
+            The file the results are from.
+        results : Iterable[Tuple]
+            The results of `check` for the file.
+        qualnames : Mapping[int, str]
+            The qualified names of the checked nodes, by their `id`.
+        ignore_ambiguous_signatures : bool, optional
+            Whether to ignore extra documented arguments if the function has
+            an ambiguous (*args / **kwargs) signature (the default is True).
+
+        Yields
+        ------
+        ast.FunctionDef
+            A function or method.
+        List[str]
+            Parameters in the signature but not in the (inherited) docstring.
+        List[str]
+            Parameters in the (inherited) docstring but not in the signature.
+        """
+
+        module = self.modules.get(os.path.abspath(path))
+        for node, underdocumented, overdocumented in results:
+            qualname = qualnames.get(id(node), "")
+            if (
+                module is not None
+                and (underdocumented or overdocumented)
+                and isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+                and node.name != "__init__"
+                and "." in qualname
+                and ast.get_docstring(node) is None
+            ):
+                class_name = qualname.rsplit(".", 1)[0]
+                documented = self.inherited_params(
+                    module + "." + class_name, node.name
+                )
+                if documented is not None:
+                    signature, ambiguous = get_signature_params(node)
+                    underdocumented, overdocumented = compare_args(
+                        signature,
+                        documented,
+                        ignore_ambiguous_signatures and ambiguous,
+                    )
+            yield node, underdocumented, overdocumented
+
+
+def _summarize_paths(
+    paths: List[str],
+    docstring_style: Optional[str] = None,
+    strict_parser: bool = False,
+) -> List[ModuleSummary]:
+    summaries = []
+    for path in paths:
+        try:
+            module = ast.parse(read_source(path), filename=path)
+        except (OSError, SyntaxError, UnicodeDecodeError, ValueError):
+            # files that can't be read are reported when they are checked
+            continue
+        summaries.append(
+            summarize(module, path, docstring_style, strict_parser)
+        )
+    return summaries
+
+
+def build_index(
+    paths: Iterable[str],
+    jobs: int = 1,
+    docstring_style: Optional[str] = None,
+    strict_parser: bool = False,
+) -> SymbolIndex:
+    """Summarize a project's modules, and index their classes.
+
+    Parameters
+    ----------
+    paths : Iterable[str]
+        The project's python files.
+    jobs : int, optional
+        The number of worker processes to summarize modules in (the default
+        is 1, which summarizes them in this process).
+    docstring_style : str, optional
+        The style all docstrings are written in. If None (the default), it is
+        detected for each docstring.
+    strict_parser : bool, optional
+        Whether to fully parse docstrings with numpydoc or docstring_parser
+        (the default is False).
+
+    Returns
+    -------
+    SymbolIndex
+    """
+
+    summarize_paths = partial(
+        _summarize_paths,
+        docstring_style=docstring_style,
+        strict_parser=strict_parser,
+    )
+    if jobs <= 1:
+        return SymbolIndex(summarize_paths(list(paths)))
+    return SymbolIndex(
+        summary
+        for summaries in map_batches(summarize_paths, paths, jobs)
+        for summary in summaries
+    )
@@ -0,0 +1,275 @@
+"""Optional timing of the phases of a docargs run, and of files and functions.
+
+Timing is off by default. Until `enable` is called, `phase`, `file` and
+`function` return a shared do-nothing context manager, so instrumented code
+costs next to nothing.
+"""
+
+import ast
+import time
+from collections import defaultdict
+from typing import Any, DefaultDict, Dict, List, Optional, Tuple
+
+Totals = DefaultDict[Any, List[float]]
+
+
+def _totals() -> Totals:
+    # each value is [total seconds, number of calls]
+    return defaultdict(lambda: [0.0, 0])
+
+
+class _NullTimer:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    __slots__ = ("totals", "key", "start")
+
+    def __init__(self, totals: Totals, key: Any):
+        self.totals = totals
+        self.key = key
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        total = self.totals[self.key]
+        total[0] += time.perf_counter() - self.start
+        total[1] += 1
+        return False
+
+
+class Profiler:
+    """Accumulate wall time and call counts per phase, file and function."""
+
+    def __init__(self) -> None:
+        self.phases = _totals()
+        self.files = _totals()
+        self.functions = _totals()
+        self.counters: DefaultDict[str, int] = defaultdict(int)
+        self.current_file = "<unknown>"
+
+    def count(self, name: str, n: int = 1):
+        """Add to a counter, such as the hits of a cache.
+
+        Parameters
+        ----------
+        name : str
+            The name of the counter.
+        n : int, optional
+            How much to add (the default is 1).
+        """
+        self.counters[name] += n
+
+    def phase(self, name: str) -> _Timer:
+        """Time a phase, such as parsing.
+
+        Parameters
+        ----------
+        name : str
+            The name of the phase.
+
+        Returns
+        -------
+        ContextManager
+            Times its body.
+        """
+        return _Timer(self.phases, name)
+
+    def file(self, path: str) -> _Timer:
+        """Time the checking of a file.
+
+        Parameters
+        ----------
+        path : str
+            The file. Functions timed until the next file are attributed to
+            it.
+
+        Returns
+        -------
+        ContextManager
+            Times its body.
+        """
+        self.current_file = path
+        return _Timer(self.files, path)
+
+    def function(self, node: ast.AST) -> _Timer:
+        """Time the checking of a function.
+
+        Parameters
+        ----------
+        node : ast.AST
+            The function definition.
+
+        Returns
+        -------
+        ContextManager
+            Times its body.
+        """
+        key = (
+            self.current_file,
+            getattr(node, "lineno", 0),
+            getattr(node, "name", "?"),
+        )
+        return _Timer(self.functions, key)
+
+    def stats(self) -> Dict[str, Dict]:
+        """Get the accumulated times, in a picklable form.
+
+        Returns
+        -------
+        Dict[str, Dict]
+        """
+        return {
+            "phases": dict(self.phases),
+            "files": dict(self.files),
+            "functions": dict(self.functions),
+            "counters": dict(self.counters),
+        }
+
+    def merge(self, stats: Dict[str, Dict]):
+        """Add times accumulated elsewhere, such as in a worker process.
+
+        Parameters
+        ----------
+        stats : Dict[str, Dict]
+            The output of another profiler's `stats`.
+        """
+        for name, totals in (
+            ("phases", self.phases),
+            ("files", self.files),
+            ("functions", self.functions),
+        ):
+            for key, (seconds, calls) in stats[name].items():
+                totals[key][0] += seconds
+                totals[key][1] += calls
+        for name, n in stats["counters"].items():
+            self.counters[name] += n
+
+    def summary(self, n_slowest: int = 10) -> str:
+        """Format the accumulated times as tables.
+
+        Parameters
+        ----------
+        n_slowest : int, optional
+            How many of the slowest files and functions to list (the default
+            is 10).
+
+        Returns
+        -------
+        str
+        """
+
+        def slowest(totals: Totals) -> List[Tuple[Any, List[float]]]:
+            items = sorted(totals.items(), key=lambda item: -item[1][0])
+            return items[:n_slowest]
+
+        lines = ["{:<32} {:>10} {:>10}".format("phase", "seconds", "calls")]
+        for name, (seconds, calls) in slowest(self.phases):
+            lines.append(
+                "{:<32} {:>10.4f} {:>10}".format(name, seconds, calls)
+            )
+
+        if self.counters:
+            lines.append("")
+            for name, n in sorted(self.counters.items()):
+                lines.append("{:<32} {:>10}".format(name, n))
+
+        lines += ["", "slowest files:"]
+        for path, (seconds, _) in slowest(self.files):
+            lines.append("  {:>10.4f}  {}".format(seconds, path))
+
+        lines += ["", "slowest functions:"]
+        for (path, lineno, name), (seconds, _) in slowest(self.functions):
+            lines.append(
+                "  {:>10.4f}  {}:{}: {}".format(seconds, path, lineno, name)
+            )
+        return "\n".join(lines)
+
+
+_active: Optional[Profiler] = None
+
+
+def enable() -> Profiler:
+    """Start timing in this process.
+
+    Returns
+    -------
+    Profiler
+        The profiler that accumulates the times.
+    """
+    global _active
+    _active = Profiler()
+    return _active
+
+
+def disable():
+    """Stop timing in this process."""
+    global _active
+    _active = None
+
+
+def active() -> Optional[Profiler]:
+    """Get the profiler that is timing this process, if there is one.
+
+    Returns
+    -------
+    Optional[Profiler]
+    """
+    return _active
+
+
+def phase(name: str):
+    """Time a phase, if timing is enabled.
+
+    Parameters
+    ----------
+    name : str
+        The name of the phase.
+
+    Returns
+    -------
+    ContextManager
+        Times its body.
+    """
+    return _NULL_TIMER if _active is None else _active.phase(name)
+
+
+def file(path: str):
+    """Time the checking of a file, if timing is enabled.
+
+    Parameters
+    ----------
+    path : str
+        The file.
+
+    Returns
+    -------
+    ContextManager
+        Times its body.
+    """
+    return _NULL_TIMER if _active is None else _active.file(path)
+
+
+def function(node: ast.AST):
+    """Time the checking of a function, if timing is enabled.
+
+    Parameters
+    ----------
+    node : ast.AST
+        The function definition.
+
+    Returns
+    -------
+    ContextManager
+        Times its body.
+    """
+    return _NULL_TIMER if _active is None else _active.function(node)
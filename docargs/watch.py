@@ -0,0 +1,133 @@
+"""Re-check files whenever they are modified."""
+
+import os
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from .run import Finding, read_source
+
+CheckFunction = Callable[[str, str], List[Finding]]
+
+
+def _stat(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class Watcher:
+    """Keep the findings for a set of files up to date.
+
+    Files are polled for changes to their modification time or size, and
+    only the files that changed are checked again.
+
+    Parameters
+    ----------
+    paths : Iterable[str]
+        The files to watch.
+    check_source : Callable[[str, str], List[Finding]]
+        The function that checks a file, given its name and source code.
+    find_paths : Callable[[], Iterable[str]], optional
+        Called on every poll to find files to watch as well, such as the
+        files in a directory. Files it finds that it didn't find when the
+        watcher was created are added (the default is None).
+    """
+
+    def __init__(
+        self,
+        paths: Iterable[str],
+        check_source: CheckFunction,
+        find_paths: Optional[Callable[[], Iterable[str]]] = None,
+    ):
+        self.check_source = check_source
+        self.find_paths = find_paths
+        self.stats: Dict[str, Optional[Tuple[int, int]]] = {
+            path: None for path in paths
+        }
+        self.found: Set[str] = set()
+        if find_paths is not None:
+            self.found.update(find_paths())
+        self.findings: Dict[str, List[Finding]] = {}
+        # SyntaxError, or ValueError for undecodable files or null bytes:
+        self.errors: Dict[str, Exception] = {}
+
+    @property
+    def failed(self) -> bool:
+        """Whether any watched file currently has findings or errors.
+
+        Definitions that were not checked, for being over their time budget,
+        don't count.
+        """
+        return bool(self.errors) or any(
+            not finding.over_budget
+            for findings in self.findings.values()
+            for finding in findings
+        )
+
+    def poll(self) -> List[str]:
+        """Check the files that changed since the last poll.
+
+        Returns
+        -------
+        List[str]
+            The paths that were checked again.
+        """
+
+        if self.find_paths is not None:
+            for path in self.find_paths():
+                if path not in self.found:
+                    self.found.add(path)
+                    self.stats.setdefault(path, None)
+
+        changed = []
+        for path, previous in self.stats.items():
+            current = _stat(path)
+            if current == previous:
+                continue
+            self.stats[path] = current
+            changed.append(path)
+            self.findings.pop(path, None)
+            self.errors.pop(path, None)
+            if current is None:
+                # the file was deleted; check it again if it comes back
+                continue
+            try:
+                source = read_source(path)
+                self.findings[path] = self.check_source(path, source)
+            except OSError:
+                # it was deleted or renamed since it was polled, so check it
+                # again if it comes back
+                self.stats[path] = _stat(path)
+            except (SyntaxError, ValueError) as error:
+                self.errors[path] = error
+        return changed
+
+
+def watch(
+    watcher: Watcher,
+    report: Callable[[Watcher, List[str]], None],
+    interval: float = 0.5,
+):
+    """Poll a watcher until interrupted, reporting on every change.
+
+    Parameters
+    ----------
+    watcher : Watcher
+        The watcher to poll.
+    report : Callable[[Watcher, List[str]], None]
+        Called with the watcher and the changed paths after each poll that
+        found changes.
+    interval : float, optional
+        How many seconds to wait between polls (the default is 0.5).
+    """
+
+    try:
+        while True:
+            changed = watcher.poll()
+            if changed:
+                report(watcher, changed)
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,56 @@
+import pytest
+
+import docargs
+from docargs import Result, check_paths, check_sources
+from test_cli import UNDOCCED, write_files
+
+NESTED = '''
+class Outer:
+    """An outer class."""
+
+    class Inner:
+        """An inner class."""
+
+        def method(self, a):
+            """Do something."""
+'''
+
+
+def test_results_are_compact_records():
+    results = list(check_sources({"outer.py": NESTED, "module.py": UNDOCCED}))
+    assert results == [
+        Result("outer.py", "Outer.Inner.method", 8, 8, ("a",), ()),
+        Result("module.py", "add", 2, 0, ("b",), ("c",)),
+        Result("module.py", "subtract", 14, 0, ("a", "b"), ()),
+    ]
+    assert not hasattr(results[0], "__dict__")
+    assert "qualname='Outer.Inner.method'" in repr(results[0])
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_sources_are_checked_in_order(jobs):
+    sources = [("module_{}.py".format(i), UNDOCCED) for i in range(20)]
+    results = list(check_sources(iter(sources), jobs=jobs))
+    assert [result.path for result in results] == [
+        name for name, _ in sources for _ in range(2)
+    ]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_paths_and_directories_are_checked(tmp_path, jobs):
+    paths = write_files(tmp_path)
+    cache_dir = str(tmp_path / ".cache")
+    results = list(check_paths([str(tmp_path)], jobs, cache_dir=cache_dir))
+    assert {result.path for result in results} == set(paths[1::2])
+    # results read back from the cache are the same:
+    assert list(check_paths([str(tmp_path)], cache_dir=cache_dir)) == results
+
+
+def test_syntax_errors_are_raised():
+    with pytest.raises(SyntaxError):
+        list(check_sources({"broken.py": "def f(:\n"}))
+
+
+def test_unknown_attributes_raise():
+    with pytest.raises(AttributeError):
+        docargs.check_everything
@@ -0,0 +1,150 @@
+import json
+import multiprocessing
+import time
+
+import pytest
+from click.testing import CliRunner
+
+from docargs import budget, check_sources
+from docargs.cli import cli
+
+SLOW = '''
+def slow(a):
+    """Take forever to parse.
+
+    Parameters
+    ----------
+    a : int
+        SLOW
+    """
+
+
+def undocumented(b):
+    pass
+'''
+
+
+@pytest.fixture(autouse=True)
+def in_tmp_path(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    yield
+    budget.disable()
+
+
+@pytest.fixture
+def slow_docstrings(monkeypatch):
+    import docargs.check
+
+    extract_params = docargs.check.extract_params
+
+    def extract_slowly(docstring, style):
+        while "SLOW" in docstring:
+            pass
+        return extract_params(docstring, style)
+
+    monkeypatch.setattr(docargs.check, "extract_params", extract_slowly)
+
+
+def test_limits_interrupt_python_code():
+    budget.enable(docstring=0.05)
+    start = time.perf_counter()
+    with pytest.raises(budget.DocstringOverBudget):
+        with budget.limit(budget.DOCSTRING):
+            while True:
+                pass
+    assert time.perf_counter() - start < 5
+    # a limit without a budget does nothing
+    with budget.limit(budget.FILE):
+        pass
+
+
+def test_limits_that_end_in_time_are_not_interrupted():
+    budget.enable(docstring=0.01)
+    for _ in range(1000):
+        with budget.limit(budget.DOCSTRING):
+            pass
+    deadline = time.perf_counter() + 0.1
+    while time.perf_counter() < deadline:
+        pass
+
+
+@pytest.mark.parametrize(
+    "jobs",
+    [
+        "1",
+        pytest.param(
+            "2",
+            marks=pytest.mark.skipif(
+                multiprocessing.get_start_method() != "fork",
+                reason="workers don't inherit the slow parser",
+            ),
+        ),
+    ],
+)
+def test_slow_docstrings_are_skipped(tmp_path, slow_docstrings, jobs):
+    (tmp_path / "slow.py").write_text(SLOW)
+    (tmp_path / "fine.py").write_text("def fine():\n    pass\n")
+    result = CliRunner().invoke(
+        cli,
+        [
+            "--no-cache",
+            "--jobs",
+            jobs,
+            "--docstring-budget",
+            "0.1",
+            "--slow-report",
+            "slow.json",
+            "--format",
+            "jsonl",
+            ".",
+        ],
+    )
+    # the undocumented function still fails the run
+    assert result.exit_code == 1
+    lines = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [line.get("over_budget") for line in lines] == ["docstring", None]
+    assert json.loads((tmp_path / "slow.json").read_text()) == [
+        {
+            "file": "./slow.py",
+            "line": 2,
+            "col": 0,
+            "qualname": "slow",
+            "over_budget": "docstring",
+        }
+    ]
+
+
+def test_slow_files_are_skipped(tmp_path, slow_docstrings):
+    (tmp_path / "slow.py").write_text(SLOW)
+    result = CliRunner().invoke(
+        cli, ["--no-cache", "--file-budget", "0.1", "--format", "sarif", "."]
+    )
+    # what wasn't checked doesn't fail the run
+    assert result.exit_code == 0
+    [sarif_result] = json.loads(result.stdout)["runs"][0]["results"]
+    assert sarif_result["ruleId"] == "D003"
+    assert sarif_result["level"] == "warning"
+    assert sarif_result["properties"] == {"over_budget": "file"}
+
+
+def test_results_say_what_was_over_budget(slow_docstrings):
+    budget.enable(docstring=0.1)
+    results = list(check_sources({"slow.py": SLOW}))
+    assert [(result.qualname, result.over_budget) for result in results] == [
+        ("slow", "docstring"),
+        ("undocumented", ""),
+    ]
+
+
+def test_text_output_says_what_was_not_checked(tmp_path, slow_docstrings):
+    (tmp_path / "slow.py").write_text(SLOW.split("\n\n\n")[0])
+    result = CliRunner().invoke(
+        cli, ["--no-cache", "--docstring-budget", "0.1", "slow.py"]
+    )
+    assert result.exit_code == 0
+    assert result.output.splitlines() == [
+        "slow.py:2:0: ",
+        "Not checked: its docstring took longer than the time budget",
+        "1 docstrings or files were not checked, as they took longer than "
+        "their time budget.",
+    ]
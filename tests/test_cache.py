@@ -0,0 +1,76 @@
+import os
+
+from docargs import run
+from docargs.cache import ResultCache
+from docargs.run import Finding, check_source_cached
+
+SOURCE = '''
+def add(a, b):
+    """Add two numbers.
+
+    Parameters
+    ----------
+    a : int
+        The first number.
+    """
+'''
+
+
+def test_hit_skips_checking(tmp_path, monkeypatch):
+    cache = ResultCache(str(tmp_path / "cache"))
+    first = check_source_cached("a.py", SOURCE, cache)
+    assert first == [Finding("a.py", 2, 0, ("b",), (), "add")]
+
+    def fail(*args, **kwargs):
+        raise AssertionError("the source should not be checked again")
+
+    monkeypatch.setattr(run, "check_source", fail)
+    assert check_source_cached("b.py", SOURCE, cache) == [
+        Finding("b.py", 2, 0, ("b",), (), "add")
+    ]
+    assert (tmp_path / "cache" / ".gitignore").exists()
+
+
+def test_options_are_part_of_the_key(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    assert cache.key(SOURCE, {"option": True}) != cache.key(
+        SOURCE, {"option": False}
+    )
+    assert cache.key(SOURCE, {}) != cache.key(SOURCE + "\n", {})
+
+
+def test_prune_removes_least_recently_used(tmp_path):
+    cache = ResultCache(str(tmp_path), max_size=100)
+    keys = [cache.key(str(i), {}) for i in range(5)]
+    for age, key in enumerate(keys):
+        cache.put(key, [[1, 0, ["a" * 20], []]])
+        os.utime(cache._path(key), (1000 + age, 1000 + age))
+    # reading an entry makes it the most recently used one:
+    assert cache.get(keys[0]) is not None
+
+    cache.prune()
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[-1]) is not None
+
+
+def test_prune_only_removes_entries(tmp_path):
+    cache = ResultCache(str(tmp_path), max_size=0)
+    cache.put(cache.key(SOURCE, {}), [])
+    others = [tmp_path / "src" / "mod.py", tmp_path / "ab" / "notes.txt"]
+    for path in others:
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(SOURCE)
+
+    cache.prune()
+    assert cache.get(cache.key(SOURCE, {})) is None
+    assert all(path.exists() for path in others)
+
+
+def test_corrupt_entry_is_a_miss(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    key = cache.key(SOURCE, {})
+    cache.put(key, [])
+    with open(cache._path(key), "w") as f:
+        f.write("{not json")
+    assert cache.get(key) is None
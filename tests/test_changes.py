@@ -0,0 +1,127 @@
+import ast
+import subprocess
+
+import pytest
+from click.testing import CliRunner
+
+from docargs.changes import parse_diff, select_changed
+from docargs.cli import cli
+
+DIFF = """diff --git a/pkg/a.py b/pkg/a.py
+index 1111111..2222222 100644
+--- a/pkg/a.py
++++ b/pkg/a.py
+@@ -3 +3 @@ def f(a):
+-    \\"\\"\\"Old.\\"\\"\\"
++    \\"\\"\\"New.\\"\\"\\"
+@@ -10,0 +11,2 @@ def g(b):
++    pass
++    pass
+@@ -20,3 +21,0 @@ class C:
+diff --git a/pkg/b.py b/pkg/b.py
+deleted file mode 100644
+--- a/pkg/b.py
++++ /dev/null
+@@ -1,2 +0,0 @@
+"""
+
+SOURCE = '''
+def f(a):
+    """No parameters."""
+
+
+def g(b):
+    """No parameters."""
+
+
+class C:
+    """A class.
+
+    Parameters
+    ----------
+    c : int
+        A parameter.
+    """
+
+    def __init__(self, c):
+        pass
+
+    def h(self, d):
+        """No parameters."""
+
+    def i(self, e):
+        """No parameters."""
+'''
+
+
+def checked_names(line_ranges):
+    module = select_changed(
+        ast.parse(SOURCE), line_ranges, SOURCE.count("\n") + 1
+    )
+    names = []
+    for node in module.body:
+        names.append(node.name)
+        if isinstance(node, ast.ClassDef):
+            names.extend(
+                child.name
+                for child in node.body
+                if isinstance(child, ast.FunctionDef)
+            )
+    return names
+
+
+def test_parse_diff():
+    assert parse_diff(DIFF) == {"pkg/a.py": [(3, 3), (11, 12), (21, 21)]}
+
+
+def test_select_changed_functions():
+    assert checked_names([(3, 3)]) == ["f"]
+    assert checked_names([(1, 1)]) == []
+    assert checked_names([(3, 6)]) == ["f", "g"]
+
+
+def test_select_changed_methods():
+    assert checked_names([(23, 23)]) == ["C", "h"]
+
+
+def test_select_changed_class_docstring():
+    assert checked_names([(14, 14)]) == ["C", "__init__", "h", "i"]
+
+
+@pytest.mark.parametrize(
+    "prefix_config", [None, "diff.noprefix", "diff.mnemonicPrefix"]
+)
+def test_cli_changed_since(tmp_path, monkeypatch, prefix_config):
+    monkeypatch.chdir(tmp_path)
+
+    def git(*args):
+        subprocess.run(
+            ("git", "-c", "user.name=a", "-c", "user.email=a@b.c") + args,
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+
+    git("init", "-q")
+    if prefix_config is not None:
+        git("config", prefix_config, "true")
+    (tmp_path / "module.py").write_text(SOURCE)
+    (tmp_path / "other.py").write_text(SOURCE)
+    git("add", ".")
+    git("commit", "-q", "-m", "initial")
+    (tmp_path / "module.py").write_text(
+        SOURCE.replace("def g(b):", "def g(b, x):")
+    )
+
+    result = CliRunner().invoke(
+        cli, ["--no-cache", "--changed-since", "HEAD", "module.py", "other.py"]
+    )
+    assert result.exit_code == 1
+    assert result.output.splitlines()[0] == "module.py:6:0: "
+    assert "module.py:2:0" not in result.output
+    assert "other.py" not in result.output
+
+    result = CliRunner().invoke(
+        cli, ["--no-cache", "--changed-since", "no-such-ref", "module.py"]
+    )
+    assert result.exit_code == 1
+    assert "no-such-ref" in result.output
@@ -0,0 +1,127 @@
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from docargs.cli import cli
+
+DOCCED = '''
+def add(a, b):
+    """Add two numbers.
+
+    Parameters
+    ----------
+    a : int
+        The first number.
+    b : int
+        The second number.
+    """
+'''
+
+UNDOCCED = '''
+def add(a, b):
+    """Add two numbers.
+
+    Parameters
+    ----------
+    a : int
+        The first number.
+    c : int
+        Not a parameter.
+    """
+
+
+def subtract(a, b):
+    """Subtract two numbers."""
+'''
+
+
+@pytest.fixture(autouse=True)
+def in_tmp_path(tmp_path, monkeypatch):
+    # keep the result cache out of the working directory
+    monkeypatch.chdir(tmp_path)
+
+
+def write_files(directory, n_files=6):
+    paths = []
+    for i in range(n_files):
+        path = directory / "module_{}.py".format(i)
+        path.write_text(UNDOCCED if i % 2 else DOCCED)
+        paths.append(str(path))
+    return paths
+
+
+def test_documented_file_passes(tmp_path):
+    path = tmp_path / "module.py"
+    path.write_text(DOCCED)
+    result = CliRunner().invoke(cli, [str(path)])
+    assert result.exit_code == 0
+    assert "All arguments are documented" in result.output
+
+
+def test_undocumented_file_fails(tmp_path):
+    path = tmp_path / "module.py"
+    path.write_text(UNDOCCED)
+    result = CliRunner().invoke(cli, [str(path)])
+    assert result.exit_code == 1
+    assert "{}:2:0:".format(path) in result.output
+    assert "not documented: b" in result.output
+    assert "function signature: c" in result.output
+    assert "{}:14:0:".format(path) in result.output
+
+
+def test_parallel_output_matches_serial(tmp_path):
+    paths = write_files(tmp_path)
+    serial = CliRunner().invoke(cli, paths)
+    parallel = CliRunner().invoke(cli, ["--jobs", "2"] + paths[::-1])
+    auto = CliRunner().invoke(cli, ["-j", "auto"] + paths)
+    assert serial.exit_code == parallel.exit_code == auto.exit_code == 1
+    assert serial.output == parallel.output == auto.output
+
+
+def test_invalid_jobs(tmp_path):
+    result = CliRunner().invoke(cli, ["--jobs", "0"])
+    assert result.exit_code == 2
+
+
+def test_jsonl_format(tmp_path):
+    paths = write_files(tmp_path, 2)
+    result = CliRunner().invoke(cli, ["--format", "jsonl"] + paths)
+    assert result.exit_code == 1
+    lines = [json.loads(line) for line in result.output.splitlines()]
+    assert lines == [
+        {
+            "file": paths[1],
+            "line": 2,
+            "col": 0,
+            "underdocumented": ["b"],
+            "overdocumented": ["c"],
+        },
+        {
+            "file": paths[1],
+            "line": 14,
+            "col": 0,
+            "underdocumented": ["a", "b"],
+            "overdocumented": [],
+        },
+    ]
+
+
+def test_sarif_format(tmp_path):
+    paths = write_files(tmp_path, 2)
+    result = CliRunner().invoke(cli, ["--format", "sarif"] + paths)
+    assert result.exit_code == 1
+    document = json.loads(result.output)
+    assert document["version"] == "2.1.0"
+    results = document["runs"][0]["results"]
+    assert [r["ruleId"] for r in results] == ["D001", "D002", "D001"]
+    region = results[0]["locations"][0]["physicalLocation"]["region"]
+    assert region == {"startLine": 2, "startColumn": 1}
+    assert results[0]["properties"] == {
+        "underdocumented": ["b"],
+        "overdocumented": ["c"],
+    }
+
+    result = CliRunner().invoke(cli, ["--format", "sarif", paths[0]])
+    assert result.exit_code == 0
+    assert json.loads(result.output)["runs"][0]["results"] == []
@@ -0,0 +1,101 @@
+import os
+
+from click.testing import CliRunner
+
+from docargs.cli import cli
+from docargs.discover import find_files
+
+FILES = (
+    "package/__init__.py",
+    "package/module.py",
+    "package/data.txt",
+    "package/sub/module.py",
+    "package/build/generated.py",
+    "package/__pycache__/module.py",
+    "package/keep.log.py",
+    "package/.gitignore",
+    ".gitignore",
+)
+
+
+def make_tree(root):
+    for name in FILES:
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("")
+    (root / ".git").mkdir()
+    (root / ".gitignore").write_text("build/\n*.log.py\n")
+    (root / "package" / ".gitignore").write_text("!keep.log.py\n")
+
+
+def relative(paths, root):
+    return [os.path.relpath(path, str(root)) for path in paths]
+
+
+def test_find_files(tmp_path):
+    make_tree(tmp_path)
+    found = find_files([str(tmp_path / "package")])
+    assert relative(found, tmp_path) == [
+        "package/__init__.py",
+        "package/keep.log.py",
+        "package/module.py",
+        "package/sub/module.py",
+    ]
+
+
+def test_find_files_without_gitignore(tmp_path):
+    make_tree(tmp_path)
+    found = find_files([str(tmp_path / "package")], use_gitignore=False)
+    assert "package/build/generated.py" in relative(found, tmp_path)
+
+
+def test_find_files_with_exclude(tmp_path):
+    make_tree(tmp_path)
+    found = find_files(
+        [str(tmp_path / "package"), str(tmp_path / "package" / "module.py")],
+        exclude=("sub", "module.py"),
+    )
+    assert relative(found, tmp_path) == [
+        "package/__init__.py",
+        "package/keep.log.py",
+    ]
+
+
+def test_find_files_does_not_follow_directory_symlinks(tmp_path):
+    make_tree(tmp_path)
+    (tmp_path / "package" / "sub" / "loop").symlink_to(tmp_path / "package")
+    (tmp_path / "package" / "link.py").symlink_to(
+        tmp_path / "package" / "module.py"
+    )
+    found = find_files([str(tmp_path / "package")])
+    assert relative(found, tmp_path) == [
+        "package/__init__.py",
+        "package/keep.log.py",
+        "package/link.py",
+        "package/module.py",
+        "package/sub/module.py",
+    ]
+
+
+def test_find_files_is_lazy(tmp_path):
+    make_tree(tmp_path)
+    found = find_files([str(tmp_path / "package"), "does-not-exist"])
+    assert relative([next(found)], tmp_path) == ["package/__init__.py"]
+
+
+def test_cli_with_directory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    make_tree(tmp_path)
+    (tmp_path / "package" / "sub" / "module.py").write_text(
+        "def f(a):\n    pass\n"
+    )
+    result = CliRunner().invoke(cli, ["--no-cache", "package"])
+    assert result.exit_code == 1
+    assert result.output.splitlines()[0] == "{}:1:0: ".format(
+        os.path.join("package", "sub", "module.py")
+    )
+
+    result = CliRunner().invoke(
+        cli, ["--no-cache", "--exclude", "sub", "package"]
+    )
+    assert result.exit_code == 0
@@ -0,0 +1,98 @@
+import ast
+
+import pytest
+
+from docargs.check import docstring_params, get_doc_params
+from docargs.styles import detect_style
+
+NUMPY_DOCSTRING = """Summary.
+
+Parameters
+----------
+a : int
+    The first parameter.
+"""
+
+GOOGLE_DOCSTRING = """Summary.
+
+Args:
+    a (int): The first parameter.
+    b: The second parameter.
+"""
+
+REST_DOCSTRING = """Summary.
+
+:param a: The first parameter.
+:param int b: The second parameter.
+"""
+
+EPYDOC_DOCSTRING = """Summary.
+
+@param a: The first parameter.
+"""
+
+PLAIN_DOCSTRING = """Summary.
+
+Just some more text, with no sections.
+"""
+
+
+def function_with_docstring(docstring):
+    return ast.parse(
+        "def f(a, b):\n    '''{}'''\n".format(docstring.replace("\n", "\n    "))
+    ).body[0]
+
+
+@pytest.mark.parametrize(
+    "docstring,style",
+    [
+        (NUMPY_DOCSTRING, "numpy"),
+        (GOOGLE_DOCSTRING, "google"),
+        (REST_DOCSTRING, "rest"),
+        (EPYDOC_DOCSTRING, "epydoc"),
+        (PLAIN_DOCSTRING, None),
+    ],
+)
+def test_detect_style(docstring, style):
+    assert detect_style(docstring) == style
+
+
+@pytest.mark.parametrize(
+    "docstring,params",
+    [
+        (NUMPY_DOCSTRING, {"a"}),
+        (GOOGLE_DOCSTRING, {"a", "b"}),
+        (REST_DOCSTRING, {"a", "b"}),
+        (EPYDOC_DOCSTRING, {"a"}),
+        (PLAIN_DOCSTRING, set()),
+    ],
+)
+def test_get_doc_params_in_each_style(docstring, params):
+    assert get_doc_params(function_with_docstring(docstring)) == params
+
+
+def test_pinned_style_skips_detection():
+    node = function_with_docstring(GOOGLE_DOCSTRING)
+    assert get_doc_params(node, "google") == {"a", "b"}
+    assert get_doc_params(node, "rest") == set()
+
+
+def test_identical_docstrings_are_parsed_once():
+    method = (
+        ast.parse(
+            'class A:\n    def f(self, a):\n        """{}"""\n'.format(
+                NUMPY_DOCSTRING.replace("\n", "\n        ")
+            )
+        )
+        .body[0]
+        .body[0]
+    )
+    function = function_with_docstring(NUMPY_DOCSTRING)
+    docstring_params.cache_clear()
+
+    assert get_doc_params(function) == get_doc_params(method) == {"a"}
+    assert get_doc_params(function, "numpy") == {"a"}
+    info = docstring_params.cache_info()
+    # the indentation of the method's docstring doesn't matter, but a
+    # different style is a different entry:
+    assert (info.hits, info.misses) == (1, 2)
@@ -0,0 +1,110 @@
+import ast
+import os
+
+import pytest
+
+from docargs import check_paths
+from docargs.exports import ALL, module_exports, package_reexports
+
+
+@pytest.mark.parametrize(
+    "source, names",
+    [
+        ("__all__ = ['a', 'b']", {"a", "b"}),
+        ("__all__: list = ('a',)\n__all__ += ['b']", {"a", "b"}),
+        ("__all__ = ['a'] + ['b']\n__all__.extend(('c',))", {"a", "b", "c"}),
+        ("__all__ = []\n__all__.append('a')", {"a"}),
+        ("def f():\n    pass", None),
+        ("__all__ = names()", None),
+        ("__all__ = ['a']\n__all__ += other.__all__", None),
+    ],
+)
+def test_all_is_resolved_from_literals(source, names):
+    assert module_exports(ast.parse(source)) == names
+
+
+def test_package_reexports_follow_its_all():
+    init = ast.parse(
+        "from ._impl import run, helper as _helper, Runner\n"
+        "from package.tools import *\n"
+        "from other import thing\n"
+        "__all__ = ['run', 'Runner']\n"
+    )
+    assert package_reexports(init, "package") == {
+        "_impl": {"run", "Runner"},
+        "tools": {ALL},
+    }
+
+
+UNDOCUMENTED = "def {}(a):\n    pass\n\n\n"
+
+
+def checked(path, **options):
+    return sorted(
+        (os.path.relpath(result.path, str(path)), result.qualname)
+        for result in check_paths([str(path)], **options)
+    )
+
+
+@pytest.mark.parametrize("prescan", [False, True])
+def test_only_exported_definitions_are_checked(tmp_path, prescan):
+    package = tmp_path / "package"
+    package.mkdir()
+    (package / "__init__.py").write_text(
+        "from ._impl import run\nfrom .tools import *\n__all__ = ['run']\n"
+    )
+    (package / "_impl.py").write_text(
+        UNDOCUMENTED.format("run") + UNDOCUMENTED.format("helper")
+    )
+    (package / "tools.py").write_text(
+        "__all__ = [\n    'a',\n]\n__all__ += ['b']\n\n\n"
+        + "".join(UNDOCUMENTED.format(name) for name in "abc")
+    )
+    (package / "plain.py").write_text(UNDOCUMENTED.format("d"))
+
+    assert checked(package, exported_only=True, prescan=prescan) == [
+        ("_impl.py", "run"),
+        ("plain.py", "d"),
+        ("tools.py", "a"),
+        ("tools.py", "b"),
+    ]
+    assert checked(package, prescan=prescan) == [
+        ("_impl.py", "helper"),
+        ("_impl.py", "run"),
+        ("plain.py", "d"),
+        ("tools.py", "a"),
+        ("tools.py", "b"),
+        ("tools.py", "c"),
+    ]
+
+
+@pytest.mark.parametrize("prescan", [False, True])
+def test_private_names_in_all_are_checked(tmp_path, prescan):
+    (tmp_path / "module.py").write_text(
+        "__all__ = ['_f']\n\n\n"
+        + UNDOCUMENTED.format("_f")
+        + UNDOCUMENTED.format("_g")
+    )
+    package = tmp_path / "package"
+    package.mkdir()
+    (package / "__init__.py").write_text(
+        "from ._impl import _run\n__all__ = ['_run']\n"
+    )
+    (package / "_impl.py").write_text(UNDOCUMENTED.format("_run"))
+    assert checked(tmp_path, exported_only=True, prescan=prescan) == [
+        ("module.py", "_f"),
+        (os.path.join("package", "_impl.py"), "_run"),
+    ]
+
+
+def test_private_and_public_modules_are_cached_apart(tmp_path):
+    cache_dir = str(tmp_path / ".cache")
+    package = tmp_path / "package"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "_impl.py").write_text(UNDOCUMENTED.format("run"))
+    assert checked(package, exported_only=True, cache_dir=cache_dir) == []
+    (package / "_impl.py").rename(package / "impl.py")
+    assert checked(package, exported_only=True, cache_dir=cache_dir) == [
+        ("impl.py", "run")
+    ]
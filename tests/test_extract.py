@@ -0,0 +1,81 @@
+import pytest
+
+from docargs.check import parse_doc_params
+from docargs.extract import extract_params
+
+NUMPY_DOCSTRING = """Summary.
+
+Parameters
+----------
+a : int
+    The first parameter, with a description
+    over: several lines.
+b
+    A parameter without a type.
+*args : tuple
+    More parameters.
+
+Returns
+-------
+c : int
+    Not a parameter.
+"""
+
+GOOGLE_DOCSTRING = """Summary.
+
+Args:
+    a (int): The first parameter, with a description
+        over: several lines.
+    b: The second parameter.
+
+    *args: More parameters.
+
+Returns:
+    c: Not a parameter.
+"""
+
+REST_DOCSTRING = """Summary.
+
+:param a: The first parameter.
+:type a: int
+:param int b: The second parameter.
+:keyword c: A keyword parameter.
+:returns: d
+"""
+
+EPYDOC_DOCSTRING = """Summary.
+
+@param a: The first parameter.
+@type a: int
+@keyword b: The second parameter.
+@return: c
+"""
+
+
+@pytest.mark.parametrize(
+    "docstring,style",
+    [
+        (NUMPY_DOCSTRING, "numpy"),
+        (GOOGLE_DOCSTRING, "google"),
+        (REST_DOCSTRING, "rest"),
+        (EPYDOC_DOCSTRING, "epydoc"),
+    ],
+)
+def test_extract_params_matches_parsers(docstring, style):
+    assert set(extract_params(docstring, style)) == parse_doc_params(
+        docstring, style
+    )
+
+
+def test_numpy_parameters_sharing_a_type():
+    docstring = "Summary.\n\nParameters\n----------\na, b : int\n    Both.\n"
+    assert set(extract_params(docstring, "numpy")) == {"a", "b"}
+
+
+def test_google_attributes_are_not_parameters():
+    docstring = "Summary.\n\nAttributes:\n    a: An attribute.\n"
+    assert set(extract_params(docstring, "google")) == set()
+
+
+def test_no_style_has_no_parameters():
+    assert set(extract_params(NUMPY_DOCSTRING, None)) == set()
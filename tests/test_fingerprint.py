@@ -0,0 +1,92 @@
+import ast
+from concurrent.futures import ThreadPoolExecutor
+
+from docargs.fingerprint import DefinitionCache, fingerprint
+from docargs.run import check_source
+
+SOURCE = '''
+def add(a, b):
+    """Add two numbers.
+
+    Parameters
+    ----------
+    a : int
+        The first number.
+    """
+    return a + b
+
+
+class Calculator:
+    """A calculator.
+
+    Parameters
+    ----------
+    precision : int
+        The number of digits.
+    """
+
+    def __init__(self, precision, mode):
+        self.precision = precision
+
+    def multiply(self, a, b):
+        """Multiply two numbers."""
+        return a * b
+'''
+
+
+def first_definition(source):
+    return ast.parse(source).body[0]
+
+
+def test_fingerprint_ignores_bodies_but_not_signatures_or_docstrings():
+    function = 'def f(a):\n    """Do {}."""\n    return a\n'
+    original = fingerprint(first_definition(function.format("it")))
+
+    moved = "\n\n" + function.format("it").replace("return a", "pass")
+    assert fingerprint(first_definition(moved)) == original
+    assert (
+        fingerprint(
+            first_definition(function.format("it").replace("(a)", "(b)"))
+        )
+        != original
+    )
+    assert fingerprint(first_definition(function.format("that"))) != original
+
+
+def test_unchanged_definitions_are_reused_after_edits():
+    definitions = DefinitionCache()
+    findings = check_source("module.py", SOURCE, definitions=definitions)
+    assert definitions.misses == 2
+
+    edited = "import os\n" + SOURCE.replace("return a * b", "return b * a")
+    edited_findings = check_source(
+        "module.py", edited, definitions=definitions
+    )
+
+    assert definitions.hits == 2
+    assert edited_findings == check_source("module.py", edited)
+    # the findings follow their definitions to their new lines:
+    assert [finding.lineno for finding in edited_findings] == [
+        finding.lineno + 1 for finding in findings
+    ]
+
+
+def test_definition_cache_is_bounded():
+    definitions = DefinitionCache(max_size=1)
+    check_source("module.py", SOURCE, definitions=definitions)
+    assert len(definitions.entries) == 1
+
+
+def test_definition_cache_is_shared_between_threads():
+    definitions = DefinitionCache(max_size=8)
+
+    def use(thread):
+        for i in range(2000):
+            key = (str((thread + i) % 16), "")
+            if definitions.get(key) is None:
+                definitions.put(key, [])
+
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(use, range(8)))
+    assert len(definitions.entries) == 8
+    assert definitions.hits + definitions.misses == 16000
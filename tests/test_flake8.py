@@ -0,0 +1,46 @@
+import ast
+import subprocess
+import sys
+
+from docargs.flake8 import DocargsChecker
+
+SOURCE = '''
+def add(a, b):
+    """Add two numbers.
+
+    Parameters
+    ----------
+    a : int
+        The first number.
+    """
+'''
+
+
+def test_stdin_uses_the_tree_from_flake8(monkeypatch):
+    def fail():
+        raise AssertionError("stdin was read again")
+
+    monkeypatch.setattr("flake8.utils.stdin_get_value", fail)
+    errors = list(DocargsChecker(ast.parse(SOURCE), "stdin").run())
+    assert [error[:3] for error in errors] == [
+        (2, 0, "D001 These parameters are not documented: b.")
+    ]
+
+
+def test_flake8_checks_stdin_and_files_in_parallel(tmp_path):
+    for i in range(4):
+        (tmp_path / "module_{}.py".format(i)).write_text(SOURCE)
+
+    def flake8(*args, stdin=None):
+        return subprocess.run(
+            [sys.executable, "-m", "flake8", "--select", "D"] + list(args),
+            input=stdin,
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+            cwd=str(tmp_path),
+        ).stdout.splitlines()
+
+    assert flake8("-", stdin=SOURCE) == [
+        "stdin:2:1: D001 These parameters are not documented: b."
+    ]
+    assert len(flake8("--jobs", "2", ".")) == 4
@@ -0,0 +1,34 @@
+import subprocess
+import sys
+
+import pytest
+
+SLOW_IMPORTS = ("numpydoc", "docstring_parser", "colorama")
+
+
+@pytest.mark.parametrize("module", ["docargs.flake8", "docargs.cli"])
+def test_slow_dependencies_are_imported_lazily(module):
+    code = (
+        "import sys, {}\n"
+        "print(' '.join(m for m in {!r} if m in sys.modules))"
+    ).format(module, SLOW_IMPORTS)
+    output = subprocess.check_output(
+        [sys.executable, "-c", code], universal_newlines=True
+    )
+    assert output.strip() == ""
+
+
+def test_other_commands_are_imported_lazily():
+    code = (
+        "import sys, docargs.cli\n"
+        "print(' '.join(m for m in {!r} if m in sys.modules))"
+    ).format(
+        tuple(
+            "docargs." + name
+            for name in ("lsp", "server", "shard", "symbols", "watch")
+        )
+    )
+    output = subprocess.check_output(
+        [sys.executable, "-c", code], universal_newlines=True
+    )
+    assert output.strip() == ""
@@ -0,0 +1,183 @@
+import io
+import subprocess
+import sys
+import time
+
+import docargs.fingerprint
+from docargs.lsp import LanguageServer, read_message, write_message
+
+URI = "file:///module.py"
+
+SOURCE = '''def add(a, b):
+    """Add two numbers.
+
+    Parameters
+    ----------
+    a : int
+        The first number.
+    """
+
+
+def subtract(a, b):
+    """Subtract two numbers.
+
+    Parameters
+    ----------
+    a : int
+        The first number.
+    b : int
+        The second number.
+    """
+'''
+
+
+def encode(*messages):
+    stream = io.BytesIO()
+    for message in messages:
+        write_message(stream, dict(message, jsonrpc="2.0"))
+    return stream.getvalue()
+
+
+def decode(data):
+    stream = io.BytesIO(data)
+    messages = []
+    while True:
+        message = read_message(stream)
+        if message is None:
+            return messages
+        messages.append(message)
+
+
+def diagnostics(messages):
+    return [
+        [
+            (d["range"]["start"]["line"], d["code"], d["message"])
+            for d in message["params"]["diagnostics"]
+        ]
+        for message in messages
+        if message.get("method") == "textDocument/publishDiagnostics"
+    ]
+
+
+def did_change(version, start, end, text):
+    return {
+        "method": "textDocument/didChange",
+        "params": {
+            "textDocument": {"uri": URI, "version": version},
+            "contentChanges": [
+                {
+                    "range": {
+                        "start": {"line": start[0], "character": start[1]},
+                        "end": {"line": end[0], "character": end[1]},
+                    },
+                    "text": text,
+                }
+            ],
+        },
+    }
+
+
+def test_edits_recheck_only_changed_definitions(monkeypatch):
+    checked = []
+    check = docargs.fingerprint.check
+
+    def counting_check(node, *options):
+        checked.append(node.name)
+        return check(node, *options)
+
+    monkeypatch.setattr(docargs.fingerprint, "check", counting_check)
+    output = io.BytesIO()
+    server = LanguageServer(output, debounce=0)
+    exit_code = server.serve(
+        io.BytesIO(
+            encode(
+                {"id": 1, "method": "initialize", "params": {}},
+                {
+                    "method": "textDocument/didOpen",
+                    "params": {
+                        "textDocument": {
+                            "uri": URI,
+                            "languageId": "python",
+                            "version": 1,
+                            "text": SOURCE,
+                        }
+                    },
+                },
+                # document b in add's docstring:
+                did_change(2, (6, 25), (6, 25), "\n    b : int"),
+                # rename subtract's parameter b to c, on what is now line 11:
+                did_change(3, (11, 16), (11, 17), "c"),
+                # edit subtract's body, which doesn't change its findings:
+                did_change(4, (21, 0), (21, 0), "    return a\n"),
+                {"id": 2, "method": "shutdown"},
+                {"method": "exit"},
+            )
+        )
+    )
+
+    messages = decode(output.getvalue())
+    assert exit_code == 0
+    assert messages[0]["result"]["capabilities"]["textDocumentSync"]
+    assert diagnostics(messages) == [
+        [(0, "D001", "These parameters are not documented: b")],
+        [],
+        [
+            (11, "D001", "These parameters are not documented: c"),
+            (
+                11,
+                "D002",
+                "These parameters are documented but not in the function "
+                "signature: b",
+            ),
+        ],
+        [
+            (11, "D001", "These parameters are not documented: c"),
+            (
+                11,
+                "D002",
+                "These parameters are documented but not in the function "
+                "signature: b",
+            ),
+        ],
+    ]
+    assert checked == ["add", "subtract", "add", "subtract"]
+
+
+def test_lsp_command_speaks_over_stdio():
+    result = subprocess.run(
+        [sys.executable, "-m", "docargs", "lsp"],
+        input=encode(
+            {"id": 1, "method": "initialize", "params": {}},
+            {"id": 2, "method": "unknown"},
+            {"id": 3, "method": "shutdown"},
+            {"method": "exit"},
+        ),
+        stdout=subprocess.PIPE,
+        timeout=30,
+    )
+    messages = decode(result.stdout)
+    assert result.returncode == 0
+    assert [message["id"] for message in messages] == [1, 2, 3]
+    assert "error" in messages[1]
+    assert messages[0]["result"]["serverInfo"]["name"] == "docargs"
+
+
+def test_diagnostics_are_debounced():
+    output = io.BytesIO()
+    server = LanguageServer(output, debounce=0.05)
+    server.handle(
+        {
+            "method": "textDocument/didOpen",
+            "params": {
+                "textDocument": {"uri": URI, "version": 1, "text": SOURCE}
+            },
+        }
+    )
+    for version in range(2, 5):
+        server.handle(did_change(version, (0, 0), (0, 0), "\n"))
+    time.sleep(0.5)
+
+    messages = decode(output.getvalue())
+    assert len(messages) == 1
+    assert messages[0]["params"]["version"] == 4
+    assert diagnostics(messages)[0][0][0] == 3
@@ -0,0 +1,43 @@
+import tracemalloc
+
+from docargs.discover import find_files
+from docargs.run import check_files
+
+FUNCTION = '''
+def function_{i}(a, b):
+    """Do something.
+
+    Parameters
+    ----------
+    a : int
+        A parameter.
+    b : int
+        Another parameter.
+    """
+    return a + b
+'''
+
+
+def write_tree(root, n_files, files_per_directory=10):
+    source = "".join(FUNCTION.format(i=i) for i in range(50))
+    for i in range(n_files):
+        directory = root / "package_{}".format(i // files_per_directory)
+        directory.mkdir(exist_ok=True)
+        (directory / "module_{}.py".format(i)).write_text(source)
+
+
+def test_peak_memory_does_not_grow_with_number_of_files(tmp_path):
+    write_tree(tmp_path, 200)
+
+    tracemalloc.start()
+    try:
+        for i, findings in enumerate(check_files(find_files([str(tmp_path)]))):
+            assert findings == []
+            if i == 40:
+                early_peak = tracemalloc.get_traced_memory()[1]
+        final_peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    assert i == 199
+    assert final_peak < 1.05 * early_peak
@@ -0,0 +1,21 @@
+import pytest
+
+from docargs.run import check_files
+
+from test_cli import write_files
+
+
+@pytest.mark.parametrize("prefetch", [1, 3, 20])
+def test_prefetching_keeps_results_in_order(tmp_path, prefetch):
+    paths = write_files(tmp_path, n_files=10)
+    expected = list(check_files(paths, prefetch=0))
+    assert list(check_files(paths, prefetch=prefetch)) == expected
+
+
+def test_read_errors_surface_at_their_file(tmp_path):
+    paths = write_files(tmp_path, n_files=4)
+    paths.insert(2, str(tmp_path / "missing.py"))
+    results = check_files(paths, prefetch=3)
+    assert len([next(results), next(results)]) == 2
+    with pytest.raises(FileNotFoundError):
+        next(results)
@@ -0,0 +1,97 @@
+import ast
+import glob
+import os
+
+import pytest
+
+from docargs.prescan import parse_definitions, reduce_source
+from docargs.run import check_source, read_source
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SOURCE = '''"""A module."""
+
+import os
+
+TABLE = {
+    "a": 1,
+    "b": 2,
+}
+
+
+@decorator(
+    "argument"
+)
+def add(a, b):
+    """Add two numbers.
+
+    Parameters
+    ----------
+    a : int
+        The first number.
+    """
+    return a + b
+
+
+def _helper(c):
+    return c
+# a comment between definitions
+class Calculator:
+    def multiply(self, a, b):
+        """Multiply two numbers."""
+        return a * b
+
+if __name__ == "__main__":
+    add(1, 2)
+'''
+
+
+def test_only_public_definitions_are_kept_at_their_lines():
+    reduced = reduce_source(SOURCE)
+    assert reduced is not None
+    tree = ast.parse(reduced)
+    assert [(node.name, node.lineno) for node in tree.body] == [
+        ("add", 14),
+        ("Calculator", 28),
+    ]
+    assert "TABLE" not in reduced and "_helper" not in reduced
+
+
+def test_files_without_public_definitions_are_not_parsed():
+    source = "TABLE = [\n" + "    1,\n" * 1000 + "]\n\ndef _f(:\n"
+    assert not parse_definitions(source).body
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        # a definition-like line in a string:
+        'TEXT = """\ndef f(a):\n    """\n',
+        "TEXT = '''\nclass Example:\n'''\n",
+        # a form feed before a definition:
+        "\fdef f(a):\n    pass\n",
+    ],
+)
+def test_ambiguous_scans_fall_back_to_a_full_parse(source):
+    assert reduce_source(source) is None
+    assert ast.dump(parse_definitions(source)) == ast.dump(ast.parse(source))
+
+
+def test_unparseable_reduced_source_falls_back_to_a_full_parse():
+    # the list continues on the first column, which cuts `f` short
+    source = "def f(a):\n    return [\n1]\n"
+    assert ast.dump(parse_definitions(source)) == ast.dump(ast.parse(source))
+
+
+def test_findings_match_a_full_parse():
+    paths = glob.glob(os.path.join(ROOT, "docargs", "*.py")) + glob.glob(
+        os.path.join(ROOT, "tests", "*.py")
+    )
+    for path in paths:
+        source = read_source(path)
+        assert check_source(path, source, prescan=True) == check_source(
+            path, source
+        )
+    assert check_source("module.py", SOURCE, prescan=True) == check_source(
+        "module.py", SOURCE
+    )
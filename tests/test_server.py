@@ -0,0 +1,66 @@
+import threading
+
+import pytest
+from click.testing import CliRunner
+
+from docargs.cli import cli
+from docargs.server import make_server, request_checks
+
+from test_cli import write_files
+
+
+@pytest.fixture
+def socket_path(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    path = str(tmp_path / "docargs.sock")
+    server = make_server(path)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    yield path
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+@pytest.mark.parametrize("output_format", ["text", "jsonl", "sarif"])
+def test_client_output_matches_check(tmp_path, socket_path, output_format):
+    write_files(tmp_path)
+    arguments = ["--format", output_format, "--no-cache", "."]
+
+    local = CliRunner().invoke(cli, arguments)
+    client = CliRunner().invoke(
+        cli, ["client", "--socket", socket_path] + arguments
+    )
+
+    assert local.exit_code == client.exit_code == 1
+    assert client.output == local.output
+
+
+def test_server_checks_unsaved_sources(socket_path):
+    source = "def f(a):\n    '''Do something.'''\n"
+    (findings,) = request_checks(
+        socket_path, [{"path": "unsaved.py", "source": source}], {}
+    )
+    assert [finding[:4] for finding in findings] == [
+        ("unsaved.py", 1, 0, ("a",))
+    ]
+
+    with pytest.raises(SyntaxError):
+        list(
+            request_checks(
+                socket_path, [{"path": "bad.py", "source": "def ("}], {}
+            )
+        )
+
+
+def test_client_fails_without_server(tmp_path):
+    result = CliRunner().invoke(
+        cli, ["client", "--socket", str(tmp_path / "missing.sock")]
+    )
+    assert result.exit_code == 1
+    assert "docargs serve" in result.output
+
+
+def test_second_server_is_refused(socket_path):
+    with pytest.raises(RuntimeError):
+        make_server(socket_path)
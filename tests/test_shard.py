@@ -0,0 +1,114 @@
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from docargs.cli import cli
+from docargs.shard import merge_shard_results, read_timings, select_shard
+
+from test_cli import write_files
+
+
+@pytest.fixture(autouse=True)
+def in_tmp_path(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+
+def test_shards_split_all_files_by_time():
+    paths = ["a.py", "b.py", "c.py", "d.py", "e.py"]
+    timings = {"a.py": 4.0, "b.py": 1.0, "c.py": 1.0, "d.py": 1.0}
+    shards = [select_shard(paths, i, 2, timings) for i in (1, 2)]
+    assert shards == [[0], [1, 2, 3, 4]]
+    assert select_shard(paths, 1, 2, {}) == [0, 2, 4]
+
+
+@pytest.mark.parametrize("output_format", ["text", "jsonl", "sarif"])
+def test_merged_shards_match_one_run(tmp_path, output_format):
+    directory = tmp_path / "package"
+    directory.mkdir()
+    write_files(directory, n_files=7)
+    options = ["--no-cache", "--format", output_format, "package"]
+    whole = CliRunner().invoke(cli, options)
+
+    for i in (1, 2, 3):
+        CliRunner().invoke(
+            cli,
+            [
+                "--shard",
+                "{}/3".format(i),
+                "--shard-output",
+                "{}.json".format(i),
+            ]
+            + options,
+        )
+    merged = CliRunner().invoke(
+        cli, ["merge", "--format", output_format, "3.json", "1.json", "2.json"]
+    )
+    assert merged.exit_code == whole.exit_code == 1
+    assert merged.output == whole.output
+    assert sorted(read_timings(".docargs_timings.json")) == [
+        "package/module_{}.py".format(i) for i in range(7)
+    ]
+
+    positions = [
+        file[0]
+        for i in (1, 2, 3)
+        for file in json.loads((tmp_path / "{}.json".format(i)).read_text())[
+            "files"
+        ]
+    ]
+    assert sorted(positions) == list(range(7))
+
+
+def test_merge_refuses_incomplete_shards():
+    CliRunner().invoke(
+        cli, ["--shard", "1/2", "--shard-output", "1.json", "."]
+    )
+    with pytest.raises(ValueError, match="Missing shards: 2/2"):
+        merge_shard_results(["1.json"])
+    result = CliRunner().invoke(cli, ["merge", "1.json"])
+    assert result.exit_code == 1
+    assert "Missing shards: 2/2" in result.output
+
+
+@pytest.mark.parametrize("shard", ["0/2", "3/2", "1", "a/b"])
+def test_invalid_shard(shard):
+    result = CliRunner().invoke(cli, ["--shard", shard, "."])
+    assert result.exit_code == 2
+
+
+def test_merge_refuses_shards_split_by_other_timings(tmp_path):
+    write_files(tmp_path, n_files=4)
+    (tmp_path / "a.json").write_text('{"module_0.py": 5.0}')
+    for i, timings in ((1, "a.json"), (2, "b.json")):
+        CliRunner().invoke(
+            cli,
+            ["--shard", "{}/2".format(i), "--timings", timings]
+            + ["--shard-output", "{}.json".format(i), "."],
+        )
+    with pytest.raises(ValueError, match="split differently"):
+        merge_shard_results(["1.json", "2.json"])
+
+
+@pytest.mark.parametrize(
+    "positions, message",
+    [([[0, 1], [1]], "more than one shard"), ([[0], [2]], "not checked")],
+)
+def test_merge_refuses_repeated_or_missing_files(tmp_path, positions, message):
+    write_files(tmp_path, n_files=3)
+    for i in (1, 2):
+        CliRunner().invoke(
+            cli,
+            ["--shard", "{}/2".format(i)]
+            + ["--shard-output", "{}.json".format(i), "."],
+        )
+    for i, shard_positions in enumerate(positions, 1):
+        path = tmp_path / "{}.json".format(i)
+        results = json.loads(path.read_text())
+        results["files"] = [
+            [position, "module_{}.py".format(position), 0.0, []]
+            for position in shard_positions
+        ]
+        path.write_text(json.dumps(results))
+    with pytest.raises(ValueError, match=message):
+        merge_shard_results(["1.json", "2.json"])
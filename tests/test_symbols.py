@@ -0,0 +1,152 @@
+import ast
+import os
+import sys
+
+import pytest
+
+from docargs import check_paths
+from docargs.cache import ResultCache
+from docargs.run import check_source_cached
+from docargs.symbols import build_index, module_name, summarize
+
+BASE = '''
+class Base:
+    """A base."""
+
+    def run(self, a, b):
+        """Run.
+
+        Parameters
+        ----------
+        a : int
+            A.
+        b : int
+            B.
+        """
+'''
+
+CHILD = """
+from {} import Base
+
+
+class Child(Base):
+    \"\"\"A child.\"\"\"
+
+    def run(self, a, b):
+        pass
+
+    def stop(self, c):
+        pass
+"""
+
+
+def write_package(root, import_from):
+    package = root / "package"
+    (package / "sub").mkdir(parents=True)
+    (package / "__init__.py").write_text("from .base import Base\n")
+    (package / "sub" / "__init__.py").write_text("")
+    (package / "base.py").write_text(BASE)
+    (package / "sub" / "child.py").write_text(CHILD.format(import_from))
+    return package
+
+
+def checked(path, **options):
+    return sorted(
+        (os.path.basename(result.path), result.qualname)
+        for result in check_paths([str(path)], **options)
+    )
+
+
+@pytest.mark.parametrize(
+    "import_from", ["package.base", "package", "..base", ".."]
+)
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_undocumented_overrides_inherit_docs(tmp_path, import_from, jobs):
+    package = write_package(tmp_path, import_from)
+    assert checked(package, jobs=jobs) == [
+        ("child.py", "Child.run"),
+        ("child.py", "Child.stop"),
+    ]
+    assert checked(package, jobs=jobs, inherit_docstrings=True) == [
+        ("child.py", "Child.stop")
+    ]
+
+
+def test_inherited_docs_are_compared_with_the_signature(tmp_path):
+    package = write_package(tmp_path, "package.base")
+    child = package / "sub" / "child.py"
+    child.write_text(
+        child.read_text().replace("run(self, a, b)", "run(self, a, c)")
+    )
+    [result] = [
+        result
+        for result in check_paths([str(package)], inherit_docstrings=True)
+        if result.qualname == "Child.run"
+    ]
+    assert (result.under, result.over) == (("c",), ("b",))
+
+
+def test_summaries_resolve_imports_and_nested_classes(tmp_path):
+    package = write_package(tmp_path, "..base")
+    path = str(package / "sub" / "child.py")
+    summary = summarize(
+        ast.parse(CHILD.format("..base") + "\n    class Inner(Child): ..."),
+        path,
+    )
+    assert module_name(path) == "package.sub.child"
+    assert summary.aliases["Base"] == "package.base.Base"
+    assert summary.classes["Child"].bases == ("package.base.Base",)
+    assert summary.classes["Child.Inner"].bases == ("package.sub.child.Child",)
+    assert summary.classes["Child"].methods == {}
+
+
+def test_cached_results_depend_on_inherited_docs(tmp_path):
+    package = write_package(tmp_path, "package")
+    child = str(package / "sub" / "child.py")
+    cache = ResultCache(str(tmp_path / "cache"))
+
+    def check():
+        symbols = build_index(
+            [str(package / "base.py"), str(package / "__init__.py"), child]
+        )
+        with open(child) as f:
+            source = f.read()
+        return [
+            finding.qualname
+            for finding in check_source_cached(
+                child, source, cache, symbols=symbols
+            )
+        ]
+
+    assert check() == ["Child.stop"]
+    (package / "base.py").write_text(BASE.replace("b : int", "c : int"))
+    assert check() == ["Child.run", "Child.stop"]
+
+
+def test_workers_get_the_index_without_pool_initializers(
+    tmp_path, monkeypatch
+):
+    # python 3.6's process pools can't run initializers
+    monkeypatch.setattr(sys, "version_info", (3, 6, 15))
+    package = write_package(tmp_path, "package")
+    assert checked(package, jobs=2, inherit_docstrings=True) == [
+        ("child.py", "Child.stop")
+    ]
+
+
+def test_classes_added_after_indexing(tmp_path):
+    package = write_package(tmp_path, "package")
+    child = str(package / "sub" / "child.py")
+    symbols = build_index([str(package / "base.py"), child])
+    source = CHILD.format("package.base").replace("Child", "New")
+
+    def check():
+        return [
+            finding.qualname
+            for finding in check_source_cached(child, source, symbols=symbols)
+        ]
+
+    # classes the index doesn't know inherit nothing
+    assert check() == ["New.run", "New.stop"]
+    symbols.refresh(child, source)
+    assert check() == ["New.stop"]
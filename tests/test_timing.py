@@ -0,0 +1,86 @@
+import ast
+import pstats
+
+from click.testing import CliRunner
+
+from docargs import timing
+from docargs.check import docstring_params
+from docargs.cli import cli
+from docargs.run import check_files, check_source
+
+SOURCE = '''
+def add(a, b):
+    """Add two numbers.
+
+    Parameters
+    ----------
+    a : int
+        The first number.
+    """
+'''
+
+
+def test_timing_is_a_no_op_when_disabled():
+    assert timing.active() is None
+    with timing.phase("parse"), timing.file("module.py"):
+        pass
+    assert timing.phase("parse") is timing.function(ast.parse("x"))
+
+
+def test_profiler_times_phases_files_and_functions():
+    docstring_params.cache_clear()
+    profiler = timing.enable()
+    try:
+        with timing.file("module.py"):
+            check_source("module.py", SOURCE)
+    finally:
+        timing.disable()
+
+    assert profiler.phases["parse"][1] == 1
+    assert profiler.phases["compare_args"][1] == 1
+    assert list(profiler.files) == ["module.py"]
+    assert list(profiler.functions) == [("module.py", 2, "add")]
+    assert profiler.counters == {}
+    summary = profiler.summary()
+    assert "scan docstring" in summary
+    assert "module.py:2: add" in summary
+
+
+def test_worker_times_are_merged(tmp_path):
+    paths = []
+    for i in range(3):
+        path = tmp_path / "module_{}.py".format(i)
+        path.write_text(SOURCE)
+        paths.append(str(path))
+
+    profiler = timing.enable()
+    try:
+        list(check_files(paths, jobs=2))
+    finally:
+        timing.disable()
+
+    assert profiler.phases["read"][1] == 3
+    assert sorted(profiler.files) == paths
+    counters = profiler.counters
+    assert counters["docstring cache hits"] + counters[
+        "docstring cache misses"
+    ] == len(paths)
+
+
+def test_cli_prints_profile_and_saves_stats(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "module.py"
+    path.write_text(SOURCE)
+    stats_file = tmp_path / "docargs.prof"
+
+    result = CliRunner().invoke(
+        cli,
+        ["--no-cache", "--profile", "--profile-output", str(stats_file)]
+        + [str(path)],
+    )
+
+    assert result.exit_code == 1
+    assert "slowest functions:" in result.stderr
+    assert "slowest functions:" not in result.stdout
+    assert timing.active() is None
+    pstats.Stats(str(stats_file))
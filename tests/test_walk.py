@@ -0,0 +1,94 @@
+import ast
+
+import pytest
+
+from docargs.check import check
+from docargs.fingerprint import DefinitionCache
+from docargs.run import check_source
+
+SOURCE = '''
+async def fetch(url, timeout):
+    """Fetch a page.
+
+    Parameters
+    ----------
+    url : str
+        The page.
+    """
+
+
+class Client:
+    """A client.
+
+    Parameters
+    ----------
+    base : str
+        The base URL.
+    """
+
+    def __init__(self, base, retries):
+        self.base = base
+
+    async def get(self, path):
+        """Get a page."""
+
+    def _private(self, anything):
+        pass
+
+    class Session:
+        """A session."""
+
+        def close(self, force):
+            """Close the session."""
+
+            def inner(undocumented):
+                pass
+
+
+def _private(anything):
+    pass
+'''
+
+
+def checked(source, max_depth=None):
+    return [
+        (node.name, sorted(under))
+        for node, under, _ in check(
+            ast.parse(source), True, None, False, max_depth
+        )
+    ]
+
+
+def test_async_functions_and_nested_classes_are_checked_in_order():
+    assert checked(SOURCE) == [
+        ("fetch", ["timeout"]),
+        ("__init__", ["retries"]),
+        ("get", ["path"]),
+        ("close", ["force"]),
+    ]
+
+
+@pytest.mark.parametrize(
+    "max_depth, names",
+    [(0, ["fetch", "__init__"]), (1, ["fetch", "__init__", "get"])],
+)
+def test_depth_limits_how_far_classes_are_looked_into(max_depth, names):
+    assert [name for name, _ in checked(SOURCE, max_depth)] == names
+
+
+def test_deeply_nested_classes_dont_recurse():
+    depth = 90
+    source = "".join(
+        "{}class Level{}:\n".format("    " * i, i) for i in range(depth)
+    ) + "{}def method(self, a):\n{}    pass\n".format(
+        "    " * depth, "    " * depth
+    )
+    assert checked(source) == [("method", ["a"])]
+
+
+def test_definition_cache_respects_depth():
+    definitions = DefinitionCache()
+    for max_depth in (None, 0, None):
+        assert check_source(
+            "module.py", SOURCE, definitions=definitions, max_depth=max_depth
+        ) == check_source("module.py", SOURCE, max_depth=max_depth)
@@ -0,0 +1,127 @@
+import os
+from functools import partial
+
+import pytest
+from click.testing import CliRunner
+
+import docargs.watch
+from docargs.cli import cli, report_changes
+from docargs.discover import find_files
+from docargs.run import Finding, check_source
+from docargs.watch import Watcher
+
+DOCCED = '''
+def f(a):
+    """Do something.
+
+    Parameters
+    ----------
+    a : int
+        A parameter.
+    """
+'''
+
+
+def touch(path, source, mtime):
+    path.write_text(source)
+    os.utime(str(path), (mtime, mtime))
+
+
+def test_only_changed_files_are_checked_again(tmp_path):
+    first, second = tmp_path / "first.py", tmp_path / "second.py"
+    touch(first, DOCCED, 1000)
+    touch(second, DOCCED, 1000)
+
+    checked = []
+
+    def check(path, source):
+        checked.append(path)
+        return check_source(path, source)
+
+    watcher = Watcher([str(first), str(second)], check)
+    assert watcher.poll() == [str(first), str(second)]
+    assert not watcher.failed
+    assert watcher.poll() == []
+
+    touch(second, DOCCED.replace("f(a)", "f(a, b)"), 2000)
+    assert watcher.poll() == [str(second)]
+    assert checked == [str(first), str(second), str(second)]
+    assert watcher.failed
+    assert [finding.under for finding in watcher.findings[str(second)]] == [
+        ("b",)
+    ]
+
+
+def test_syntax_errors_and_deleted_files(tmp_path):
+    path = tmp_path / "module.py"
+    touch(path, "def f(:\n", 1000)
+    watcher = Watcher([str(path)], check_source)
+    watcher.poll()
+    assert watcher.failed
+    assert watcher.errors[str(path)].lineno == 1
+
+    path.unlink()
+    assert watcher.poll() == [str(path)]
+    assert not watcher.failed
+
+
+@pytest.mark.parametrize("source", [b"x = '\xff'\n", b"x = 1\0\n"])
+def test_undecodable_files_and_null_bytes_are_errors(tmp_path, source, capsys):
+    path = tmp_path / "module.py"
+    path.write_bytes(source)
+    watcher = Watcher([str(path)], check_source)
+    report_changes(watcher, watcher.poll())
+    assert watcher.failed
+    assert "could not parse" in capsys.readouterr().out
+
+
+def test_watch_only_reports_text():
+    result = CliRunner().invoke(cli, ["--watch", "--format", "jsonl", "."])
+    assert result.exit_code == 2
+    assert "can't be used with --watch" in result.output
+
+
+def test_over_budget_findings_dont_fail(tmp_path):
+    path = tmp_path / "module.py"
+    touch(path, DOCCED, 1000)
+
+    def check(path, source):
+        return [Finding(path, 2, 0, (), (), "f", "docstring")]
+
+    watcher = Watcher([str(path)], check)
+    watcher.poll()
+    assert watcher.findings[str(path)]
+    assert not watcher.failed
+
+
+def test_files_that_vanish_while_read_are_dropped(tmp_path, monkeypatch):
+    path = tmp_path / "module.py"
+    touch(path, DOCCED, 1000)
+
+    def read_vanished(path):
+        os.unlink(path)
+        raise FileNotFoundError(path)
+
+    monkeypatch.setattr(docargs.watch, "read_source", read_vanished)
+    watcher = Watcher([str(path)], check_source)
+    assert watcher.poll() == [str(path)]
+    assert not watcher.failed
+
+    monkeypatch.undo()
+    touch(path, DOCCED.replace("f(a)", "f(a, b)"), 2000)
+    assert watcher.poll() == [str(path)]
+    assert watcher.failed
+
+
+def test_files_added_to_directories_are_watched(tmp_path):
+    first = tmp_path / "first.py"
+    touch(first, DOCCED, 1000)
+    watcher = Watcher(
+        [str(first)], check_source, partial(find_files, [str(tmp_path)])
+    )
+    assert watcher.poll() == [str(first)]
+
+    second = tmp_path / "second.py"
+    touch(second, DOCCED.replace("f(a)", "f(a, b)"), 1000)
+    assert watcher.poll() == [str(second)]
+    assert watcher.failed